@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# AsyncLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, List, Deque
+from collections import deque
+import asyncio
+
+from LListCursor import LListCursor
+
+
+# ----------------------------------------------------------------------
+
+
+class AsyncLListCursor:
+    """AsyncLListCursor wraps an LListCursor for use from asyncio tasks
+
+    the removeItemAt* methods and drain are coroutines that wait, without
+    polling, until there is an item to remove; if maxlen is set the insert
+    methods are coroutines that wait while the list holds maxlen items
+
+    it watches the wrapped list as an observer, so changes made directly to
+    the list (through self.list) also wake waiting tasks; it is meant to be
+    used from one event loop, like asyncio.Queue
+    """
+
+    def __init__(self, llist: Optional[LListCursor] = None, maxlen: Optional[int] = None):
+        """
+        :param llist: node-backed LListCursor to wrap; a new empty one if None
+        :param maxlen: most items the list may hold before inserts wait; no limit if None
+        """
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError('maxlen must be positive')
+        self.list: LListCursor = LListCursor() if llist is None else llist
+        self.maxlen = maxlen
+        # futures of tasks waiting for an item / for room
+        self._removers: Deque[asyncio.Future] = deque()
+        self._inserters: Deque[asyncio.Future] = deque()
+        self.list.addObserver(self)
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the list
+        """
+        return len(self.list)
+
+    def empty(self) -> bool:
+        """
+        :return: True if the list has no items
+        """
+        return len(self.list) == 0
+
+    def full(self) -> bool:
+        """
+        :return: True if maxlen is set and the list holds maxlen items or more
+        """
+        return self.maxlen is not None and len(self.list) >= self.maxlen
+
+    def close(self) -> None:
+        """
+        stops watching the wrapped list
+        :return: None
+        """
+        self.list.removeObserver(self)
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _wakeNext(waiters: Deque[asyncio.Future]) -> None:
+        """
+        wakes the longest waiting task that is still waiting
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _waitUntil(self, waiters: Deque[asyncio.Future], ready) -> None:
+        """
+        waits in waiters until ready() is True; if the wait is cancelled and ready() has
+        become True, the wake-up is passed to the next waiting task
+        """
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready():
+                    self._wakeNext(waiters)
+                raise
+
+    def nodesInserted(self, first, last, count: int) -> None:
+        # observer call from the wrapped list: one waiting remover per new item
+        for i in range(min(count, len(self._removers))):
+            self._wakeNext(self._removers)
+
+    def nodesRemoving(self, first, count: int) -> None:
+        # observer call from the wrapped list: one waiting inserter per freed slot
+        for i in range(min(count, len(self._inserters))):
+            self._wakeNext(self._inserters)
+
+    def _notFull(self) -> bool:
+        return not self.full()
+
+    def _notEmpty(self) -> bool:
+        return len(self.list) > 0
+
+    # ------------------------------------------------------------------
+
+    async def insertAtHead(self, item: Any) -> None:
+        """
+        inserts item at the beginning of the list, first waiting for room if maxlen is set
+        :param item: value to insert
+        :return: None
+        """
+        await self._waitUntil(self._inserters, self._notFull)
+        self.list.insertAtHead(item)
+
+    async def insertAfterCursor(self, item: Any) -> None:
+        """
+        inserts item after the _cursor position, first waiting for room if maxlen is set
+        :param item: value to insert
+        :return: None
+        """
+        await self._waitUntil(self._inserters, self._notFull)
+        self.list.insertAfterCursor(item)
+
+    async def insertAtTail(self, item: Any) -> None:
+        """
+        inserts item at the end of the list, first waiting for room if maxlen is set
+        :param item: value to insert
+        :return: None
+        """
+        await self._waitUntil(self._inserters, self._notFull)
+        self.list.insertAtTail(item)
+
+    async def removeItemAtHead(self) -> Any:
+        """
+        waits until the list is not empty and removes its first item
+        :return: the item that was removed
+        """
+        await self._waitUntil(self._removers, self._notEmpty)
+        return self.list.removeItemAtHead()
+
+    async def removeItemAtCursor(self) -> Any:
+        """
+        waits until the list is not empty and removes the item at the _cursor
+        :return: the item that was removed
+        """
+        await self._waitUntil(self._removers, self._notEmpty)
+        return self.list.removeItemAtCursor()
+
+    async def removeItemAtTail(self) -> Any:
+        """
+        waits until the list is not empty and removes its last item
+        :return: the item that was removed
+        """
+        await self._waitUntil(self._removers, self._notEmpty)
+        return self.list.removeItemAtTail()
+
+    async def drain(self, count: int) -> List[Any]:
+        """
+        waits until the list is not empty and then removes up to count items from the head
+        in one step, without waiting for more
+        :param count: most items to remove; must be at least 1
+        :return: the removed items in order
+        """
+        if count < 1:
+            raise ValueError(f'drain called with count {count}, must be at least 1')
+        await self._waitUntil(self._removers, self._notEmpty)
+        items = self.list.removeManyAtHead(min(count, len(self.list)))
+        if len(self.list) > 0:
+            # items are left, so let another waiting consumer have them
+            self._wakeNext(self._removers)
+        return items
+
+# ----------------------------------------------------------------------
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# ConcurrentLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any
+import threading
+
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class ReadWriteLock:
+    """lock with a shared read side and a shared write side: any number of
+    readers, or any number of writers, may hold it but never both at once;
+    writers share because the list's head and tail locks already keep them
+    apart; waiting writers stop new readers getting in so they cannot starve"""
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers = 0
+        self._writersWaiting = 0
+
+    def acquireRead(self) -> None:
+        with self._condition:
+            while self._writers or self._writersWaiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def releaseRead(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquireWrite(self) -> None:
+        with self._condition:
+            self._writersWaiting += 1
+            while self._readers:
+                self._condition.wait()
+            self._writersWaiting -= 1
+            self._writers += 1
+
+    def releaseWrite(self) -> None:
+        with self._condition:
+            self._writers -= 1
+            if self._writers == 0:
+                self._condition.notify_all()
+
+
+# ----------------------------------------------------------------------
+
+
+class ConcurrentLListCursor:
+    """ConcurrentLListCursor is an LListCursor that can be shared between
+    threads; it follows the LListCursor class invariant for each call
+
+    it uses two-lock queue locking: the chain starts with a dummy node, so
+    insertAtTail only needs self._tailLock and removeItemAtHead and
+    itemAtHead only need self._headLock, and producers and consumers at the
+    two ends run in parallel; every other call takes both locks, head first
+
+    in the default mode iteration copies the items under both locks and then
+    yields them; with readerWriter=True iteration walks the nodes holding the
+    read side of a ReadWriteLock, so several iterations run at once, and
+    every change takes the write side, so changes wait for iterations; a
+    thread must not change the list while it is iterating over it in this
+    mode, since the change would wait for its own iteration
+
+    storage invariant:
+
+        1. self._dummy is the node before the first item; its item is None
+        and self._dummy.link is None when the list is empty
+
+        2. self._tail is the last node, which is self._dummy when the list
+        is empty
+
+        3. self._cursor is None when the _cursor is on the first item (or the
+        list is empty), so removing the head and inserting into an empty list
+        only touch the head side; it is changed only while holding
+        self._headLock
+
+        4. the number of items is self._inserted - self._removed; _inserted
+        only changes under self._tailLock and _removed under self._headLock
+    """
+
+    # ------------------------------------------------------------------
+
+    def __init__(self, *args, readerWriter: bool = False):
+        """
+        initializes empty list or list with items in args if it is not None; the _cursor
+        will be the first node
+        :param args: sequence of items to insert into the list
+        :param readerWriter: if True, iterations share a read lock instead of copying the items
+        """
+        self._headLock = threading.Lock()
+        self._tailLock = threading.Lock()
+        self._rwLock: Optional[ReadWriteLock] = ReadWriteLock() if readerWriter else None
+        self._dummy = ListNode(None)
+        self._tail = self._dummy
+        self._cursor: Optional[ListNode] = None
+        self._inserted = 0
+        self._removed = 0
+        # same argument handling as LListCursor
+        if len(args) == 1:
+            try:
+                items = iter(args[0])
+            except TypeError:
+                self.insertAtTail(args[0])
+            else:
+                for x in items:
+                    self.insertAtTail(x)
+        else:
+            for x in args:
+                self.insertAtTail(x)
+
+    def _lockBoth(self) -> None:
+        if self._rwLock is not None:
+            self._rwLock.acquireWrite()
+        self._headLock.acquire()
+        self._tailLock.acquire()
+
+    def _unlockBoth(self) -> None:
+        self._tailLock.release()
+        self._headLock.release()
+        if self._rwLock is not None:
+            self._rwLock.releaseWrite()
+
+    def _cursorNode(self) -> Optional[ListNode]:
+        """
+        :return: node at the _cursor, None if the list is empty; caller holds self._headLock
+        """
+        return self._dummy.link if self._cursor is None else self._cursor
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the list
+        """
+        self._lockBoth()
+        try:
+            return self._inserted - self._removed
+        finally:
+            self._unlockBoth()
+
+    def __iter__(self):
+        """
+        iterates over items in list yielding one item at a time; see the class docstring
+        for what the two locking modes do
+        """
+        if self._rwLock is None:
+            self._lockBoth()
+            try:
+                items = []
+                node = self._dummy.link
+                while node is not None:
+                    items.append(node.item)
+                    node = node.link
+            finally:
+                self._unlockBoth()
+            yield from items
+            return
+
+        self._rwLock.acquireRead()
+        try:
+            node = self._dummy.link
+            while node is not None:
+                yield node.item
+                node = node.link
+        finally:
+            self._rwLock.releaseRead()
+
+    def __add__(self, other) -> ConcurrentLListCursor:
+        """
+        returns a new ConcurrentLListCursor that is the concatenation of self and other
+        :param other: another list to concatenate with self
+        :return: a new ConcurrentLListCursor in the same locking mode as self; the _cursor
+        of it is at the beginning of the list
+        """
+        newList = ConcurrentLListCursor(readerWriter=self._rwLock is not None)
+        for x in list(self) + list(other):
+            newList.insertAtTail(x)
+        return newList
+
+    # ------------------------------------------------------------------
+
+    def insertAtHead(self, item: Any) -> None:
+        """
+        inserts item at the beginning of the list
+        :param item: value to insert
+        :return: None
+        """
+        self._lockBoth()
+        try:
+            first = self._dummy.link
+            if first is None:
+                # the one item is the first item, so the _cursor (None) is on it
+                self._tail = self._dummy.link = ListNode(item, None, self._dummy)
+            else:
+                # pin the _cursor so it does not follow the head to the new node
+                if self._cursor is None:
+                    self._cursor = first
+                node = ListNode(item, first, self._dummy)
+                first.prev = node
+                self._dummy.link = node
+            self._inserted += 1
+        finally:
+            self._unlockBoth()
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        insert item after the _cursor position
+        :param item: value to insert
+        :return: None
+        """
+        self._lockBoth()
+        try:
+            cursor = self._cursorNode()
+            if cursor is None or cursor is self._tail:
+                node = ListNode(item, None, self._tail)
+                self._tail.link = node
+                self._tail = node
+            else:
+                node = ListNode(item, cursor.link, cursor)
+                cursor.link.prev = node
+                cursor.link = node
+            self._inserted += 1
+        finally:
+            self._unlockBoth()
+
+    def insertAtTail(self, item: Any) -> None:
+        """
+        insert item at the end of the list; only takes the tail lock
+        :param item: value to insert
+        :return: None
+        """
+        if self._rwLock is not None:
+            self._rwLock.acquireWrite()
+        try:
+            with self._tailLock:
+                # the node is complete before the link publishes it to the head side
+                node = ListNode(item, None, self._tail)
+                self._tail.link = node
+                self._tail = node
+                self._inserted += 1
+        finally:
+            if self._rwLock is not None:
+                self._rwLock.releaseWrite()
+
+    def _removeFirst(self) -> Any:
+        """
+        removes the first item by making its node the new dummy; caller holds self._headLock
+        and has checked the list is not empty
+        :return: the item that was removed
+        """
+        first = self._dummy.link
+        item = first.item
+        first.item = None
+        # drop the link to the old dummy so the discarded dummies can be freed
+        first.prev = None
+        if self._cursor is first:
+            # the node after it is now first, which a None _cursor means
+            self._cursor = None
+        self._dummy = first
+        self._removed += 1
+        return item
+
+    def removeItemAtHead(self) -> Any:
+        """
+        removes first item in the list; IndexError is raised if list is empty; only takes
+        the head lock
+        :return: the item that was removed
+        """
+        if self._rwLock is not None:
+            self._rwLock.acquireWrite()
+        try:
+            with self._headLock:
+                if self._dummy.link is None:
+                    raise IndexError('removeItemAtHead called on empty LListCursor')
+                return self._removeFirst()
+        finally:
+            if self._rwLock is not None:
+                self._rwLock.releaseWrite()
+
+    def _removeLast(self) -> Any:
+        """
+        removes the last item; caller holds both locks and has checked the list is not empty
+        :return: the item that was removed
+        """
+        tail = self._tail
+        prevNode = tail.prev
+        prevNode.link = None
+        self._tail = prevNode
+        if self._cursor is tail:
+            # back to the node before, or None when that is the dummy
+            self._cursor = None if prevNode is self._dummy else prevNode
+        self._removed += 1
+        return tail.item
+
+    def removeItemAtCursor(self) -> Any:
+        """
+        removes item in the list that is at the _cursor; IndexError is raised if list is empty;
+        the _cursor now points to the node after the original _cursor unless the _cursor was the
+        last item in which case the _cursor is now the new last item
+        :return: the item that was removed
+        """
+        self._lockBoth()
+        try:
+            cursor = self._cursorNode()
+            if cursor is None:
+                raise IndexError('removeItemAtCursor called on empty LListCursor')
+            if cursor is self._tail:
+                return self._removeLast()
+            if cursor is self._dummy.link:
+                return self._removeFirst()
+            prevNode = cursor.prev
+            nextNode = cursor.link
+            prevNode.link = nextNode
+            nextNode.prev = prevNode
+            self._cursor = nextNode
+            self._removed += 1
+            return cursor.item
+        finally:
+            self._unlockBoth()
+
+    def removeItemAtTail(self) -> Any:
+        """
+        removes last item in the list; IndexError is raised if list is empty
+        :return: the item that was removed
+        """
+        self._lockBoth()
+        try:
+            if self._tail is self._dummy:
+                raise IndexError('removeItemAtTail called on empty LListCursor')
+            return self._removeLast()
+        finally:
+            self._unlockBoth()
+
+    def itemAtHead(self) -> Any:
+        """
+        returns first item; IndexError is raised if list is empty
+        :return: first item in list
+        """
+        with self._headLock:
+            first = self._dummy.link
+            if first is None:
+                raise IndexError('itemAtHead called on empty LListCursor')
+            return first.item
+
+    def itemAtCursor(self) -> Any:
+        """
+        returns item at _cursor; IndexError is raised if list is empty
+        :return: item at _cursor
+        """
+        with self._headLock:
+            cursor = self._cursorNode()
+            if cursor is None:
+                raise IndexError('itemAtCursor called on empty LListCursor')
+            return cursor.item
+
+    def itemAtTail(self) -> Any:
+        """
+        returns last item; IndexError is raised if list is empty
+        :return: last item in list
+        """
+        self._lockBoth()
+        try:
+            if self._tail is self._dummy:
+                raise IndexError('itemAtTail called on empty LListCursor')
+            return self._tail.item
+        finally:
+            self._unlockBoth()
+
+    def cursorToStart(self) -> None:
+        """
+        move _cursor to start/_head of list
+        :return:
+        """
+        with self._headLock:
+            self._cursor = None
+
+    def cursorForward(self) -> bool:
+        """
+        move _cursor forward one item
+        :return: True if _cursor was moved forward or False if list empty or _cursor already at end of list
+        """
+        self._lockBoth()
+        try:
+            cursor = self._cursorNode()
+            if cursor is None or cursor.link is None:
+                return False
+            self._cursor = cursor.link
+            return True
+        finally:
+            self._unlockBoth()
+
+    def cursorBackward(self) -> bool:
+        """
+        move _cursor back one item
+        :return: True if _cursor was moved back or False if list empty or _cursor already at start of list
+        """
+        self._lockBoth()
+        try:
+            cursor = self._cursorNode()
+            if cursor is None or cursor.prev is self._dummy:
+                return False
+            self._cursor = cursor.prev
+            return True
+        finally:
+            self._unlockBoth()
+
+# ----------------------------------------------------------------------
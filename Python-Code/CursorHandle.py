@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# CursorHandle.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Dict, Set
+
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class CursorHandle:
+    """CursorHandle is an extra cursor over an LListCursor, made by
+    LListCursor.newCursor(); each handle has its own position and the same
+    cursor methods as the list, so several consumers can share one list
+
+    a handle follows the rules of the list's own _cursor: it points to a node
+    of the list whenever the list is not empty, and to None when it is; if
+    the node it points to is removed, by any handle or by the list itself, it
+    moves to the node after it or, if there is none, the node before it
+
+    a closed handle raises ValueError from every method
+    """
+
+    def __init__(self, registry: _HandleRegistry, node: Optional[ListNode]):
+        self._registry: Optional[_HandleRegistry] = registry
+        self._node: Optional[ListNode] = node
+        registry.attach(self, node)
+
+    def _checkOpen(self) -> _HandleRegistry:
+        if self._registry is None:
+            raise ValueError('operation on closed CursorHandle')
+        return self._registry
+
+    def close(self) -> None:
+        """
+        detaches the handle from its list; closing twice does nothing
+        :return: None
+        """
+        if self._registry is not None:
+            self._registry.detach(self)
+            self._registry = None
+            self._node = None
+
+    # ------------------------------------------------------------------
+
+    def itemAtCursor(self) -> Any:
+        """
+        returns item at this handle; IndexError is raised if list is empty
+        :return: item at this handle
+        """
+        self._checkOpen()
+        if self._node is None:
+            raise IndexError('itemAtCursor called on empty LListCursor')
+        return self._node.item
+
+    def cursorToStart(self) -> None:
+        """
+        move this handle to the start/_head of the list
+        :return:
+        """
+        registry = self._checkOpen()
+        registry.move(self, registry.llist._head)
+
+    def cursorForward(self) -> bool:
+        """
+        move this handle forward one item
+        :return: True if it was moved forward or False if list empty or already at end of list
+        """
+        registry = self._checkOpen()
+        if self._node is None or self._node.link is None:
+            return False
+        registry.move(self, self._node.link)
+        return True
+
+    def cursorBackward(self) -> bool:
+        """
+        move this handle back one item
+        :return: True if it was moved back or False if list empty or already at start of list
+        """
+        registry = self._checkOpen()
+        if self._node is None or self._node.prev is None:
+            return False
+        registry.move(self, self._node.prev)
+        return True
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        insert item after this handle's position; no cursor moves unless the list was empty
+        :param item: value to insert
+        :return: None
+        """
+        registry = self._checkOpen()
+        llist = registry.llist
+        first, last, count = llist._buildChain((item,))
+        llist._spliceChain(first, last, count, self._node)
+
+    def removeItemAtCursor(self) -> Any:
+        """
+        removes the item at this handle; IndexError is raised if list is empty; this handle,
+        like any other cursor on the node, moves to the node after it unless it was the last
+        node in which case it moves to the new last node
+        :return: the item that was removed
+        """
+        registry = self._checkOpen()
+        if self._node is None:
+            raise IndexError('removeItemAtCursor called on empty LListCursor')
+        return registry.llist._removeRun(self._node, 1)[0]
+
+
+# ----------------------------------------------------------------------
+
+
+class _HandleRegistry:
+    """list observer that knows which handles are on which node, so the
+    handles on a removed node can be moved without searching"""
+
+    def __init__(self, llist):
+        self.llist = llist
+        # handles on each node; handles of an empty list are under None
+        self._byNode: Dict[Optional[ListNode], Set[CursorHandle]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(handles) for handles in self._byNode.values())
+
+    def attach(self, handle: CursorHandle, node: Optional[ListNode]) -> None:
+        handle._node = node
+        self._byNode.setdefault(node, set()).add(handle)
+
+    def detach(self, handle: CursorHandle) -> None:
+        handles = self._byNode[handle._node]
+        handles.discard(handle)
+        if not handles:
+            del self._byNode[handle._node]
+
+    def move(self, handle: CursorHandle, node: Optional[ListNode]) -> None:
+        self.detach(handle)
+        self.attach(handle, node)
+
+    def nodesInserted(self, first: ListNode, last: ListNode, count: int) -> None:
+        # handles of an empty list point to the first node inserted into it
+        if None in self._byNode and self.llist._length == count:
+            for handle in self._byNode.pop(None):
+                self.attach(handle, first)
+
+    def nodesRemoving(self, first: ListNode, count: int) -> None:
+        if not self._byNode:
+            return
+        moving = []
+        node = first
+        for i in range(count):
+            handles = self._byNode.pop(node, None)
+            if handles:
+                moving.extend(handles)
+            node = node.link
+        # node is now the node after the removed ones
+        target = node if node is not None else first.prev
+        for handle in moving:
+            self.attach(handle, target)
+
+# ----------------------------------------------------------------------
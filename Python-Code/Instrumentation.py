@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# Instrumentation.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional
+import functools
+import time
+
+
+# ----------------------------------------------------------------------
+
+# nodes each method walks or links, from its arguments and result; methods not
+# listed only touch the nodes next to the _head, _cursor or _tail
+
+def _stepHops(llist, args, result, length: int) -> int:
+    return 1 if result else 0
+
+
+def _walkHops(llist, args, result, length: int) -> int:
+    # a walk from the nearer end, as _nodeAt does, or a treap search if indexed
+    if getattr(llist, '_index', None) is not None or length == 0:
+        return 0
+    position = args[0] + length if args[0] < 0 else args[0]
+    return position if position <= length // 2 else length - 1 - position
+
+
+def _cursorIndexHops(llist, args, result, length: int) -> int:
+    return 0 if getattr(llist, '_index', None) is not None else result
+
+
+def _countHops(llist, args, result, length: int) -> int:
+    return args[0]
+
+
+def _rangeHops(llist, args, result, length: int) -> int:
+    # one walk to count the nodes and one to unlink them
+    return 2 * args[0]
+
+
+def _insertedHops(llist, args, result, length: int) -> int:
+    return max(getattr(llist, '_length', length) - length, 0)
+
+
+def _wholeListHops(llist, args, result, length: int) -> int:
+    return length
+
+
+_HOPS: Dict[str, Callable[..., int]] = {
+    'cursorForward': _stepHops,
+    'cursorBackward': _stepHops,
+    'cursorTo': _walkHops,
+    'cursorIndex': _cursorIndexHops,
+    'removeManyAtHead': _countHops,
+    'removeRangeFromCursor': _rangeHops,
+    'extend': _insertedHops,
+    'extendLeft': _insertedHops,
+    'insertManyAfterCursor': _insertedHops,
+    'pmap': _wholeListHops,
+    'pfilter': _wholeListHops,
+    'preduce': _wholeListHops,
+}
+
+# methods that make a new list, whose nodes are all allocations
+_COPIES = ('pmap', 'pfilter')
+
+# never wrapped, so instrumentation can always be turned off
+_SKIPPED = ('instrument', 'uninstrument')
+
+
+# ----------------------------------------------------------------------
+
+
+class Instrumentation:
+    """Instrumentation counts the calls to the public methods of one or more
+    LListCursors, with their total and worst time, the nodes each call
+    walked or linked (hops) and the nodes it allocated; made by
+    LListCursor.instrument()
+
+    it works by putting a timing wrapper for each method on the list
+    instance, so a list that is not instrumented runs exactly the code it
+    did before; special methods are looked up on the class, not the
+    instance, so len(), iteration, indexing and + are not counted
+
+    a call made by another counted call, such as insertAtTail from
+    insertAfterCursor, is counted as part of the outer call only
+
+    hops come from each method's arguments and result, following the walk
+    the method makes, so counting them costs no work inside the loops
+
+    if sink is set it is called after every counted call with a dict of
+    method, seconds, hops, allocations and length (after the call)
+    """
+
+    def __init__(self, sink: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        :param sink: optional callable given an event dict after each counted call
+        """
+        self.sink = sink
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        # depth of counted calls in progress, so nested calls are not counted twice
+        self._depth = 0
+
+    def attach(self, llist) -> None:
+        """
+        starts counting the calls to llist's public methods
+        :param llist: list to watch; any LListCursor backend works
+        :return: None
+        """
+        for name in dir(type(llist)):
+            if name.startswith('_') or name in _SKIPPED:
+                continue
+            method = getattr(llist, name)
+            if callable(method):
+                setattr(llist, name, self._wrap(llist, name, method))
+
+    def detach(self, llist) -> None:
+        """
+        stops counting llist's calls, removing the wrappers
+        :param llist: list passed to attach
+        :return: None
+        """
+        for name in list(vars(llist)):
+            if getattr(vars(llist)[name], '_instrumentation', None) is self:
+                delattr(llist, name)
+
+    def _wrap(self, llist, name: str, method: Callable) -> Callable:
+        hops = _HOPS.get(name)
+        copies = name in _COPIES
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if self._depth:
+                return method(*args, **kwargs)
+            length = getattr(llist, '_length', 0)
+            pool = getattr(llist, '_pool', None)
+            hits = pool.hits if pool is not None else 0
+            self._depth += 1
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                seconds = clock() - start
+                self._depth -= 1
+            if copies:
+                allocations = len(result)
+            else:
+                # new nodes are the growth in length, less those the pool gave back
+                allocations = max(getattr(llist, '_length', 0) - length, 0)
+                if pool is not None:
+                    allocations = max(allocations - (pool.hits - hits), 0)
+            self._record(name, seconds, hops(llist, args, result, length) if hops else 0,
+                         allocations, getattr(llist, '_length', 0))
+            return result
+
+        wrapper._instrumentation = self
+        return wrapper
+
+    def _record(self, name: str, seconds: float, hops: int, allocations: int, length: int) -> None:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = {'calls': 0, 'seconds': 0.0, 'maxSeconds': 0.0,
+                                         'hops': 0, 'allocations': 0}
+        stats['calls'] += 1
+        stats['seconds'] += seconds
+        if seconds > stats['maxSeconds']:
+            stats['maxSeconds'] = seconds
+        stats['hops'] += hops
+        stats['allocations'] += allocations
+        if self.sink is not None:
+            self.sink({'method': name, 'seconds': seconds, 'hops': hops,
+                       'allocations': allocations, 'length': length})
+
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: a copy of the counts so far, a dict from method name to a dict of calls,
+        seconds (total), maxSeconds, hops and allocations; methods never called are left out
+        """
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def reset(self) -> Dict[str, Dict[str, Any]]:
+        """
+        clears the counts
+        :return: the snapshot taken just before clearing
+        """
+        snapshot = self.snapshot()
+        self._stats.clear()
+        return snapshot
+
+# ----------------------------------------------------------------------
@@ -7,9 +7,16 @@
 
 
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, Iterable, List, Tuple
+import sys
+import threading
+import weakref
 
-from ListNode import ListNode
+from ListNode import ListNode, NodePool
+from PositionIndex import PositionIndex
+from ValueIndex import ValueIndex
+from CursorHandle import CursorHandle, _HandleRegistry
+from LListSnapshot import LListSnapshot
 
 
 # ----------------------------------------------------------------------
@@ -44,34 +51,111 @@ class LListCursor:
         after it in which case it refers to the ListNode before it.
 
         6. self._length indicates the number of items in the LListCursor
+
+        7. every ListNode's prev refers to the ListNode before it;
+        self._head.prev and self._tail.link are None
         """
 
     # ------------------------------------------------------------------
 
-    def __init__(self, *args):
+    def __new__(cls, *args, backend: str = 'node', **kwargs):
+        """
+        picks the storage backend; 'node' is this class with one ListNode per item,
+        'unrolled' returns an UnrolledLListCursor that stores items in fixed-size chunks
+        'concurrent' returns a thread-safe ConcurrentLListCursor and 'mmap' returns an
+        MmapLListCursor kept in a memory-mapped file given by path; giving a dtype
+        returns a TypedLListCursor that stores numbers in NumPy arrays, lazy=True
+        returns a LazyLListCursor that reads an iterable argument only as it is needed
+        and keepSorted=True returns a SortedLListCursor that inserts items in order
+        :param backend: name of the storage backend
+        :param kwargs: backend specific options such as chunkSize for 'unrolled'
+        """
+        if kwargs.get('keepSorted'):
+            if backend != 'node' or kwargs.get('lazy'):
+                raise ValueError('keepSorted is only available with the node backend and not lazy')
+            from SortedLListCursor import SortedLListCursor
+            return super().__new__(SortedLListCursor)
+        if kwargs.get('lazy'):
+            if backend != 'node':
+                raise ValueError('lazy construction is only available with the node backend')
+            from LazyLListCursor import LazyLListCursor
+            return super().__new__(LazyLListCursor)
+        if kwargs.get('dtype') is not None:
+            from TypedLListCursor import TypedLListCursor
+            return TypedLListCursor(*args, **kwargs)
+        if backend == 'unrolled':
+            # imported here since UnrolledLListCursor is only needed when asked for
+            from UnrolledLListCursor import UnrolledLListCursor
+            return UnrolledLListCursor(*args, **kwargs)
+        elif backend == 'concurrent':
+            from ConcurrentLListCursor import ConcurrentLListCursor
+            return ConcurrentLListCursor(*args, **kwargs)
+        elif backend == 'mmap':
+            from MmapLListCursor import MmapLListCursor
+            return MmapLListCursor(*args, **kwargs)
+        elif backend != 'node':
+            raise ValueError(f'unknown LListCursor backend {backend!r}')
+        return super().__new__(cls)
+
+    def __init__(self, *args, backend: str = 'node', pool: Optional[NodePool] = None,
+                 lazyConcat: bool = False, indexed: bool = False, lazy: bool = False,
+                 valueIndexed: bool = False, keepSorted: bool = False):
         """
         initializes empty list or list with items in args if it is not None; the _cursor
         will be the first node
         :param args: sequence of items to insert into the list
+        :param backend: storage backend, see __new__
+        :param pool: optional NodePool that removed nodes go back to and inserts take nodes from
+        :param lazyConcat: if True, self + other returns a LazyConcat view instead of a copy
+        :param indexed: if True, keep a PositionIndex so positional access is O(log n)
+        :param lazy: if True a LazyLListCursor is made instead, see __new__
+        :param valueIndexed: if True, keep a ValueIndex so finding an item is O(1) expected
+        :param keepSorted: if True a SortedLListCursor is made instead, see __new__
         """
+        self._pool: Optional[NodePool] = pool
+        self._lazyConcat: bool = lazyConcat
+        # inserts call this to get a node so the pool costs nothing when there is none
+        self._makeNode = ListNode if pool is None else pool.take
         self._head: Optional[ListNode] = None
         self._cursor: Optional[ListNode] = None
         self._tail: Optional[ListNode] = None
         self._length: int = 0
+        # bumped by every change to the items so views of the list can tell it changed
+        self._version: int = 0
+        # objects told about inserted and removed nodes, see addObserver
+        self._observers: List[Any] = []
+        # live snapshots, made by the first snapshot call; see _preserve
+        self._snapshots: Optional[weakref.WeakSet] = None
+        # last node of each live snapshot -> number of snapshots ending there
+        self._snapshotTails: Dict[ListNode, int] = {}
+        # guards the two above, since a snapshot can be closed or collected on any thread
+        self._snapshotLock = threading.RLock()
         # if only one argument, see if it is iterable
         if len(args) == 1:
             try:
-                # try to insert each item
-                for x in args[0]:
-                    self.insertAtTail(x)
+                items = iter(args[0])
             except TypeError:
                 # exception raised if item not iterable so just insert it
                 self.insertAtTail(args[0])
+            else:
+                self.extend(items)
         else:
-            # 0 or 2 or more arguments so iterate over them and insert them
-            for x in args:
-                self.insertAtTail(x)
+            # 0 or 2 or more arguments so insert them all
+            self.extend(args)
         self.cursorToStart()
+        # created by the first newCursor call
+        self._handles: Optional[_HandleRegistry] = None
+        self._index: Optional[PositionIndex] = None
+        # set by instrument
+        self._instrumentation = None
+        if indexed:
+            # built after the initial items so it is made in one O(n) pass
+            self._index = PositionIndex(self._head)
+            self.addObserver(self._index)
+        self._values: Optional[ValueIndex] = None
+        if valueIndexed:
+            self._values = ValueIndex(self._head)
+            self.addObserver(self._values)
 
     def __len__(self) -> int:
         """
@@ -94,26 +178,203 @@ class LListCursor:
 
     def __add__(self, other: LListCursor) -> LListCursor:
         """
-        returns a new LListCursor that is the concatenation of self and other
+        returns a new LListCursor that is the concatenation of self and other; in
+        lazyConcat mode a LazyConcat view is returned instead, which copies the items
+        only when it is first changed
         :param other: another LListCursor to concatenate with self
         :return: a new LListCursor that is concatenation of self and other; the
         _cursor of it should be at the beginning of the list
         """
-        # make a new LList
-        newList = LListCursor()
+        if self._lazyConcat:
+            # imported here since LazyConcat builds LListCursors itself
+            from LazyConcat import LazyConcat
+            return LazyConcat(self, other)
 
-        # append the objects from the first list
-        for x in self:
-            newList.insertAtTail(x)
+        # make a new LList
+        newList = LListCursor(pool=self._pool, indexed=self._index is not None,
+                              valueIndexed=self._values is not None)
 
-        # append the objects from the second list
-        for x in other:
-            newList.insertAtTail(x)
+        # append the objects from the first list and then the second list
+        newList.extend(self)
+        newList.extend(other)
 
         # point the cursor to the head of the new list and return it
         newList._cursor = newList._head
         return newList
 
+    def __iadd__(self, other: Iterable[Any]) -> LListCursor:
+        """
+        appends other to self; the nodes of another LListCursor are moved over in O(1)
+        by splice, leaving other empty, while any other iterable is copied by extend
+        :param other: LListCursor or iterable of items to append
+        :return: self
+        """
+        if isinstance(other, LListCursor):
+            self.splice(other)
+        else:
+            self.extend(other)
+        return self
+
+    def splice(self, other: LListCursor) -> None:
+        """
+        moves all the nodes of other to the end of self in O(1), leaving other empty;
+        the _cursor of self only changes if self was empty, in which case it points
+        to the first moved node; ValueError is raised if other is self
+        :param other: list whose items are moved
+        :return: None
+        """
+        if other is self:
+            raise ValueError('cannot splice an LListCursor into itself')
+        if not isinstance(other, LListCursor):
+            # no nodes to move from another backend, so copy the items and empty it
+            self.extend(other)
+            other.removeManyAtHead(len(other))
+            return
+        # len() rather than _length so a lazy list reads the rest of its source first
+        if len(other) == 0:
+            return
+        if other._observers:
+            other._notifyRemoving(other._head, other._length)
+        self._adoptSnapshots(other)
+        self._spliceChain(other._head, other._tail, other._length, self._tail)
+        other._head = other._cursor = other._tail = None
+        other._length = 0
+        other._version += 1
+
+    def addObserver(self, observer: Any) -> None:
+        """
+        registers observer to be told about node changes; observer.nodesInserted(first,
+        last, count) is called after the count nodes first..last are linked into the list
+        and observer.nodesRemoving(first, count) is called before the count nodes starting
+        at first are unlinked; if the observer has a nodeReplacing(node, item) method it is
+        called before __setitem__ changes node.item to item, and if it has a
+        nodesReordered(head) method it is called after sort relinks the same nodes in a new
+        order starting at head
+        :param observer: object with nodesInserted and nodesRemoving methods
+        :return: None
+        """
+        self._observers.append(observer)
+
+    def removeObserver(self, observer: Any) -> None:
+        """
+        stops telling observer about node changes; ValueError is raised if it is not registered
+        :param observer: object previously passed to addObserver
+        :return: None
+        """
+        self._observers.remove(observer)
+
+    def newCursor(self) -> CursorHandle:
+        """
+        makes an extra cursor with its own position, starting at the _head; the handles
+        of a list are kept on a node of it, see CursorHandle
+        :return: the new CursorHandle
+        """
+        if self._handles is None:
+            self._handles = _HandleRegistry(self)
+            self.addObserver(self._handles)
+        return CursorHandle(self._handles, self._head)
+
+    def snapshot(self) -> LListSnapshot:
+        """
+        makes a read-only view of the items as they are now in O(1); later changes to
+        the list save the old item and link of each node they touch for the snapshot,
+        see LListSnapshot; make snapshots on the thread that changes the list, or while
+        holding the lock its writers use, and read them from any thread
+        :return: the LListSnapshot
+        """
+        snapshot = LListSnapshot(self)
+        with self._snapshotLock:
+            if self._snapshots is None:
+                self._snapshots = weakref.WeakSet()
+            self._snapshots.add(snapshot)
+            if self._tail is not None:
+                self._snapshotTails[self._tail] = self._snapshotTails.get(self._tail, 0) + 1
+        return snapshot
+
+    def _preserve(self, node: ListNode) -> None:
+        """
+        saves node's item and link for every live snapshot before either is changed; a
+        link that is None needs no saving, since only a snapshot's last node can have
+        had a None link and a snapshot never follows its last node's link
+        """
+        with self._snapshotLock:
+            for snapshot in self._snapshots:
+                snapshot._keep(node)
+
+    def _cutSnapshotTail(self, node: ListNode) -> None:
+        """
+        called for each removed node while there are live snapshots; if node is the last
+        node of a snapshot, its link is saved and cut, so the nodes inserted after the
+        snapshot was made are not kept alive through it once they are removed
+        """
+        if node.link is None:
+            return
+        with self._snapshotLock:
+            if node in self._snapshotTails:
+                # the snapshots ending at node never read its link, but others may
+                for snapshot in self._snapshots:
+                    if snapshot._tail is not node:
+                        snapshot._keep(node)
+                node.link = None
+
+    def _adoptSnapshots(self, other: LListCursor) -> None:
+        """
+        moves other's live snapshots to self before other's nodes are moved into self, so
+        changes made to those nodes through self are saved for them
+        """
+        if not other._snapshots:
+            return
+        with other._snapshotLock, self._snapshotLock:
+            if self._snapshots is None:
+                self._snapshots = weakref.WeakSet()
+            for snapshot in other._snapshots:
+                snapshot._llist = self
+                self._snapshots.add(snapshot)
+            for node, count in other._snapshotTails.items():
+                self._snapshotTails[node] = self._snapshotTails.get(node, 0) + count
+            other._snapshots = None
+            other._snapshotTails = {}
+
+    def _notifyInserted(self, first: ListNode, last: ListNode, count: int) -> None:
+        for observer in self._observers:
+            observer.nodesInserted(first, last, count)
+
+    def _notifyRemoving(self, first: ListNode, count: int) -> None:
+        for observer in self._observers:
+            observer.nodesRemoving(first, count)
+
+    def _notifyReplacing(self, node: ListNode, item: Any) -> None:
+        for observer in self._observers:
+            # optional, since most observers only care about which nodes are in the list
+            replacing = getattr(observer, 'nodeReplacing', None)
+            if replacing is not None:
+                replacing(node, item)
+
+    def _notifyReordered(self) -> None:
+        for observer in self._observers:
+            reordered = getattr(observer, 'nodesReordered', None)
+            if reordered is not None:
+                reordered(self._head)
+
+    def memoryUsage(self) -> Dict[str, int]:
+        """
+        reports the memory used by the structure of the list, not counting the items
+        it holds; sizes come from sys.getsizeof
+        :return: dict with nodes (number of nodes), bytesPerNode, nodeBytes (all nodes),
+        listBytes (the LListCursor object and its attributes) and totalBytes
+        """
+        # every node has the same slotted layout so one empty node gives the per-node size
+        bytesPerNode = sys.getsizeof(ListNode(None))
+        nodeBytes = bytesPerNode * self._length
+        listBytes = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        return {
+            'nodes': self._length,
+            'bytesPerNode': bytesPerNode,
+            'nodeBytes': nodeBytes,
+            'listBytes': listBytes,
+            'totalBytes': nodeBytes + listBytes,
+        }
+
     # ------------------------------------------------------------------
 
     def insertAtHead(self, item: Any) -> None:
@@ -125,19 +386,29 @@ class LListCursor:
         # if length is 0 then the list is empty
         if self._length == 0:
             # insert in the item and point everything to the head
-            self._head = ListNode(item)
+            self._head = self._makeNode(item)
             self._tail = self._head
             self._cursor = self._head
 
         else:
-            # create a "temp" var to store the old head
-            prevHead = self._head
-            # create the new head
-            self._head = ListNode(item)
-            # link the old head to the new head
-            self._head.link = prevHead
+            pool = self._pool
+            if pool is not None and pool.freeNodes:
+                # reuse a pooled node, its link and prev are already None
+                pool.hits += 1
+                node = pool.freeNodes.pop()
+                node.item = item
+                node.link = self._head
+            else:
+                # create the new head linked forward to the old head
+                node = self._makeNode(item, self._head)
+            # link the old head back to the new head
+            self._head.prev = node
+            self._head = node
 
         self._length += 1
+        self._version += 1
+        if self._observers:
+            self._notifyInserted(self._head, self._head, 1)
 
     def insertAfterCursor(self, item: Any) -> None:
         """
@@ -149,11 +420,17 @@ class LListCursor:
             self.insertAtTail(item)
         else:
             self._length += 1
+            self._version += 1
             # list is not empty since _cursor == _tail if it is and _cursor not at _tail
-            # create node
-            node = ListNode(item, self._cursor.link)
-            # connect _cursor to the new node
+            # create node between the _cursor and the node after it
+            node = self._makeNode(item, self._cursor.link, self._cursor)
+            if self._snapshots:
+                self._preserve(self._cursor)
+            # connect both neighbours to the new node
+            self._cursor.link.prev = node
             self._cursor.link = node
+            if self._observers:
+                self._notifyInserted(node, node, 1)
 
     def insertAtTail(self, item: Any) -> None:
         """
@@ -164,16 +441,28 @@ class LListCursor:
         # if the length is zero the list is empty
         if self._length == 0:
             # create the head and point all other vars to it
-            self._head = ListNode(item)
+            self._head = self._makeNode(item)
             self._tail = self._head
             self._cursor = self._head
 
         else:
-            # list is not empty, create the tail and link it to the structure
-            self._tail.link = ListNode(item)
-            self._tail = self._tail.link
+            pool = self._pool
+            if pool is not None and pool.freeNodes:
+                # reuse a pooled node, its link and prev are already None
+                pool.hits += 1
+                node = pool.freeNodes.pop()
+                node.item = item
+                node.prev = self._tail
+            else:
+                node = self._makeNode(item, None, self._tail)
+            # list is not empty, link the new tail to the structure
+            self._tail.link = node
+            self._tail = node
 
         self._length += 1
+        self._version += 1
+        if self._observers:
+            self._notifyInserted(self._tail, self._tail, 1)
 
     def removeItemAtHead(self) -> Any:
         """
@@ -184,9 +473,13 @@ class LListCursor:
             # raise IndexError if list is empty
             raise IndexError('removeItemAtHead called on empty LListCursor')
         else:
+            if self._observers:
+                self._notifyRemoving(self._head, 1)
             self._length -= 1
+            self._version += 1
             # get item so can return it later
-            item = self._head.item
+            oldHead = self._head
+            item = oldHead.item
             # if list is empty after the deletion
             if self._length == 0:
                 # make all ListNode instance vars None
@@ -196,9 +489,18 @@ class LListCursor:
                 if self._cursor == self._head:
                     # move _cursor forward to new first item
                     self._cursor = self._cursor.link
-                # move _head forward to new first item
+                # move _head forward to new first item and cut the back-link
                 self._head = self._head.link
-
+                self._head.prev = None
+                if self._snapshots:
+                    self._cutSnapshotTail(oldHead)
+
+            pool = self._pool
+            # a snapshot may still read a removed node, so it is only pooled if there are none
+            if pool is not None and len(pool.freeNodes) < pool.maxSize and not self._snapshots:
+                # the old head has no prev, so only item and link need clearing
+                oldHead.item = oldHead.link = None
+                pool.freeNodes.append(oldHead)
             return item
 
     def removeItemAtCursor(self) -> Any:
@@ -222,41 +524,26 @@ class LListCursor:
             item = self.removeItemAtHead()
 
         else:
-            # otherwise decrement the length
+            # the cursor has a node on both sides of it
+            if self._observers:
+                self._notifyRemoving(self._cursor, 1)
             self._length -= 1
+            self._version += 1
             # save the item for return
             item = self._cursor.item
-
-            # if the length is zero after decrement destroy the list
-            if self._length == 0:
-                self._head = self._tail = self._cursor = None
-
-            # if deleting one of two items, destroy the list and leave the head
-            elif self._length == 1:
-                self._head.link = None
-                self._cursor = self._tail = self._head
-                return item
-
-            else:
-                # create variables to call out of conditionals
-                tracker = self._head
-                nodeLinkToDestroy = tracker
-                # go forwards through links
-                while not (tracker == self._cursor):
-                    # make a copy of the previous node
-                    nodeLinkToDestroy = tracker
-                    # move the tracker forward
-                    tracker = tracker.link
-
-                # move the cursor forward as per the conditions of Invariant
-                properCursorLocation = self._cursor.link
-
-                # destroy the prevNode's link
-                nodeLinkToDestroy.link = None
-                # relink the list
-                nodeLinkToDestroy.link = properCursorLocation
-                # set the cursor to the proper node
-                self._cursor = properCursorLocation
+            prevNode = self._cursor.prev
+            nextNode = self._cursor.link
+            if self._snapshots:
+                self._preserve(prevNode)
+            # relink the neighbours around the cursor node
+            prevNode.link = nextNode
+            nextNode.prev = prevNode
+            if self._snapshots:
+                self._cutSnapshotTail(self._cursor)
+            elif self._pool is not None:
+                self._pool.release(self._cursor)
+            # move the cursor forward as per the conditions of Invariant
+            self._cursor = nextNode
 
         return item
 
@@ -270,56 +557,34 @@ class LListCursor:
         if self._length == 0:
             raise IndexError('removeItemAtTail called on empty LListCursor')
 
-        else:
-            # create proper length since we are removing an item
-            self._length -= 1
-            # save the item for return
-            item = self._tail.item
-
-            # if deleting the last item destroy the list
-            if self._length == 0:
-                self._head = self._cursor = self._tail = None
-                return item
+        if self._observers:
+            self._notifyRemoving(self._tail, 1)
+        # create proper length since we are removing an item
+        self._length -= 1
+        self._version += 1
+        # save the item for return
+        oldTail = self._tail
+        item = oldTail.item
 
-            # if deleting one of two items, destroy the list and leave the head
-            elif self._length == 1:
-                self._head.link = None
-                self._cursor = self._tail = self._head
-                return item
+        # if deleting the last item destroy the list
+        if self._length == 0:
+            self._head = self._cursor = self._tail = None
 
-            else:
-                # create variables to call out of conditionals
-                tracker = self._head
-                prevNode = tracker
-                count = 0
-                flagOnCursor = False
-                # if the cursor is at the end, send it to the start
-                if self._cursor == self._tail:
-                    self.cursorToStart()
-                    # flag that the cursor needs moved
-                    flagOnCursor = True
-
-                # go forwards through links
-                while tracker != self._tail:
-                    # make a copy of the previous node
-                    prevNode = tracker
-                    # move the tracker forward
-                    tracker = tracker.link
-                    # keep track of how many links there are to move the cursor if needed
-                    count += 1
-
-        # if the cursor was flagged for being at the end of the list
-        if flagOnCursor:
-            for i in range(count):
-                # move the cursor forward based on count variable
-                self.cursorForward()
-
-        # destroy the prevNode's link
-        prevNode.link = None
-        # set the tail to the unlinked node
-        self._tail = prevNode
-        if flagOnCursor:
-            self._cursor = self._tail
+        else:
+            # if the cursor is at the end, move it back with the tail
+            if self._cursor == self._tail:
+                self._cursor = self._tail.prev
+            # move the tail back and cut its forward link
+            self._tail = self._tail.prev
+            if self._snapshots:
+                self._preserve(self._tail)
+            self._tail.link = None
+
+        pool = self._pool
+        if pool is not None and len(pool.freeNodes) < pool.maxSize and not self._snapshots:
+            # the old tail has no link, so only item and prev need clearing
+            oldTail.item = oldTail.prev = None
+            pool.freeNodes.append(oldTail)
         # return the item
         return item
 
@@ -384,4 +649,524 @@ class LListCursor:
             didCursorMove = False
 
         return didCursorMove
-# ----------------------------------------------------------------------
\ No newline at end of file
+
+    def cursorBackward(self) -> bool:
+        """
+        move _cursor back one item
+        :return: True if _cursor was moved back or False if list empty or _cursor already at start of list
+        """
+        # nothing to move if the list is empty or the cursor is at the head
+        if self._length == 0 or self._cursor == self._head:
+            return False
+
+        self._cursor = self._cursor.prev
+        return True
+
+
+    # ------------------------------------------------------------------
+
+    def _buildChain(self, items: Iterable[Any]) -> Tuple[Optional[ListNode], Optional[ListNode], int]:
+        """
+        links a node for each item into a chain that is not yet part of the list
+        :param items: values for the nodes, in order
+        :return: first node, last node and number of nodes; the nodes are None if items is empty
+        """
+        makeNode = self._makeNode
+        first = last = None
+        count = 0
+        for item in items:
+            node = makeNode(item, None, last)
+            if last is None:
+                first = node
+            else:
+                last.link = node
+            last = node
+            count += 1
+        return first, last, count
+
+    def _spliceChain(self, first: Optional[ListNode], last: Optional[ListNode], count: int,
+                     after: Optional[ListNode]) -> None:
+        """
+        links a chain made by _buildChain into the list after the node after, or at the
+        head if after is None; the _cursor only changes if the list was empty
+        """
+        if count == 0:
+            return
+        if self._length == 0:
+            self._head = self._cursor = first
+            self._tail = last
+        elif after is None:
+            # chain goes in front of the head
+            last.link = self._head
+            self._head.prev = last
+            self._head = first
+        else:
+            nextNode = after.link
+            if nextNode is not None and self._snapshots:
+                self._preserve(after)
+            after.link = first
+            first.prev = after
+            last.link = nextNode
+            if nextNode is None:
+                self._tail = last
+            else:
+                nextNode.prev = last
+        self._length += count
+        self._version += 1
+        if self._observers:
+            self._notifyInserted(first, last, count)
+
+    def _removeRun(self, first: ListNode, count: int) -> List[Any]:
+        """
+        unlinks count nodes starting at first, which the caller has checked exist; a
+        _cursor inside the run moves to the node after it or, if there is none, the
+        node before it
+        :return: the removed items in order
+        """
+        if self._observers:
+            self._notifyRemoving(first, count)
+        items = []
+        before = first.prev
+        node = first
+        cursorRemoved = False
+        pool = self._pool
+        snapshots = self._snapshots
+        if snapshots:
+            # removed nodes stay as they are for the snapshots, so only before changes
+            pool = None
+            if before is not None:
+                self._preserve(before)
+        for i in range(count):
+            items.append(node.item)
+            if node is self._cursor:
+                cursorRemoved = True
+            nextNode = node.link
+            # break the back-links so the removed nodes are freed without the cycle collector
+            node.prev = None
+            if pool is not None:
+                pool.release(node)
+            elif snapshots:
+                self._cutSnapshotTail(node)
+            node = nextNode
+
+        # node is now the first node after the run and before is the node before it
+        if before is None:
+            self._head = node
+        else:
+            before.link = node
+        if node is None:
+            self._tail = before
+        else:
+            node.prev = before
+        if cursorRemoved:
+            self._cursor = node if node is not None else before
+        self._length -= count
+        self._version += 1
+        return items
+
+    def _checkCount(self, count: int, available: int, method: str) -> None:
+        """
+        raises ValueError if count is negative or IndexError if it is more than available
+        """
+        if count < 0:
+            raise ValueError(f'{method} called with negative count {count}')
+        if count > available:
+            raise IndexError(f'{method} called with {count} items but only {available} available')
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the end of the list in order, linking them in as one chain
+        :param items: values to insert
+        :return: None
+        """
+        first, last, count = self._buildChain(items)
+        self._spliceChain(first, last, count, self._tail)
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the beginning of the list, keeping their order, so the first of
+        items becomes the new head
+        :param items: values to insert
+        :return: None
+        """
+        first, last, count = self._buildChain(items)
+        self._spliceChain(first, last, count, None)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        """
+        inserts items in order after the _cursor position
+        :param items: values to insert
+        :return: None
+        """
+        first, last, count = self._buildChain(items)
+        self._spliceChain(first, last, count, self._cursor)
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        """
+        removes the first count items; IndexError is raised if the list has fewer items and
+        ValueError if count is negative; a _cursor on a removed item moves to the new _head
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        self._checkCount(count, self._length, 'removeManyAtHead')
+        if count == 0:
+            return []
+        return self._removeRun(self._head, count)
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        """
+        removes count items starting with the item at the _cursor; IndexError is raised if
+        there are fewer than count items from the _cursor to the _tail and ValueError if count
+        is negative; the _cursor now points to the node after the removed items unless they
+        ran to the end of the list in which case it points to the node before them
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        if count == 0:
+            return []
+        # count the nodes from the cursor to the tail, stopping once there are enough
+        available = 0
+        node = self._cursor
+        while node is not None and available < count:
+            available += 1
+            node = node.link
+        self._checkCount(count, available, 'removeRangeFromCursor')
+        return self._removeRun(self._cursor, count)
+
+
+    # ------------------------------------------------------------------
+
+    def _checkPosition(self, position: int, method: str) -> int:
+        """
+        turns a negative position into one counted from the start, as Python lists do
+        :return: the position counted from the start; IndexError is raised if it is out of range
+        """
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(f'{method} position out of range for LListCursor of length {self._length}')
+        return position
+
+    def _nodeAt(self, position: int) -> ListNode:
+        """
+        :param position: position counted from the start, already checked
+        :return: the node at position, from the PositionIndex if there is one or otherwise
+        by walking from whichever end of the list is nearer
+        """
+        if self._index is not None:
+            return self._index.nodeAt(position)
+        if position <= self._length // 2:
+            node = self._head
+            for i in range(position):
+                node = node.link
+        else:
+            node = self._tail
+            for i in range(self._length - 1 - position):
+                node = node.prev
+        return node
+
+    def __getitem__(self, position: int) -> Any:
+        """
+        returns the item at position; negative positions count back from the end; O(log n)
+        if the list is indexed and O(n) otherwise; IndexError is raised if out of range
+        :param position: position of the item
+        :return: the item
+        """
+        return self._nodeAt(self._checkPosition(position, '__getitem__')).item
+
+    def __setitem__(self, position: int, item: Any) -> None:
+        """
+        replaces the item at position; negative positions count back from the end; O(log n)
+        if the list is indexed and O(n) otherwise; IndexError is raised if out of range
+        :param position: position of the item
+        :param item: new value
+        :return: None
+        """
+        node = self._nodeAt(self._checkPosition(position, '__setitem__'))
+        if self._observers:
+            self._notifyReplacing(node, item)
+        if self._snapshots:
+            self._preserve(node)
+        node.item = item
+        self._version += 1
+
+    def cursorTo(self, position: int) -> None:
+        """
+        moves the _cursor to position; negative positions count back from the end; O(log n)
+        if the list is indexed and O(n) otherwise; IndexError is raised if out of range
+        :param position: position to move the _cursor to
+        :return: None
+        """
+        self._cursor = self._nodeAt(self._checkPosition(position, 'cursorTo'))
+
+    def cursorIndex(self) -> int:
+        """
+        returns the position of the _cursor, counting from 0; O(log n) if the list is
+        indexed and O(n) otherwise; IndexError is raised if the list is empty
+        :return: position of the _cursor
+        """
+        if self._length == 0:
+            raise IndexError('cursorIndex called on empty LListCursor')
+        if self._index is not None:
+            return self._index.position(self._cursor)
+        position = 0
+        node = self._head
+        while node is not self._cursor:
+            node = node.link
+            position += 1
+        return position
+
+
+    # ------------------------------------------------------------------
+
+    def _findNode(self, item: Any) -> Optional[ListNode]:
+        """
+        :param item: value to look for, compared with == as list.index does
+        :return: a node holding item, or None if there is none; with a ValueIndex it is the
+        earliest inserted such node, otherwise the first in list order
+        """
+        if self._values is not None:
+            return self._values.first(item)
+        node = self._head
+        while node is not None:
+            if node.item is item or node.item == item:
+                return node
+            node = node.link
+        return None
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        :param item: value to look for
+        :return: True if an item of the list equals item; O(1) expected with a ValueIndex
+        and O(n) otherwise
+        """
+        return self._findNode(item) is not None
+
+    def count(self, item: Any) -> int:
+        """
+        :param item: value to look for
+        :return: number of items equal to item; O(1) expected with a ValueIndex and O(n)
+        otherwise
+        """
+        if self._values is not None:
+            return self._values.count(item)
+        return sum(1 for x in self if x is item or x == item)
+
+    def cursorToItem(self, item: Any) -> bool:
+        """
+        moves the _cursor to a node holding item; with a ValueIndex it is the earliest
+        inserted one, otherwise the first in list order; O(1) expected with a ValueIndex
+        and O(n) otherwise
+        :param item: value to look for
+        :return: True if the _cursor was moved or False if no item equals item
+        """
+        node = self._findNode(item)
+        if node is None:
+            return False
+        self._cursor = node
+        return True
+
+    def removeItem(self, item: Any) -> Any:
+        """
+        removes one item equal to item, chosen as cursorToItem chooses; ValueError is raised
+        if there is none; a _cursor on the removed node moves as in removeItemAtCursor;
+        O(1) expected with a ValueIndex and O(n) otherwise
+        :param item: value to look for
+        :return: the item that was removed
+        """
+        node = self._findNode(item)
+        if node is None:
+            raise ValueError(f'removeItem: {item!r} is not in the LListCursor')
+        return self._removeRun(node, 1)[0]
+
+
+    # ------------------------------------------------------------------
+
+    def _relinkPrev(self) -> None:
+        """
+        sets every node's prev from the links, starting at self._head, and sets self._tail
+        """
+        before = None
+        node = self._head
+        while node is not None:
+            node.prev = before
+            before = node
+            node = node.link
+        self._tail = before
+
+    def _mergeChains(self, left: ListNode, right: Optional[ListNode],
+                     reverse: bool) -> Tuple[ListNode, ListNode, Optional[Exception]]:
+        """
+        merges two sorted chains that end with a None link and hold their sort keys in prev;
+        on equal keys the node from left goes first, so merging is stable
+        :return: first and last node of the merged chain, and the error raised by a key
+        comparison or None; after an error the rest of left and then the rest of right are
+        linked on unmerged, so no node is lost
+        """
+        first = last = None
+        error = None
+        try:
+            while left is not None and right is not None:
+                # descending order still keeps equal keys in their old order, as list.sort does
+                if (left.prev < right.prev) if reverse else (right.prev < left.prev):
+                    node = right
+                    right = right.link
+                else:
+                    node = left
+                    left = left.link
+                if last is None:
+                    first = node
+                else:
+                    last.link = node
+                last = node
+        except Exception as e:
+            error = e
+        for rest in (left, right):
+            if rest is not None:
+                if last is None:
+                    first = rest
+                else:
+                    last.link = rest
+                while rest.link is not None:
+                    rest = rest.link
+                last = rest
+        return first, last, error
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        sorts the list in place with a bottom-up merge sort that relinks its nodes, so no
+        node is made or copied and the _cursor and any handles stay on their items; stable,
+        with key and reverse as in list.sort; O(n log n) time and no extra memory besides
+        the keys, which are kept in each node's prev until the sort is done; if key or a
+        comparison raises, the list keeps all its items in some order and the error is raised
+        :param key: optional function giving the value to sort each item by
+        :param reverse: if True sort in descending order
+        :return: None
+        """
+        if self._length < 2:
+            return
+        if self._snapshots:
+            node = self._head
+            while node is not None:
+                self._preserve(node)
+                node = node.link
+        node = self._head
+        try:
+            while node is not None:
+                node.prev = node.item if key is None else key(node.item)
+                node = node.link
+        except Exception:
+            # nothing was relinked yet, only the prevs need putting back
+            self._relinkPrev()
+            raise
+
+        head = self._head
+        error = None
+        width = 1
+        # each pass merges neighbouring runs of width nodes into runs of 2 * width
+        while width < self._length and error is None:
+            rest = head
+            head = tail = None
+            while rest is not None:
+                # cut off a left run and a right run of up to width nodes each
+                left = node = rest
+                for i in range(width - 1):
+                    if node.link is None:
+                        break
+                    node = node.link
+                right = node.link
+                node.link = None
+                rest = None
+                if right is not None:
+                    node = right
+                    for i in range(width - 1):
+                        if node.link is None:
+                            break
+                        node = node.link
+                    rest = node.link
+                    node.link = None
+                first, last, error = self._mergeChains(left, right, reverse)
+                if tail is None:
+                    head = first
+                else:
+                    tail.link = first
+                tail = last
+                if error is not None:
+                    # stop sorting but keep the nodes not reached in the list
+                    tail.link = rest
+                    break
+            width *= 2
+
+        self._head = head
+        self._relinkPrev()
+        self._version += 1
+        if self._observers:
+            self._notifyReordered()
+        if error is not None:
+            raise error
+
+
+    # ------------------------------------------------------------------
+
+    def pmap(self, fn, **options) -> LListCursor:
+        """
+        applies fn to every item in parallel; see LListParallel.pmap for the options
+        (chunkSize, workers, executor)
+        :param fn: function of one item
+        :return: a new LListCursor of the results in order
+        """
+        import LListParallel
+        return LListParallel.pmap(self, fn, **options)
+
+    def pfilter(self, pred, **options) -> LListCursor:
+        """
+        keeps the items for which pred is true, testing them in parallel; see
+        LListParallel.pfilter for the options (chunkSize, workers, executor)
+        :param pred: function of one item
+        :return: a new LListCursor of the kept items in order
+        """
+        import LListParallel
+        return LListParallel.pfilter(self, pred, **options)
+
+    def preduce(self, fn, init: Any, **options) -> Any:
+        """
+        reduces the items with the associative function fn in parallel; see
+        LListParallel.preduce for the options (chunkSize, workers, executor)
+        :param fn: function of two values
+        :param init: starting value
+        :return: the reduced value
+        """
+        import LListParallel
+        return LListParallel.preduce(self, fn, init, **options)
+
+
+    # ------------------------------------------------------------------
+
+    def instrument(self, sink=None, instrumentation=None):
+        """
+        starts counting calls, time, node hops and allocations for the public methods of
+        this list; see Instrumentation; calling it again keeps the same counts and only
+        changes the sink if one is given
+        :param sink: optional callable given an event dict after each counted call
+        :param instrumentation: an existing Instrumentation to add this list's counts to
+        :return: the Instrumentation holding the counts
+        """
+        if self._instrumentation is None:
+            # imported here since instrumentation is only needed when asked for
+            from Instrumentation import Instrumentation
+            self._instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+            self._instrumentation.attach(self)
+        if sink is not None:
+            self._instrumentation.sink = sink
+        return self._instrumentation
+
+    def uninstrument(self) -> None:
+        """
+        stops counting, leaving the list exactly as it was before instrument
+        :return: None
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.detach(self)
+            self._instrumentation = None
+
+# ----------------------------------------------------------------------
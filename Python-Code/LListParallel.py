@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# LListParallel.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Any, Callable, Iterator, List, Optional, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, reduce
+from itertools import islice
+
+
+# ----------------------------------------------------------------------
+
+# default number of items sent to a worker at once
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _segments(llist, chunkSize: int) -> Iterator[List[Any]]:
+    """
+    cuts the items of llist into contiguous lists of up to chunkSize items, in order
+    """
+    if chunkSize < 1:
+        raise ValueError('chunkSize must be at least 1')
+    items = iter(llist)
+    while True:
+        segment = list(islice(items, chunkSize))
+        if not segment:
+            return
+        yield segment
+
+
+@contextmanager
+def _executor(executor: Union[str, Executor], workers: Optional[int]):
+    """
+    yields executor itself if it is an Executor, otherwise a new process or thread pool
+    with workers workers that is shut down afterwards
+    """
+    if isinstance(executor, Executor):
+        yield executor
+    elif executor == 'process':
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield pool
+    elif executor == 'thread':
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield pool
+    else:
+        raise ValueError(f"executor must be 'process', 'thread' or an Executor, not {executor!r}")
+
+
+# the segment functions run in the workers, so they must be module level to be pickled
+
+def _mapSegment(fn: Callable[[Any], Any], segment: List[Any]) -> List[Any]:
+    return [fn(x) for x in segment]
+
+
+def _filterSegment(pred: Callable[[Any], bool], segment: List[Any]) -> List[Any]:
+    return [x for x in segment if pred(x)]
+
+
+def _reduceSegment(fn: Callable[[Any, Any], Any], segment: List[Any]) -> Any:
+    return reduce(fn, segment)
+
+
+# ----------------------------------------------------------------------
+
+
+def pmap(llist, fn: Callable[[Any], Any], chunkSize: int = DEFAULT_CHUNK_SIZE,
+         workers: Optional[int] = None, executor: Union[str, Executor] = 'process'):
+    """
+    applies fn to every item of llist in parallel
+    :param llist: list to read
+    :param fn: function of one item; must be picklable for the process executor
+    :param chunkSize: number of items sent to a worker at once
+    :param workers: number of workers in a new pool; os.cpu_count() if None
+    :param executor: 'process', 'thread' or an existing Executor to use
+    :return: a new LListCursor of the results in the order of llist
+    """
+    from LListCursor import LListCursor
+    result = LListCursor()
+    with _executor(executor, workers) as pool:
+        for segment in pool.map(partial(_mapSegment, fn), _segments(llist, chunkSize)):
+            result.extend(segment)
+    result.cursorToStart()
+    return result
+
+
+def pfilter(llist, pred: Callable[[Any], bool], chunkSize: int = DEFAULT_CHUNK_SIZE,
+            workers: Optional[int] = None, executor: Union[str, Executor] = 'process'):
+    """
+    keeps the items of llist for which pred is true, testing them in parallel
+    :param llist: list to read
+    :param pred: function of one item; must be picklable for the process executor
+    :param chunkSize: number of items sent to a worker at once
+    :param workers: number of workers in a new pool; os.cpu_count() if None
+    :param executor: 'process', 'thread' or an existing Executor to use
+    :return: a new LListCursor of the kept items in the order of llist
+    """
+    from LListCursor import LListCursor
+    result = LListCursor()
+    with _executor(executor, workers) as pool:
+        for segment in pool.map(partial(_filterSegment, pred), _segments(llist, chunkSize)):
+            result.extend(segment)
+    result.cursorToStart()
+    return result
+
+
+def preduce(llist, fn: Callable[[Any, Any], Any], init: Any, chunkSize: int = DEFAULT_CHUNK_SIZE,
+            workers: Optional[int] = None, executor: Union[str, Executor] = 'process') -> Any:
+    """
+    reduces the items of llist with fn in parallel: each segment is reduced by a worker
+    and the segment results are then reduced in order starting from init, so fn must be
+    associative (init need not be an identity of fn)
+    :param llist: list to read
+    :param fn: function of two values; must be picklable for the process executor
+    :param init: starting value, returned if llist is empty
+    :param chunkSize: number of items sent to a worker at once
+    :param workers: number of workers in a new pool; os.cpu_count() if None
+    :param executor: 'process', 'thread' or an existing Executor to use
+    :return: the reduced value
+    """
+    with _executor(executor, workers) as pool:
+        partials = pool.map(partial(_reduceSegment, fn), _segments(llist, chunkSize))
+        return reduce(fn, partials, init)
+
+# ----------------------------------------------------------------------
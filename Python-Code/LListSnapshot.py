@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# LListSnapshot.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Dict, Tuple
+
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class LListSnapshot:
+    """LListSnapshot is a read-only view of the items an LListCursor held
+    when LListCursor.snapshot() made it; it can be iterated and len() is
+    O(1); making one is O(1) since it shares the list's nodes
+
+    the snapshot keeps the first node and the number of items; walking that
+    many links from the first node gives the items as they were, as long as
+    no node on the way has had its item or link changed; so before the list
+    changes either, it saves the old item and link of that node in each live
+    snapshot (copy on write), and the snapshot reads the saved values in
+    place of the node's own
+
+    only the nodes a change touches are saved: insertAtTail, insertAtHead
+    and removeItemAtHead save nothing, unless removeItemAtHead removes the
+    last node of a snapshot, and other changes save one node each, apart
+    from sort, which saves every node; nodes removed from the list are not
+    cleared or given back to a NodePool while a snapshot could still read
+    them; a list stops saving for a snapshot once it is closed or garbage
+    collected
+
+    a snapshot keeps its own nodes alive, including those the list has
+    removed since; nodes inserted after it was made are freed when they are
+    removed from the head, as in a queue, while nodes touched by other
+    changes may be kept until the snapshot is closed
+
+    iterating reads a node's item and link before looking for saved values,
+    while the list saves before it changes a node, so a snapshot can be read
+    from one thread while another thread changes the list; closing, or the
+    last reference going away, may happen on any thread, since the list's
+    record of its snapshots is guarded by a lock
+
+    a closed snapshot raises ValueError from every method but close
+    """
+
+    def __init__(self, llist):
+        """
+        :param llist: list to take the snapshot of; use llist.snapshot() rather than this
+        """
+        self._llist = llist
+        self._head: Optional[ListNode] = llist._head
+        # the list cuts this node's link when it is removed, see LListCursor._cutSnapshotTail
+        self._tail: Optional[ListNode] = llist._tail
+        self._length: int = llist._length
+        # node -> (item, link) from before the list first changed it
+        self._saved: Optional[Dict[ListNode, Tuple[Any, Optional[ListNode]]]] = {}
+
+    def _checkOpen(self) -> Dict[ListNode, Tuple[Any, Optional[ListNode]]]:
+        if self._saved is None:
+            raise ValueError('operation on closed LListSnapshot')
+        return self._saved
+
+    def _keep(self, node: ListNode) -> None:
+        """
+        called by the list before it changes node.item or node.link
+        """
+        saved = self._saved
+        if saved is not None and node not in saved:
+            saved[node] = (node.item, node.link)
+
+    def close(self) -> None:
+        """
+        stops the list saving nodes for this snapshot and lets go of the nodes; closing
+        twice does nothing
+        :return: None
+        """
+        if self._saved is None:
+            return
+        while True:
+            llist = self._llist
+            with llist._snapshotLock:
+                # splice may have moved this snapshot to another list meanwhile
+                if self._llist is not llist:
+                    continue
+                llist._snapshots.discard(self)
+                if self._tail is not None:
+                    tails = llist._snapshotTails
+                    tails[self._tail] -= 1
+                    if not tails[self._tail]:
+                        del tails[self._tail]
+                self._saved = None
+                self._head = self._tail = None
+                return
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self) -> LListSnapshot:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the snapshot
+        """
+        self._checkOpen()
+        return self._length
+
+    def __iter__(self):
+        """
+        iterates over the items the list had when the snapshot was made
+        """
+        saved = self._checkOpen()
+        node = self._head
+        for i in range(self._length):
+            # read the node before the saved values, see the class docstring
+            item = node.item
+            link = node.link
+            kept = saved.get(node)
+            if kept is not None:
+                item, link = kept
+            yield item
+            node = link
+
+    def savedNodes(self) -> int:
+        """
+        :return: number of nodes the list has saved for this snapshot so far
+        """
+        return len(self._checkOpen())
+
+# ----------------------------------------------------------------------
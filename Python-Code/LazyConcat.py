@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# LazyConcat.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, List
+
+from LListCursor import LListCursor
+
+
+# ----------------------------------------------------------------------
+
+
+class LazyConcat:
+    """LazyConcat is what self + other returns for an LListCursor in lazyConcat
+    mode; it keeps references to the operand lists (its segments) instead of
+    copying their items
+
+    len, iteration, itemAtHead, itemAtCursor, itemAtTail and + work directly on
+    the segments; anything else, such as an insert, remove or cursor move,
+    first materializes the view into a real LListCursor (with the _cursor at
+    the beginning, as for __add__) and from then on every call goes to that list
+
+    the segments must not change before the view is materialized; if a
+    node-backed segment does, using the view raises RuntimeError rather than
+    returning the changed items
+    """
+
+    def __init__(self, *segments):
+        """
+        :param segments: LListCursors or LazyConcats to concatenate, in order
+        """
+        self._segments: List[LListCursor] = []
+        for segment in segments:
+            if isinstance(segment, LazyConcat) and segment._list is None:
+                # flatten nested views so long chains of + stay one level deep
+                self._segments.extend(segment._segments)
+            else:
+                self._segments.append(segment)
+        # version of each segment when the view was made, see _check
+        self._versions: List[Optional[int]] = [getattr(s, '_version', None) for s in self._segments]
+        self._length: int = sum(len(s) for s in self._segments)
+        # the real list once the view has been materialized
+        self._list: Optional[LListCursor] = None
+
+    def _check(self) -> None:
+        """
+        raises RuntimeError if a segment has changed since the view was made
+        """
+        for segment, version in zip(self._segments, self._versions):
+            if getattr(segment, '_version', None) != version:
+                raise RuntimeError('LListCursor changed after it was lazily concatenated')
+
+    def materialize(self) -> LListCursor:
+        """
+        copies the items of the segments into a new LListCursor, once
+        :return: the materialized list
+        """
+        if self._list is None:
+            self._check()
+            first = self._segments[0]
+            newList = LListCursor(pool=getattr(first, '_pool', None),
+                                  lazyConcat=getattr(first, '_lazyConcat', False),
+                                  indexed=getattr(first, '_index', None) is not None)
+            for segment in self._segments:
+                newList.extend(segment)
+            newList.cursorToStart()
+            self._list = newList
+            # the view no longer needs the operands
+            self._segments = []
+            self._versions = []
+        return self._list
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names not defined on the view, i.e. the rest of the LListCursor API
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the view
+        """
+        if self._list is not None:
+            return len(self._list)
+        self._check()
+        return self._length
+
+    def __iter__(self):
+        """
+        iterates over the items of each segment in turn
+        """
+        if self._list is not None:
+            yield from self._list
+            return
+        self._check()
+        for segment in self._segments:
+            yield from segment
+
+    def __add__(self, other) -> Any:
+        """
+        returns the concatenation of self and other; a new view unless self has
+        been materialized, in which case it is the materialized list's __add__
+        """
+        if self._list is not None:
+            return self._list + other
+        self._check()
+        return LazyConcat(self, other)
+
+    def itemAtHead(self) -> Any:
+        """
+        returns first item; IndexError is raised if the view is empty
+        :return: first item
+        """
+        if self._list is not None:
+            return self._list.itemAtHead()
+        self._check()
+        for segment in self._segments:
+            if len(segment) > 0:
+                return segment.itemAtHead()
+        raise IndexError('itemAtHead called on empty LListCursor')
+
+    def itemAtCursor(self) -> Any:
+        """
+        returns item at the _cursor, which is the first item until the view is materialized
+        :return: item at _cursor
+        """
+        if self._list is not None:
+            return self._list.itemAtCursor()
+        if len(self) == 0:
+            raise IndexError('itemAtCursor called on empty LListCursor')
+        return self.itemAtHead()
+
+    def itemAtTail(self) -> Any:
+        """
+        returns last item; IndexError is raised if the view is empty
+        :return: last item
+        """
+        if self._list is not None:
+            return self._list.itemAtTail()
+        self._check()
+        for segment in reversed(self._segments):
+            if len(segment) > 0:
+                return segment.itemAtTail()
+        raise IndexError('itemAtTail called on empty LListCursor')
+
+# ----------------------------------------------------------------------
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# LazyLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Iterable, Iterator, List
+
+from LListCursor import LListCursor
+from ListNode import ListNode
+from CursorHandle import CursorHandle
+from LListSnapshot import LListSnapshot
+
+
+# ----------------------------------------------------------------------
+
+
+class LazyLListCursor(LListCursor):
+    """LazyLListCursor is an LListCursor built from an iterator that is only
+    read as far as it has to be; LListCursor(source, lazy=True) returns one
+
+    the nodes made so far are an ordinary LListCursor and the rest of the
+    items are still in the source; only the first item is read when the list
+    is made, since the _cursor must point to it
+
+    what reads the source:
+
+        - cursorForward, __iter__, removeItemAtCursor and removeItemAtHead
+        read one more item when they reach the last node made so far, so a
+        consumer that walks the _cursor or removes from the head holds only
+        the items it has not removed yet
+
+        - positional access reads up to the position asked for;
+        removeManyAtHead and removeRangeFromCursor read up to the end of the
+        range
+
+        - __contains__, cursorToItem and removeItem read until they find
+        the item
+
+        - len(), itemAtTail, insertAtTail, removeItemAtTail, extend,
+        splice, +=, count, sort, snapshot, negative positions and newCursor
+        read the whole source first, since they need the real end of the
+        list; so does anything built on them, such as +, pmap and LazyConcat
+
+    bool(list) only reads the first item; insertAtHead, insertAfterCursor,
+    insertManyAfterCursor, extendLeft, itemAtHead, itemAtCursor and the
+    other cursor moves never read it; observers and memoryUsage only see
+    the nodes made so far
+
+    besides the LListCursor invariant, while the source is not used up the
+    list holds at least one node, so it is never empty while items remain
+    """
+
+    def __init__(self, source: Iterable[Any] = (), lazy: bool = True, **options):
+        """
+        makes a list that reads its items from source as they are needed; the _cursor
+        will be the first item
+        :param source: iterable of the items; it is read at most once
+        :param lazy: accepted so LListCursor(source, lazy=True) can pass it through
+        :param options: other LListCursor options such as pool and indexed
+        """
+        # set before LListCursor.__init__, whose extend call checks it
+        self._source: Optional[Iterator[Any]] = None
+        super().__init__(**options)
+        self._source = iter(source)
+        self._pull()
+
+    def _pull(self) -> bool:
+        """
+        reads the next item from the source onto the end of the nodes made so far
+        :return: True if an item was read, False if the source is used up
+        """
+        if self._source is None:
+            return False
+        for item in self._source:
+            LListCursor.insertAtTail(self, item)
+            return True
+        self._source = None
+        return False
+
+    def _pullUntil(self, length: int) -> None:
+        """
+        reads items until length nodes are made or the source is used up
+        """
+        while self._length < length and self._pull():
+            pass
+
+    def materialize(self) -> LazyLListCursor:
+        """
+        reads the rest of the source, leaving an ordinary list
+        :return: self
+        """
+        if self._source is not None:
+            source = self._source
+            self._source = None
+            LListCursor.extend(self, source)
+        return self
+
+    def isMaterialized(self) -> bool:
+        """
+        :return: True once the whole source has been read
+        """
+        return self._source is None
+
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """
+        reads the whole source
+        :return: number of items in the list
+        """
+        self.materialize()
+        return self._length
+
+    def __bool__(self) -> bool:
+        """
+        :return: True if the list has an item; never reads past the first one
+        """
+        return self._length > 0
+
+    def __iter__(self):
+        """
+        iterates over items in list yielding one item at a time, reading the source as
+        the walk reaches the last node made so far; the nodes stay in the list
+        """
+        node = self._head
+        while node is not None:
+            yield node.item
+            if node.link is None:
+                self._pull()
+            node = node.link
+
+    def __iadd__(self, other: Iterable[Any]) -> LazyLListCursor:
+        """
+        reads the whole source, then appends other; see LListCursor.__iadd__
+        """
+        self.materialize()
+        return super().__iadd__(other)
+
+    def splice(self, other: LListCursor) -> None:
+        """
+        reads the whole source, then moves all the nodes of other to the end of self;
+        see LListCursor.splice
+        """
+        self.materialize()
+        super().splice(other)
+
+    def snapshot(self) -> LListSnapshot:
+        """
+        reads the whole source, so the snapshot holds every item, then makes a read-only
+        view of the items; see LListCursor.snapshot
+        """
+        self.materialize()
+        return super().snapshot()
+
+    def newCursor(self) -> CursorHandle:
+        """
+        reads the whole source, since handles walk the nodes directly, then makes an
+        extra cursor; see LListCursor.newCursor
+        """
+        self.materialize()
+        return super().newCursor()
+
+    # ------------------------------------------------------------------
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        insert item after the _cursor position, before any items not read yet
+        :param item: value to insert
+        :return: None
+        """
+        if self._cursor is self._tail and self._source is not None:
+            LListCursor.insertAtTail(self, item)
+        else:
+            super().insertAfterCursor(item)
+
+    def insertAtTail(self, item: Any) -> None:
+        """
+        reads the whole source, then inserts item at the end of the list
+        """
+        self.materialize()
+        super().insertAtTail(item)
+
+    def removeItemAtHead(self) -> Any:
+        """
+        removes first item in the list; see LListCursor.removeItemAtHead
+        """
+        # keep a node for the _cursor to move to if the head is the only one made
+        if self._head is self._tail:
+            self._pull()
+        return super().removeItemAtHead()
+
+    def removeItemAtCursor(self) -> Any:
+        """
+        removes item in the list that is at the _cursor; see LListCursor.removeItemAtCursor
+        """
+        # the item after the _cursor may not be read yet
+        if self._cursor is self._tail:
+            self._pull()
+        return super().removeItemAtCursor()
+
+    def removeItemAtTail(self) -> Any:
+        """
+        reads the whole source, then removes the last item in the list
+        """
+        self.materialize()
+        return super().removeItemAtTail()
+
+    def itemAtTail(self) -> Any:
+        """
+        reads the whole source, then returns the last item
+        """
+        self.materialize()
+        return super().itemAtTail()
+
+    def cursorForward(self) -> bool:
+        """
+        move _cursor forward one item, reading it from the source if needed
+        :return: True if _cursor was moved forward or False if list empty or _cursor already at end of list
+        """
+        if self._cursor is self._tail:
+            self._pull()
+        return super().cursorForward()
+
+    # ------------------------------------------------------------------
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        reads the whole source, then inserts items at the end of the list in order
+        """
+        self.materialize()
+        super().extend(items)
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        """
+        removes the first count items; see LListCursor.removeManyAtHead
+        """
+        # one more than count so a node is left while the source has items
+        self._pullUntil(count + 1)
+        return super().removeManyAtHead(count)
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        """
+        removes count items starting with the item at the _cursor; see
+        LListCursor.removeRangeFromCursor
+        """
+        if count > 0 and self._source is not None:
+            # read until there are count nodes after the _cursor, or the source runs out
+            after = 0
+            node = self._cursor
+            while node is not None and after < count:
+                if node.link is None and not self._pull():
+                    break
+                node = node.link
+                after += 1
+        return super().removeRangeFromCursor(count)
+
+    def _findNode(self, item: Any) -> Optional[ListNode]:
+        # reads the source only until a match turns up
+        node = super()._findNode(item)
+        while node is None and self._pull():
+            if self._tail.item is item or self._tail.item == item:
+                node = self._tail
+        return node
+
+    def removeItem(self, item: Any) -> Any:
+        """
+        removes one item equal to item, reading the source until it is found; see
+        LListCursor.removeItem
+        """
+        node = self._findNode(item)
+        if node is None:
+            raise ValueError(f'removeItem: {item!r} is not in the LListCursor')
+        if node is self._tail:
+            # keep a node after it while the source has items
+            self._pull()
+        return self._removeRun(node, 1)[0]
+
+    def count(self, item: Any) -> int:
+        """
+        reads the whole source, then counts the items equal to item
+        """
+        self.materialize()
+        return super().count(item)
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        reads the whole source, then sorts the list in place; see LListCursor.sort
+        """
+        self.materialize()
+        super().sort(key, reverse)
+
+    def _checkPosition(self, position: int, method: str) -> int:
+        if position < 0:
+            self.materialize()
+        else:
+            self._pullUntil(position + 1)
+        return super()._checkPosition(position, method)
+
+# ----------------------------------------------------------------------
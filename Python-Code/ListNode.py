@@ -1,4 +1,57 @@
 class ListNode:
-    def __init__(self, x):
+    # slots instead of a per-instance __dict__ keeps each node small on large lists
+    __slots__ = ('item', 'link', 'prev')
+
+    def __init__(self, x, link=None, prev=None):
         self.item = x
-        self.link = None
\ No newline at end of file
+        self.link = link
+        # back-link to the previous node so removals do not need to walk from the head
+        self.prev = prev
+
+
+class NodePool:
+    """free list of ListNodes so lists with heavy insert/remove churn can reuse
+    nodes instead of allocating new ones; one pool can be shared by several lists"""
+
+    def __init__(self, maxSize: int = 1024):
+        """
+        :param maxSize: most unused nodes the pool keeps; extra released nodes are dropped
+        """
+        if maxSize < 0:
+            raise ValueError('maxSize must not be negative')
+        self.maxSize = maxSize
+        # unused nodes with all fields cleared; LListCursor pops and appends these
+        # directly on its hot paths, counting hits itself
+        self.freeNodes = []
+        # takes served from the free list / takes that had to allocate a new node
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        :return: number of unused nodes in the pool
+        """
+        return len(self.freeNodes)
+
+    def take(self, x, link=None, prev=None) -> ListNode:
+        """
+        returns a node holding x, reusing a released node when one is available
+        """
+        if self.freeNodes:
+            self.hits += 1
+            node = self.freeNodes.pop()
+            node.item = x
+            node.link = link
+            node.prev = prev
+            return node
+        self.misses += 1
+        return ListNode(x, link, prev)
+
+    def release(self, node: ListNode) -> None:
+        """
+        gives an unlinked node back to the pool; its fields are cleared so the pool
+        does not keep the item or its neighbours alive
+        """
+        if len(self.freeNodes) < self.maxSize:
+            node.item = node.link = node.prev = None
+            self.freeNodes.append(node)
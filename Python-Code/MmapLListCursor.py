@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# MmapLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Dict, Iterable, List, Tuple
+import mmap
+import os
+import pickle
+import struct
+import sys
+
+from LListCursor import LListCursor
+
+
+# ----------------------------------------------------------------------
+
+# start of the node file: magic, head, tail, cursor, length, slots used,
+# first free slot, end of the item data
+_MAGIC = b'LLCMMAP1'
+_HEADER = struct.Struct('<8s7q')
+# one node: offset and size of its pickled item, link and prev slots
+_NODE = struct.Struct('<4q')
+_FIELD = struct.Struct('<q')
+_LINK = 16
+_PREV = 24
+# slot number that stands for None
+_NIL = -1
+
+
+class MmapPosition:
+    """read-only handle on one node of an MmapLListCursor; stands in for
+    the ListNode that _head, _cursor and _tail refer to in LListCursor"""
+    __slots__ = ('owner', 'slot')
+
+    def __init__(self, owner: MmapLListCursor, slot: int):
+        self.owner = owner
+        self.slot = slot
+
+    @property
+    def item(self) -> Any:
+        return self.owner._item(self.slot)
+
+    @property
+    def link(self) -> Optional[MmapPosition]:
+        return self.owner._position(self.owner._link(self.slot))
+
+    @property
+    def prev(self) -> Optional[MmapPosition]:
+        return self.owner._position(self.owner._prev(self.slot))
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, MmapPosition) and self.owner is other.owner
+                and self.slot == other.slot)
+
+    def __hash__(self) -> int:
+        return hash((id(self.owner), self.slot))
+
+
+# ----------------------------------------------------------------------
+
+
+class MmapLListCursor:
+    """MmapLListCursor has the same API and class invariant as LListCursor
+    but keeps its nodes in a memory-mapped file, so a list survives the
+    process and opening it again does not rebuild it; the OS pages the file
+    in as nodes are visited
+
+    path holds a header and fixed-size node records (item offset and size,
+    link and prev slot numbers); path + '.items' holds the pickled items;
+    both files double in size when they fill up, so inserts stay O(1)
+    amortized; a removed node's slot is reused, but its item bytes are only
+    reclaimed by compact()
+
+    every change updates the header in the mapped file, so the list on disk
+    is complete after each call; flush() asks the OS to write it out now;
+    since items are pickled, only open files from a trusted source
+
+    storage invariant:
+
+        1. self._headSlot, self._cursorSlot and self._tailSlot are _NIL
+        if the list is empty and node slots otherwise
+
+        2. slots self._used and above have never been used, and the slots
+        of removed nodes form a chain through their link fields starting
+        at self._free
+
+        3. the header in the node file matches the attributes after every
+        public call
+    """
+
+    # node slots in a new file
+    INITIAL_CAPACITY = 1024
+
+    # ------------------------------------------------------------------
+
+    def __init__(self, *args, path: str, mode: str = 'w'):
+        """
+        creates or opens the list stored at path; when creating, the list holds the items
+        in args and the _cursor will be the first item; when opening, the _cursor is where
+        it was left
+        :param args: sequence of items to insert into a new list
+        :param path: file holding the nodes; the items go in path + '.items'
+        :param mode: 'w' creates a new list, replacing any file at path; 'r+' opens an
+        existing one
+        """
+        if mode not in ('w', 'r+'):
+            raise ValueError(f"mode must be 'w' or 'r+', not {mode!r}")
+        self._path = path
+        if mode == 'r+':
+            if args:
+                raise ValueError('items can only be given when creating an MmapLListCursor')
+            self._open()
+            return
+        self._create()
+        # same argument handling as LListCursor
+        if len(args) == 1:
+            try:
+                items = iter(args[0])
+            except TypeError:
+                self.insertAtTail(args[0])
+            else:
+                self.extend(items)
+        else:
+            self.extend(args)
+        self.cursorToStart()
+
+    @classmethod
+    def open(cls, path: str) -> MmapLListCursor:
+        """
+        opens an existing list without reading its nodes
+        :param path: file holding the nodes
+        :return: the list
+        """
+        return cls(path=path, mode='r+')
+
+    def _create(self) -> None:
+        self._nodeFile = open(self._path, 'w+b')
+        self._itemFile = open(self._path + '.items', 'w+b')
+        self._nodeFile.truncate(_HEADER.size + self.INITIAL_CAPACITY * _NODE.size)
+        self._itemFile.truncate(mmap.PAGESIZE)
+        self._nodes = mmap.mmap(self._nodeFile.fileno(), 0)
+        self._items = mmap.mmap(self._itemFile.fileno(), 0)
+        self._headSlot = self._cursorSlot = self._tailSlot = _NIL
+        self._length = 0
+        self._used = 0
+        self._free = _NIL
+        self._itemsEnd = 0
+        self._writeHeader()
+
+    def _open(self) -> None:
+        self._nodeFile = open(self._path, 'r+b')
+        self._itemFile = open(self._path + '.items', 'r+b')
+        self._nodes = mmap.mmap(self._nodeFile.fileno(), 0)
+        self._items = mmap.mmap(self._itemFile.fileno(), 0)
+        (magic, self._headSlot, self._tailSlot, self._cursorSlot, self._length,
+         self._used, self._free, self._itemsEnd) = _HEADER.unpack_from(self._nodes, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f'{self._path} is not an MmapLListCursor file')
+
+    def _writeHeader(self) -> None:
+        _HEADER.pack_into(self._nodes, 0, _MAGIC, self._headSlot, self._tailSlot, self._cursorSlot,
+                          self._length, self._used, self._free, self._itemsEnd)
+
+    def flush(self) -> None:
+        """
+        writes the mapped files out to disk
+        :return: None
+        """
+        self._nodes.flush()
+        self._items.flush()
+
+    def close(self) -> None:
+        """
+        flushes and closes the files; the list cannot be used afterwards
+        :return: None
+        """
+        if self._nodes.closed:
+            return
+        self.flush()
+        self._nodes.close()
+        self._items.close()
+        self._nodeFile.close()
+        self._itemFile.close()
+
+    def __enter__(self) -> MmapLListCursor:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _remap(file, mapped: mmap.mmap, size: int) -> mmap.mmap:
+        """
+        grows file to size and maps it again; mmap.resize is not available everywhere
+        :return: the new map
+        """
+        mapped.close()
+        file.truncate(size)
+        return mmap.mmap(file.fileno(), 0)
+
+    def _item(self, slot: int) -> Any:
+        offset, size = struct.unpack_from('<2q', self._nodes, _HEADER.size + slot * _NODE.size)
+        return pickle.loads(self._items[offset:offset + size])
+
+    def _link(self, slot: int) -> int:
+        return _FIELD.unpack_from(self._nodes, _HEADER.size + slot * _NODE.size + _LINK)[0]
+
+    def _prev(self, slot: int) -> int:
+        return _FIELD.unpack_from(self._nodes, _HEADER.size + slot * _NODE.size + _PREV)[0]
+
+    def _setLink(self, slot: int, link: int) -> None:
+        _FIELD.pack_into(self._nodes, _HEADER.size + slot * _NODE.size + _LINK, link)
+
+    def _setPrev(self, slot: int, prev: int) -> None:
+        _FIELD.pack_into(self._nodes, _HEADER.size + slot * _NODE.size + _PREV, prev)
+
+    def _position(self, slot: int) -> Optional[MmapPosition]:
+        return None if slot == _NIL else MmapPosition(self, slot)
+
+    def _storeItem(self, item: Any) -> Tuple[int, int]:
+        """
+        appends the pickled item to the item file
+        :return: offset and size of the pickled bytes
+        """
+        data = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        offset = self._itemsEnd
+        end = offset + len(data)
+        if end > len(self._items):
+            self._items = self._remap(self._itemFile, self._items, max(2 * len(self._items), end))
+        self._items[offset:end] = data
+        self._itemsEnd = end
+        return offset, len(data)
+
+    def _newNode(self, item: Any, link: int = _NIL, prev: int = _NIL) -> int:
+        """
+        stores item in a free slot, or a new one at the end of the node file
+        :return: the slot
+        """
+        offset, size = self._storeItem(item)
+        if self._free != _NIL:
+            slot = self._free
+            self._free = self._link(slot)
+        else:
+            slot = self._used
+            self._used += 1
+            if _HEADER.size + self._used * _NODE.size > len(self._nodes):
+                self._nodes = self._remap(self._nodeFile, self._nodes,
+                                          _HEADER.size + 2 * (len(self._nodes) - _HEADER.size))
+        _NODE.pack_into(self._nodes, _HEADER.size + slot * _NODE.size, offset, size, link, prev)
+        return slot
+
+    def _freeNode(self, slot: int) -> None:
+        self._setLink(slot, self._free)
+        self._free = slot
+
+    # ------------------------------------------------------------------
+
+    @property
+    def _head(self) -> Optional[MmapPosition]:
+        return self._position(self._headSlot)
+
+    @property
+    def _cursor(self) -> Optional[MmapPosition]:
+        return self._position(self._cursorSlot)
+
+    @property
+    def _tail(self) -> Optional[MmapPosition]:
+        return self._position(self._tailSlot)
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the list
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        iterates over items in list yielding one item at a time
+        """
+        slot = self._headSlot
+        while slot != _NIL:
+            yield self._item(slot)
+            slot = self._link(slot)
+
+    def __add__(self, other) -> LListCursor:
+        """
+        returns a new list that is the concatenation of self and other; it is an in-memory
+        LListCursor since a persistent one would need a path
+        :param other: another list to concatenate with self
+        :return: a new LListCursor; the _cursor of it is at the beginning of the list
+        """
+        newList = LListCursor(self)
+        newList.extend(other)
+        return newList
+
+    def __iadd__(self, other) -> MmapLListCursor:
+        """
+        appends other to self; another MmapLListCursor is emptied as splice does, while any
+        other iterable is copied by extend
+        :param other: list or iterable of items to append
+        :return: self
+        """
+        if isinstance(other, MmapLListCursor):
+            self.splice(other)
+        else:
+            self.extend(other)
+        return self
+
+    def splice(self, other) -> None:
+        """
+        moves all the items of other to the end of self, leaving other empty; the items are
+        copied since the nodes of two lists live in different files; the _cursor of self only
+        changes if self was empty, in which case it points to the first moved item; ValueError
+        is raised if other is self
+        :param other: list whose items are moved
+        :return: None
+        """
+        if other is self:
+            raise ValueError('cannot splice an LListCursor into itself')
+        self.extend(other)
+        other.removeManyAtHead(len(other))
+
+    def memoryUsage(self) -> Dict[str, int]:
+        """
+        reports the size of the list's structure; the node records are in the mapped file,
+        not the Python heap, and are only resident once the OS has paged them in
+        :return: dict with the keys of LListCursor.memoryUsage and fileBytes, the size of
+        both mapped files
+        """
+        nodeBytes = self._length * _NODE.size
+        listBytes = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        return {
+            'nodes': self._length,
+            'bytesPerNode': _NODE.size,
+            'nodeBytes': nodeBytes,
+            'listBytes': listBytes,
+            'totalBytes': nodeBytes + listBytes,
+            'fileBytes': len(self._nodes) + len(self._items),
+        }
+
+    def compact(self) -> None:
+        """
+        rewrites the files with the nodes in list order and without the bytes of removed
+        items; the _cursor stays on the same item
+        :return: None
+        """
+        position = self.cursorIndex() if self._length else 0
+        tempPath = self._path + '.compact'
+        fresh = MmapLListCursor(path=tempPath)
+        fresh.extend(self)
+        fresh.close()
+        self.close()
+        os.replace(tempPath, self._path)
+        os.replace(tempPath + '.items', self._path + '.items')
+        self._open()
+        if self._length:
+            self.cursorTo(position)
+
+    # ------------------------------------------------------------------
+
+    def insertAtHead(self, item: Any) -> None:
+        """
+        inserts item at the beginning of the list
+        :param item: value to insert
+        :return: None
+        """
+        slot = self._newNode(item, self._headSlot)
+        if self._length == 0:
+            self._tailSlot = self._cursorSlot = slot
+        else:
+            self._setPrev(self._headSlot, slot)
+        self._headSlot = slot
+        self._length += 1
+        self._writeHeader()
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        insert item after the _cursor position
+        :param item: value to insert
+        :return: None
+        """
+        if self._cursorSlot == self._tailSlot:
+            self.insertAtTail(item)
+            return
+        nextSlot = self._link(self._cursorSlot)
+        slot = self._newNode(item, nextSlot, self._cursorSlot)
+        self._setPrev(nextSlot, slot)
+        self._setLink(self._cursorSlot, slot)
+        self._length += 1
+        self._writeHeader()
+
+    def _appendNode(self, item: Any) -> None:
+        """
+        links a node holding item after the _tail without updating the header
+        """
+        slot = self._newNode(item, _NIL, self._tailSlot)
+        if self._length == 0:
+            self._headSlot = self._cursorSlot = slot
+        else:
+            self._setLink(self._tailSlot, slot)
+        self._tailSlot = slot
+        self._length += 1
+
+    def insertAtTail(self, item: Any) -> None:
+        """
+        insert item at the end of the list
+        :param item: value to insert
+        :return: None
+        """
+        self._appendNode(item)
+        self._writeHeader()
+
+    def removeItemAtHead(self) -> Any:
+        """
+        removes first item in the list; IndexError is raised if list is empty
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtHead called on empty LListCursor')
+        slot = self._headSlot
+        item = self._item(slot)
+        self._length -= 1
+        if self._length == 0:
+            self._headSlot = self._cursorSlot = self._tailSlot = _NIL
+        else:
+            self._headSlot = self._link(slot)
+            self._setPrev(self._headSlot, _NIL)
+            if self._cursorSlot == slot:
+                self._cursorSlot = self._headSlot
+        self._freeNode(slot)
+        self._writeHeader()
+        return item
+
+    def removeItemAtCursor(self) -> Any:
+        """
+        removes item in the list that is at the _cursor; IndexError is raised if list is empty;
+        the _cursor now points to the node after the original _cursor unless the _cursor was the
+        last item in which case the _cursor is now the new last item
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtCursor called on empty LListCursor')
+        if self._cursorSlot == self._tailSlot:
+            return self.removeItemAtTail()
+        if self._cursorSlot == self._headSlot:
+            return self.removeItemAtHead()
+        slot = self._cursorSlot
+        item = self._item(slot)
+        prevSlot = self._prev(slot)
+        nextSlot = self._link(slot)
+        self._setLink(prevSlot, nextSlot)
+        self._setPrev(nextSlot, prevSlot)
+        self._cursorSlot = nextSlot
+        self._length -= 1
+        self._freeNode(slot)
+        self._writeHeader()
+        return item
+
+    def removeItemAtTail(self) -> Any:
+        """
+        removes last item in the list; IndexError is raised if list is empty
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtTail called on empty LListCursor')
+        slot = self._tailSlot
+        item = self._item(slot)
+        self._length -= 1
+        if self._length == 0:
+            self._headSlot = self._cursorSlot = self._tailSlot = _NIL
+        else:
+            self._tailSlot = self._prev(slot)
+            self._setLink(self._tailSlot, _NIL)
+            if self._cursorSlot == slot:
+                self._cursorSlot = self._tailSlot
+        self._freeNode(slot)
+        self._writeHeader()
+        return item
+
+    def itemAtHead(self) -> Any:
+        """
+        returns first item; IndexError is raised if list is empty
+        :return: first item in list
+        """
+        if self._length == 0:
+            raise IndexError('itemAtHead called on empty LListCursor')
+        return self._item(self._headSlot)
+
+    def itemAtCursor(self) -> Any:
+        """
+        returns item at _cursor; IndexError is raised if list is empty
+        :return: item at _cursor
+        """
+        if self._length == 0:
+            raise IndexError('itemAtCursor called on empty LListCursor')
+        return self._item(self._cursorSlot)
+
+    def itemAtTail(self) -> Any:
+        """
+        returns last item; IndexError is raised if list is empty
+        :return: last item in list
+        """
+        if self._length == 0:
+            raise IndexError('itemAtTail called on empty LListCursor')
+        return self._item(self._tailSlot)
+
+    def cursorToStart(self) -> None:
+        """
+        move _cursor to start/_head of list
+        :return:
+        """
+        self._cursorSlot = self._headSlot
+        self._writeHeader()
+
+    def cursorForward(self) -> bool:
+        """
+        move _cursor forward one item
+        :return: True if _cursor was moved forward or False if list empty or _cursor already at end of list
+        """
+        if self._length == 0 or self._cursorSlot == self._tailSlot:
+            return False
+        self._cursorSlot = self._link(self._cursorSlot)
+        self._writeHeader()
+        return True
+
+    def cursorBackward(self) -> bool:
+        """
+        move _cursor back one item
+        :return: True if _cursor was moved back or False if list empty or _cursor already at start of list
+        """
+        if self._length == 0 or self._cursorSlot == self._headSlot:
+            return False
+        self._cursorSlot = self._prev(self._cursorSlot)
+        self._writeHeader()
+        return True
+
+    # ------------------------------------------------------------------
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the end of the list in order, writing the header once at the end
+        :param items: values to insert
+        :return: None
+        """
+        for x in items:
+            self._appendNode(x)
+        self._writeHeader()
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the beginning of the list, keeping their order, so the first of
+        items becomes the new head
+        :param items: values to insert
+        :return: None
+        """
+        items = list(items)
+        if self._length == 0:
+            # the _cursor should end up on the first item, as with LListCursor
+            self.extend(items)
+            return
+        for x in reversed(items):
+            self.insertAtHead(x)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        """
+        inserts items in order after the _cursor position
+        :param items: values to insert
+        :return: None
+        """
+        items = list(items)
+        if self._length == 0:
+            self.extend(items)
+            return
+        for x in reversed(items):
+            self.insertAfterCursor(x)
+
+    def _checkCount(self, count: int, available: int, method: str) -> None:
+        """
+        raises ValueError if count is negative or IndexError if it is more than available
+        """
+        if count < 0:
+            raise ValueError(f'{method} called with negative count {count}')
+        if count > available:
+            raise IndexError(f'{method} called with {count} items but only {available} available')
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        """
+        removes the first count items; IndexError is raised if the list has fewer items and
+        ValueError if count is negative; a _cursor on a removed item moves to the new _head
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        self._checkCount(count, self._length, 'removeManyAtHead')
+        return [self.removeItemAtHead() for i in range(count)]
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        """
+        removes count items starting with the item at the _cursor; IndexError is raised if
+        there are fewer than count items from the _cursor to the _tail and ValueError if count
+        is negative; the _cursor now points to the item after the removed items unless they
+        ran to the end of the list in which case it points to the item before them
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        if count == 0:
+            return []
+        # count the items from the cursor to the tail, stopping once there are enough
+        available = 0
+        slot = self._cursorSlot
+        while slot != _NIL and available < count:
+            available += 1
+            slot = self._link(slot)
+        self._checkCount(count, available, 'removeRangeFromCursor')
+        return [self.removeItemAtCursor() for i in range(count)]
+
+    # ------------------------------------------------------------------
+
+    def _checkPosition(self, position: int, method: str) -> int:
+        """
+        turns a negative position into one counted from the start, as Python lists do
+        :return: the position counted from the start; IndexError is raised if it is out of range
+        """
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(f'{method} position out of range for LListCursor of length {self._length}')
+        return position
+
+    def _slotAt(self, position: int) -> int:
+        """
+        :param position: position counted from the start, already checked
+        :return: slot of the node at position, walking from the nearer end
+        """
+        if position < self._length // 2:
+            slot = self._headSlot
+            for i in range(position):
+                slot = self._link(slot)
+        else:
+            slot = self._tailSlot
+            for i in range(self._length - 1 - position):
+                slot = self._prev(slot)
+        return slot
+
+    def __getitem__(self, position: int) -> Any:
+        """
+        returns the item at position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position of the item
+        :return: the item
+        """
+        return self._item(self._slotAt(self._checkPosition(position, '__getitem__')))
+
+    def __setitem__(self, position: int, item: Any) -> None:
+        """
+        replaces the item at position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position of the item
+        :param item: new value
+        :return: None
+        """
+        slot = self._slotAt(self._checkPosition(position, '__setitem__'))
+        offset, size = self._storeItem(item)
+        struct.pack_into('<2q', self._nodes, _HEADER.size + slot * _NODE.size, offset, size)
+        self._writeHeader()
+
+    def cursorTo(self, position: int) -> None:
+        """
+        moves the _cursor to position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position to move the _cursor to
+        :return: None
+        """
+        self._cursorSlot = self._slotAt(self._checkPosition(position, 'cursorTo'))
+        self._writeHeader()
+
+    def cursorIndex(self) -> int:
+        """
+        returns the position of the _cursor, counting from 0; IndexError is raised if
+        the list is empty
+        :return: position of the _cursor
+        """
+        if self._length == 0:
+            raise IndexError('cursorIndex called on empty LListCursor')
+        position = 0
+        slot = self._cursorSlot
+        while slot != self._headSlot:
+            slot = self._prev(slot)
+            position += 1
+        return position
+
+# ----------------------------------------------------------------------
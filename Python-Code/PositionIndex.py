@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# PositionIndex.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Callable, Dict, Tuple
+import random
+
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class _TreapNode:
+    """node of the implicit treap; its position is the number of nodes
+    before it in an in-order walk, so positions never need to be stored"""
+    __slots__ = ('listNode', 'left', 'right', 'parent', 'priority', 'size')
+
+    def __init__(self, listNode: ListNode, priority: float):
+        self.listNode = listNode
+        self.left: Optional[_TreapNode] = None
+        self.right: Optional[_TreapNode] = None
+        self.parent: Optional[_TreapNode] = None
+        self.priority = priority
+        self.size = 1
+
+
+def _size(t: Optional[_TreapNode]) -> int:
+    return 0 if t is None else t.size
+
+
+def _update(t: _TreapNode) -> None:
+    """recomputes t.size and points t's children back at t"""
+    t.size = 1
+    if t.left is not None:
+        t.size += t.left.size
+        t.left.parent = t
+    if t.right is not None:
+        t.size += t.right.size
+        t.right.parent = t
+
+
+def _merge(a: Optional[_TreapNode], b: Optional[_TreapNode]) -> Optional[_TreapNode]:
+    """joins two treaps with every node of a before every node of b"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _split(t: Optional[_TreapNode], count: int) -> Tuple[Optional[_TreapNode], Optional[_TreapNode]]:
+    """splits t into the first count nodes and the rest"""
+    if t is None:
+        return None, None
+    if _size(t.left) >= count:
+        left, t.left = _split(t.left, count)
+        _update(t)
+        if left is not None:
+            left.parent = None
+        return left, t
+    t.right, right = _split(t.right, count - _size(t.left) - 1)
+    _update(t)
+    if right is not None:
+        right.parent = None
+    return t, right
+
+
+# ----------------------------------------------------------------------
+
+
+class PositionIndex:
+    """PositionIndex keeps the position of every node of an LListCursor in an
+    implicit treap (a randomized balanced binary tree ordered by position), so
+    finding the node at a position and the position of a node both take
+    O(log n) expected time
+
+    it is an LListCursor observer, so the list's inserts and removes keep it
+    up to date at O(log n) per node
+    """
+
+    def __init__(self, head: Optional[ListNode] = None, seed: Optional[int] = None):
+        """
+        builds the index for the nodes from head to the end of its chain in O(n)
+        :param head: first node of the list being indexed, or None if it is empty
+        :param seed: optional seed for the treap priorities
+        """
+        self._random = random.Random(seed)
+        self._treeNodes: Dict[ListNode, _TreapNode] = {}
+        self._root: Optional[_TreapNode] = None
+        node = head
+        while node is not None and node.link is not None:
+            node = node.link
+        if head is not None:
+            self._root = self._build(head, node)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def _build(self, first: ListNode, last: ListNode) -> _TreapNode:
+        """
+        builds a treap over the chain first..last in O(k) with the usual stack
+        construction of a Cartesian tree
+        :return: root of the new treap
+        """
+        stack = []
+        node = first
+        while True:
+            t = _TreapNode(node, self._random.random())
+            self._treeNodes[node] = t
+            lastPopped = None
+            while stack and stack[-1].priority < t.priority:
+                lastPopped = stack.pop()
+            t.left = lastPopped
+            if stack:
+                stack[-1].right = t
+            stack.append(t)
+            if node is last:
+                break
+            node = node.link
+        # sizes and parents are fixed bottom up, popping finishes each right spine
+        self._fixSizes(stack[0])
+        stack[0].parent = None
+        return stack[0]
+
+    def _fixSizes(self, root: _TreapNode) -> None:
+        """
+        recomputes sizes and parents for the whole treap under root without recursion
+        """
+        order = []
+        todo = [root]
+        while todo:
+            t = todo.pop()
+            order.append(t)
+            if t.left is not None:
+                todo.append(t.left)
+            if t.right is not None:
+                todo.append(t.right)
+        for t in reversed(order):
+            _update(t)
+
+    def _rank(self, t: _TreapNode) -> int:
+        """
+        :return: position of treap node t, counting from 0
+        """
+        rank = _size(t.left)
+        while t.parent is not None:
+            if t.parent.right is t:
+                rank += _size(t.parent.left) + 1
+            t = t.parent
+        return rank
+
+    # ------------------------------------------------------------------
+
+    def position(self, node: ListNode) -> int:
+        """
+        :param node: node of the indexed list
+        :return: position of node, counting from 0
+        """
+        return self._rank(self._treeNodes[node])
+
+    def nodeAt(self, position: int) -> ListNode:
+        """
+        :param position: position in the list, 0 <= position < len(self)
+        :return: the node at position
+        """
+        t = self._root
+        while True:
+            leftSize = _size(t.left)
+            if position < leftSize:
+                t = t.left
+            elif position == leftSize:
+                return t.listNode
+            else:
+                position -= leftSize + 1
+                t = t.right
+
+    def partitionPoint(self, before: Callable[[ListNode], bool]) -> Optional[ListNode]:
+        """
+        finds where the list splits in two, as bisect does for a sorted Python list
+        :param before: test that is True for the nodes up to some position and False after it
+        :return: the first node for which before is False, or None if it is True for every node
+        """
+        found = None
+        t = self._root
+        while t is not None:
+            if before(t.listNode):
+                t = t.right
+            else:
+                found = t.listNode
+                t = t.left
+        return found
+
+    def nodesInserted(self, first: ListNode, last: ListNode, count: int) -> None:
+        """
+        observer call: adds the chain first..last, which is already linked into the list
+        """
+        chain = self._build(first, last)
+        position = 0 if first.prev is None else self.position(first.prev) + 1
+        left, right = _split(self._root, position)
+        self._root = _merge(_merge(left, chain), right)
+        self._root.parent = None
+
+    def nodesRemoving(self, first: ListNode, count: int) -> None:
+        """
+        observer call: drops the count nodes starting at first, which are still linked
+        """
+        position = self.position(first)
+        left, rest = _split(self._root, position)
+        middle, right = _split(rest, count)
+        self._root = _merge(left, right)
+        if self._root is not None:
+            self._root.parent = None
+        node = first
+        for i in range(count):
+            del self._treeNodes[node]
+            node = node.link
+
+    def nodesReordered(self, head: ListNode) -> None:
+        """
+        observer call: the same nodes were relinked in a new order starting at head; the
+        treap keeps its shape and its nodes are given the list nodes in the new order
+        """
+        stack = []
+        t = self._root
+        node = head
+        # in-order walk of the treap alongside the list
+        while stack or t is not None:
+            if t is not None:
+                stack.append(t)
+                t = t.left
+            else:
+                t = stack.pop()
+                t.listNode = node
+                self._treeNodes[node] = t
+                node = node.link
+                t = t.right
+
+# ----------------------------------------------------------------------
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# SortedLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Callable, Iterable
+
+from LListCursor import LListCursor
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class SortedLListCursor(LListCursor):
+    """SortedLListCursor is an LListCursor that keeps its items in order;
+    LListCursor(items, keepSorted=True, key=..., reverse=...) returns one
+
+    every insert puts its item at its ordered place, after any equal items,
+    whichever insert method is called; key and reverse are as in list.sort
+
+    it always keeps a PositionIndex, and finds the place for an item by
+    searching the index's treap, so an insert takes O(log n) expected time
+    instead of a walk; an item that goes after the _tail, as when items
+    arrive in order, is found in O(1); __contains__, cursorToItem and
+    removeItem search the same way unless there is a ValueIndex
+
+    inserting many items at once, or splicing a list in, adds them at the
+    end and sorts the whole list if there are at least as many new items as
+    old ones, and inserts them one at a time otherwise
+
+    __setitem__ raises ValueError if the new item does not fit between its
+    neighbours; calling sort sets a new key and reverse for later inserts
+
+    besides the LListCursor invariant, the items are in order by key
+    """
+
+    def __init__(self, *args, key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False, keepSorted: bool = True, **options):
+        """
+        makes a list of the items in args in sorted order; the _cursor will be the first item
+        :param args: items to insert, as for LListCursor
+        :param key: optional function giving the value to order each item by
+        :param reverse: if True keep the items in descending order
+        :param keepSorted: accepted so LListCursor(keepSorted=True) can pass it through
+        :param options: other LListCursor options such as pool and valueIndexed
+        """
+        self._key = key
+        self._reverse = reverse
+        options['indexed'] = True
+        super().__init__(*args, **options)
+
+    def _keyOf(self, item: Any) -> Any:
+        return item if self._key is None else self._key(item)
+
+    def _nodeAfter(self, item: Any) -> Optional[ListNode]:
+        """
+        :return: the first node that item goes before, after any equal items, or None if
+        item goes at the end
+        """
+        if self._length == 0:
+            return None
+        key = self._keyOf(item)
+        keyOf = self._keyOf
+        if self._reverse:
+            before = lambda node: not keyOf(node.item) < key
+        else:
+            before = lambda node: not key < keyOf(node.item)
+        if before(self._tail):
+            return None
+        return self._index.partitionPoint(before)
+
+    def insertSorted(self, item: Any) -> None:
+        """
+        inserts item at its ordered place, after any equal items; O(log n) expected
+        :param item: value to insert
+        :return: None
+        """
+        after = self._nodeAfter(item)
+        first, last, count = self._buildChain((item,))
+        self._spliceChain(first, last, count, self._tail if after is None else after.prev)
+
+    def _insertManySorted(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        if len(items) >= self._length:
+            # sorting everything is cheaper than searching for each place
+            LListCursor.extend(self, items)
+            LListCursor.sort(self, self._key, self._reverse)
+        else:
+            for item in items:
+                self.insertSorted(item)
+
+    # ------------------------------------------------------------------
+
+    def insertAtHead(self, item: Any) -> None:
+        """
+        inserts item at its ordered place, see insertSorted
+        """
+        self.insertSorted(item)
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        inserts item at its ordered place, see insertSorted
+        """
+        self.insertSorted(item)
+
+    def insertAtTail(self, item: Any) -> None:
+        """
+        inserts item at its ordered place, see insertSorted
+        """
+        self.insertSorted(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        inserts each of items at its ordered place
+        """
+        self._insertManySorted(items)
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        """
+        inserts each of items at its ordered place
+        """
+        self._insertManySorted(items)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        """
+        inserts each of items at its ordered place
+        """
+        self._insertManySorted(items)
+
+    def splice(self, other: LListCursor) -> None:
+        """
+        moves all the nodes of other into self at their ordered places, leaving other empty;
+        the _cursor of self only changes if self was empty; ValueError is raised if other
+        is self
+        :param other: list whose items are moved
+        :return: None
+        """
+        if other is self:
+            raise ValueError('cannot splice an LListCursor into itself')
+        if not isinstance(other, LListCursor):
+            super().splice(other)
+            return
+        if len(other) >= self._length:
+            super().splice(other)
+            LListCursor.sort(self, self._key, self._reverse)
+            return
+        # take the whole chain out of other, then link its nodes in one at a time
+        if other._observers:
+            other._notifyRemoving(other._head, other._length)
+        self._adoptSnapshots(other)
+        node = other._head
+        other._head = other._cursor = other._tail = None
+        other._length = 0
+        other._version += 1
+        try:
+            while node is not None:
+                after = self._nodeAfter(node.item)
+                nextNode = node.link
+                if nextNode is not None and self._snapshots:
+                    self._preserve(node)
+                node.link = node.prev = None
+                self._spliceChain(node, node, 1, self._tail if after is None else after.prev)
+                node = nextNode
+        except Exception:
+            # an item that cannot be ordered; the nodes not moved yet go back to other
+            node.prev = None
+            last, count = node, 1
+            while last.link is not None:
+                last = last.link
+                count += 1
+            other._spliceChain(node, last, count, None)
+            raise
+
+    def __setitem__(self, position: int, item: Any) -> None:
+        """
+        replaces the item at position; ValueError is raised if item is out of order there
+        :param position: position of the item
+        :param item: new value
+        :return: None
+        """
+        node = self._nodeAt(self._checkPosition(position, '__setitem__'))
+        key = self._keyOf(item)
+        neighbours = [node.prev, node.link]
+        if self._reverse:
+            neighbours.reverse()
+        lower, upper = neighbours
+        if ((lower is not None and key < self._keyOf(lower.item))
+                or (upper is not None and self._keyOf(upper.item) < key)):
+            raise ValueError(f'__setitem__: {item!r} is out of order at position {position}')
+        if self._observers:
+            self._notifyReplacing(node, item)
+        node.item = item
+        self._version += 1
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        sorts the list by a new key and order, which later inserts follow; see
+        LListCursor.sort
+        """
+        LListCursor.sort(self, key, reverse)
+        self._key = key
+        self._reverse = reverse
+
+    # ------------------------------------------------------------------
+
+    def _findNode(self, item: Any) -> Optional[ListNode]:
+        # items equal to item have equal keys, so only the run of equal keys is searched
+        if self._values is not None or self._length == 0:
+            return super()._findNode(item)
+        keyOf = self._keyOf
+        try:
+            key = keyOf(item)
+            if self._reverse:
+                node = self._index.partitionPoint(lambda node: key < keyOf(node.item))
+            else:
+                node = self._index.partitionPoint(lambda node: keyOf(node.item) < key)
+            while node is not None and not (key < keyOf(node.item) or keyOf(node.item) < key):
+                if node.item is item or node.item == item:
+                    return node
+                node = node.link
+        except TypeError:
+            # item cannot be ordered against the list's items, so look at every node
+            return super()._findNode(item)
+        return None
+
+# ----------------------------------------------------------------------
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# TypedLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is only needed for typed lists, so importing this module still works without it
+    np = None
+
+from UnrolledLListCursor import UnrolledLListCursor
+
+
+# ----------------------------------------------------------------------
+
+
+class _TypedBlock:
+    """fixed-capacity NumPy array used as the item store of one chunk; it has
+    the list operations UnrolledLListCursor uses on chunk.items, and returns
+    items as Python scalars"""
+    __slots__ = ('data', 'size')
+
+    def __init__(self, dtype, capacity: int, items: Iterable[Any] = ()):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return iter(self.data[:self.size].tolist())
+
+    def view(self):
+        """
+        :return: NumPy view of the items in the block, no copy
+        """
+        return self.data[:self.size]
+
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError('block index out of range')
+        return i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.size)
+            return _TypedBlock(self.data.dtype, len(self.data), self.data[start:stop])
+        return self.data[self._index(i)].item()
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        self.data[self._index(i)] = value
+
+    def __delitem__(self, i: slice) -> None:
+        # only used to cut the end off a chunk, as in del items[half:]
+        start, stop, step = i.indices(self.size)
+        if stop != self.size or step != 1:
+            raise ValueError('_TypedBlock only supports deleting a tail slice')
+        self.size = start
+
+    def append(self, value: Any) -> None:
+        self.data[self.size] = value
+        self.size += 1
+
+    def insert(self, i: int, value: Any) -> None:
+        # NumPy copies overlapping slices correctly, so this shifts the items up one place
+        self.data[i + 1:self.size + 1] = self.data[i:self.size]
+        self.data[i] = value
+        self.size += 1
+
+    def pop(self, i: int = -1) -> Any:
+        i = self._index(i)
+        value = self.data[i].item()
+        self.data[i:self.size - 1] = self.data[i + 1:self.size]
+        self.size -= 1
+        return value
+
+    def extend(self, items: Iterable[Any]) -> None:
+        if isinstance(items, _TypedBlock):
+            values = items.view()
+        elif isinstance(items, np.ndarray):
+            values = items
+        else:
+            values = list(items)
+        count = len(values)
+        self.data[self.size:self.size + count] = values
+        self.size += count
+
+
+# ----------------------------------------------------------------------
+
+
+class TypedLListCursor(UnrolledLListCursor):
+    """TypedLListCursor is an UnrolledLListCursor whose chunks are NumPy arrays
+    of one dtype, so numeric items are stored unboxed and contiguously; it
+    keeps the LListCursor API and class invariant and returns items as Python
+    scalars
+
+    sum, min, max, map and toArray work on whole chunks with NumPy instead of
+    visiting items one at a time
+
+    LListCursor(..., dtype=...) returns one; NumPy must be installed
+    """
+
+    # larger than UnrolledLListCursor since NumPy calls cost more per chunk
+    DEFAULT_CHUNK_SIZE = 1024
+
+    def __init__(self, *args, dtype: Any = 'float64', chunkSize: int = DEFAULT_CHUNK_SIZE):
+        """
+        initializes empty list or list with items in args if it is not None; the _cursor
+        will be the first item
+        :param args: sequence of items to insert into the list
+        :param dtype: NumPy dtype of the items, such as 'float64' or 'int64'
+        :param chunkSize: maximum number of items stored in one chunk; must be at least 2
+        """
+        if np is None:
+            raise ImportError('TypedLListCursor needs numpy; install it with pip install numpy')
+        self._dtype = np.dtype(dtype)
+        super().__init__(*args, chunkSize=chunkSize)
+
+    @property
+    def dtype(self):
+        """the NumPy dtype of the items"""
+        return self._dtype
+
+    def _newItems(self, items: Iterable[Any]) -> _TypedBlock:
+        return _TypedBlock(self._dtype, self._chunkSize, items)
+
+    def _newEmpty(self) -> TypedLListCursor:
+        return TypedLListCursor(dtype=self._dtype, chunkSize=self._chunkSize)
+
+    def _canRelink(self, other) -> bool:
+        return super()._canRelink(other) and other._dtype == self._dtype
+
+    def _views(self):
+        """
+        yields a NumPy view of the items of each chunk in order
+        """
+        chunk = self._first
+        while chunk is not None:
+            yield chunk.items.view()
+            chunk = chunk.link
+
+    def memoryUsage(self) -> Dict[str, int]:
+        """
+        reports the memory used by the list including its NumPy arrays, since the items
+        are stored in them
+        :return: dict with the same keys as LListCursor.memoryUsage; nodes is the number
+        of chunks and bytesPerNode is the average bytes per item
+        """
+        usage = super().memoryUsage()
+        arrayBytes = 0
+        chunk = self._first
+        while chunk is not None:
+            arrayBytes += sys.getsizeof(chunk.items.data)
+            chunk = chunk.link
+        usage['nodeBytes'] += arrayBytes
+        usage['totalBytes'] += arrayBytes
+        usage['bytesPerNode'] = usage['nodeBytes'] // self._length if self._length else 0
+        return usage
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the end of the list in order; a NumPy array is copied into the
+        chunks a slice at a time instead of item by item
+        :param items: values to insert
+        :return: None
+        """
+        if not isinstance(items, np.ndarray):
+            super().extend(items)
+            return
+        items = items.ravel()
+        start = 0
+        if self._length == 0 and len(items) > 0:
+            self._insertIntoEmpty(items[0].item())
+            start = 1
+        while start < len(items):
+            room = self._chunkSize - len(self._last.items)
+            if room == 0:
+                self._newChunkAfter(self._last, self._newItems([]))
+                room = self._chunkSize
+            piece = items[start:start + room]
+            self._last.items.extend(piece)
+            self._length += len(piece)
+            start += len(piece)
+
+    # ------------------------------------------------------------------
+
+    def toArray(self):
+        """
+        :return: a new NumPy array of all the items in order
+        """
+        if self._length == 0:
+            return np.empty(0, dtype=self._dtype)
+        return np.concatenate(list(self._views()))
+
+    def sum(self) -> Any:
+        """
+        :return: sum of the items, 0 for an empty list
+        """
+        total = self._dtype.type(0)
+        for view in self._views():
+            total += view.sum()
+        return total.item()
+
+    def min(self) -> Any:
+        """
+        :return: smallest item; ValueError is raised if the list is empty
+        """
+        if self._length == 0:
+            raise ValueError('min called on empty LListCursor')
+        return min(view.min() for view in self._views()).item()
+
+    def max(self) -> Any:
+        """
+        :return: largest item; ValueError is raised if the list is empty
+        """
+        if self._length == 0:
+            raise ValueError('max called on empty LListCursor')
+        return max(view.max() for view in self._views()).item()
+
+    def map(self, fn: Callable, dtype: Any = None) -> TypedLListCursor:
+        """
+        applies fn to the items a chunk at a time; fn is called with a NumPy array and must
+        return an array of the same length, as NumPy ufuncs and arithmetic do
+        :param fn: vectorized function
+        :param dtype: dtype of the result; the dtype fn returns if None
+        :return: a new TypedLListCursor of the results with the _cursor at the start
+        """
+        results = [np.asarray(fn(view)) for view in self._views()]
+        if dtype is None:
+            dtype = results[0].dtype if results else self._dtype
+        newList = TypedLListCursor(dtype=dtype, chunkSize=self._chunkSize)
+        for result in results:
+            newList.extend(result)
+        newList.cursorToStart()
+        return newList
+
+# ----------------------------------------------------------------------
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# UnrolledLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Dict, Iterable, List
+from itertools import islice
+import sys
+
+
+# ----------------------------------------------------------------------
+
+
+class _Chunk:
+    """node of an unrolled list; holds up to chunkSize items in a Python list"""
+    __slots__ = ('items', 'link', 'prev')
+
+    def __init__(self, items: List[Any], link=None, prev=None):
+        self.items = items
+        self.link = link
+        self.prev = prev
+
+
+class UnrolledPosition:
+    """read-only handle on one item of an UnrolledLListCursor; stands in for
+    the ListNode that _head, _cursor and _tail refer to in LListCursor"""
+    __slots__ = ('chunk', 'index')
+
+    def __init__(self, chunk: _Chunk, index: int):
+        self.chunk = chunk
+        self.index = index
+
+    @property
+    def item(self) -> Any:
+        return self.chunk.items[self.index]
+
+    @property
+    def link(self) -> Optional[UnrolledPosition]:
+        # the next item is in this chunk unless we are at the end of it
+        if self.index + 1 < len(self.chunk.items):
+            return UnrolledPosition(self.chunk, self.index + 1)
+        if self.chunk.link is not None:
+            return UnrolledPosition(self.chunk.link, 0)
+        return None
+
+    @property
+    def prev(self) -> Optional[UnrolledPosition]:
+        # the previous item is in this chunk unless we are at the start of it
+        if self.index > 0:
+            return UnrolledPosition(self.chunk, self.index - 1)
+        if self.chunk.prev is not None:
+            return UnrolledPosition(self.chunk.prev, len(self.chunk.prev.items) - 1)
+        return None
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, UnrolledPosition) and self.chunk is other.chunk
+                and self.index == other.index)
+
+    def __hash__(self) -> int:
+        return hash((id(self.chunk), self.index))
+
+
+# ----------------------------------------------------------------------
+
+
+class UnrolledLListCursor:
+    """UnrolledLListCursor has the same API and class invariant as LListCursor
+    but stores up to chunkSize items per node, so there are far fewer Python
+    objects and pointer chases per item
+
+    the _cursor is the pair self._cursorChunk, self._cursorIndex; _head,
+    _cursor and _tail are available as UnrolledPosition objects
+
+    storage invariant:
+
+        1. if the list is empty, self._first, self._last and
+        self._cursorChunk are None
+
+        2. no chunk is empty and no chunk holds more than self._chunkSize
+        items
+
+        3. self._cursorIndex is a valid index into self._cursorChunk.items
+    """
+
+    # default number of items per chunk
+    DEFAULT_CHUNK_SIZE = 64
+
+    # ------------------------------------------------------------------
+
+    def __init__(self, *args, chunkSize: int = DEFAULT_CHUNK_SIZE):
+        """
+        initializes empty list or list with items in args if it is not None; the _cursor
+        will be the first item
+        :param args: sequence of items to insert into the list
+        :param chunkSize: maximum number of items stored in one chunk; must be at least 2
+        """
+        if chunkSize < 2:
+            raise ValueError('chunkSize must be at least 2')
+        self._chunkSize: int = chunkSize
+        self._first: Optional[_Chunk] = None
+        self._last: Optional[_Chunk] = None
+        self._cursorChunk: Optional[_Chunk] = None
+        self._cursorIndex: int = 0
+        self._length: int = 0
+        # same argument handling as LListCursor
+        if len(args) == 1:
+            try:
+                items = iter(args[0])
+            except TypeError:
+                self.insertAtTail(args[0])
+            else:
+                self.extend(items)
+        else:
+            self.extend(args)
+        self.cursorToStart()
+
+    def __len__(self) -> int:
+        """
+        :return: number of items in the list
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        iterates over items in list yielding one item at a time
+        """
+        chunk = self._first
+        while chunk is not None:
+            yield from chunk.items
+            chunk = chunk.link
+
+    def __add__(self, other) -> UnrolledLListCursor:
+        """
+        returns a new UnrolledLListCursor that is the concatenation of self and other
+        :param other: another list to concatenate with self
+        :return: a new UnrolledLListCursor with the chunk size of self; the _cursor of
+        it is at the beginning of the list
+        """
+        newList = self._newEmpty()
+        newList.extend(self)
+        newList.extend(other)
+        newList.cursorToStart()
+        return newList
+
+    def __iadd__(self, other) -> UnrolledLListCursor:
+        """
+        appends other to self; the chunks of another UnrolledLListCursor are moved over
+        by splice, leaving other empty, while any other iterable is copied by extend
+        :param other: list or iterable of items to append
+        :return: self
+        """
+        if isinstance(other, UnrolledLListCursor):
+            self.splice(other)
+        else:
+            self.extend(other)
+        return self
+
+    def splice(self, other) -> None:
+        """
+        moves all the items of other to the end of self, leaving other empty; the chunks
+        are relinked in O(1) when other is an UnrolledLListCursor with the same chunk size,
+        otherwise the items are copied; the _cursor of self only changes if self was empty,
+        in which case it points to the first moved item; ValueError is raised if other is self
+        :param other: list whose items are moved
+        :return: None
+        """
+        if other is self:
+            raise ValueError('cannot splice an LListCursor into itself')
+        if not self._canRelink(other):
+            self.extend(other)
+            other.removeManyAtHead(len(other))
+            return
+        if other._length == 0:
+            return
+        if self._length == 0:
+            self._first = self._cursorChunk = other._first
+            self._cursorIndex = 0
+        else:
+            self._last.link = other._first
+            other._first.prev = self._last
+        self._last = other._last
+        self._length += other._length
+        other._first = other._last = other._cursorChunk = None
+        other._cursorIndex = 0
+        other._length = 0
+
+    # ------------------------------------------------------------------
+
+    @property
+    def _head(self) -> Optional[UnrolledPosition]:
+        if self._length == 0:
+            return None
+        return UnrolledPosition(self._first, 0)
+
+    @property
+    def _cursor(self) -> Optional[UnrolledPosition]:
+        if self._length == 0:
+            return None
+        return UnrolledPosition(self._cursorChunk, self._cursorIndex)
+
+    @property
+    def _tail(self) -> Optional[UnrolledPosition]:
+        if self._length == 0:
+            return None
+        return UnrolledPosition(self._last, len(self._last.items) - 1)
+
+    def memoryUsage(self) -> Dict[str, int]:
+        """
+        reports the memory used by the structure of the list, not counting the items
+        it holds; sizes come from sys.getsizeof
+        :return: dict with the same keys as LListCursor.memoryUsage; nodes is the number
+        of chunks and bytesPerNode is the average bytes per item
+        """
+        chunks = 0
+        nodeBytes = 0
+        chunk = self._first
+        while chunk is not None:
+            chunks += 1
+            nodeBytes += sys.getsizeof(chunk) + sys.getsizeof(chunk.items)
+            chunk = chunk.link
+        listBytes = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        return {
+            'nodes': chunks,
+            'bytesPerNode': nodeBytes // self._length if self._length else 0,
+            'nodeBytes': nodeBytes,
+            'listBytes': listBytes,
+            'totalBytes': nodeBytes + listBytes,
+        }
+
+    # ------------------------------------------------------------------
+
+    def _newItems(self, items: Iterable[Any]) -> List[Any]:
+        """
+        makes the item store of a new chunk; subclasses store items in other containers
+        that support the list operations used here
+        :return: a list holding items
+        """
+        return list(items)
+
+    def _newEmpty(self) -> UnrolledLListCursor:
+        """
+        :return: a new empty list with the same settings as self
+        """
+        return UnrolledLListCursor(chunkSize=self._chunkSize)
+
+    def _canRelink(self, other) -> bool:
+        """
+        :return: True if the chunks of other can be moved into self as they are
+        """
+        return type(other) is type(self) and other._chunkSize == self._chunkSize
+
+    def _newChunkAfter(self, chunk: Optional[_Chunk], items: List[Any]) -> _Chunk:
+        """
+        links a new chunk holding items after chunk, or at the front if chunk is None
+        :return: the new chunk
+        """
+        nextChunk = self._first if chunk is None else chunk.link
+        newChunk = _Chunk(items, nextChunk, chunk)
+        if chunk is None:
+            self._first = newChunk
+        else:
+            chunk.link = newChunk
+        if nextChunk is None:
+            self._last = newChunk
+        else:
+            nextChunk.prev = newChunk
+        return newChunk
+
+    def _unlinkChunk(self, chunk: _Chunk) -> None:
+        """
+        removes chunk from the chain of chunks
+        """
+        if chunk.prev is None:
+            self._first = chunk.link
+        else:
+            chunk.prev.link = chunk.link
+        if chunk.link is None:
+            self._last = chunk.prev
+        else:
+            chunk.link.prev = chunk.prev
+
+    def _insertAt(self, chunk: _Chunk, index: int, item: Any) -> None:
+        """
+        inserts item before position index of chunk, splitting chunk in half if it is full;
+        the _cursor keeps referring to the same item
+        """
+        if len(chunk.items) >= self._chunkSize:
+            # move the upper half of the items into a new chunk after this one
+            half = len(chunk.items) // 2
+            newChunk = self._newChunkAfter(chunk, chunk.items[half:])
+            del chunk.items[half:]
+            if self._cursorChunk is chunk and self._cursorIndex >= half:
+                self._cursorChunk = newChunk
+                self._cursorIndex -= half
+            if index > half:
+                chunk = newChunk
+                index -= half
+        chunk.items.insert(index, item)
+        if self._cursorChunk is chunk and self._cursorIndex >= index:
+            self._cursorIndex += 1
+        self._length += 1
+
+    def _insertIntoEmpty(self, item: Any) -> None:
+        """
+        inserts the first item into an empty list and points the _cursor at it
+        """
+        self._first = self._last = self._cursorChunk = _Chunk(self._newItems([item]))
+        self._cursorIndex = 0
+        self._length = 1
+
+    def _removeAt(self, chunk: _Chunk, index: int) -> Any:
+        """
+        removes and returns the item at position index of chunk; a _cursor on that item
+        moves to the item after it or, if there is none, the item before it; an emptied
+        chunk is unlinked and an underfull chunk is merged with a neighbouring chunk
+        """
+        item = chunk.items.pop(index)
+        self._length -= 1
+        if self._length == 0:
+            self._first = self._last = self._cursorChunk = None
+            self._cursorIndex = 0
+            return item
+
+        if self._cursorChunk is chunk:
+            if self._cursorIndex > index:
+                self._cursorIndex -= 1
+            elif self._cursorIndex == index and index == len(chunk.items):
+                # the _cursor was on the last item of chunk, move it to the next item
+                # or, if there is none, back to the item before it
+                if chunk.link is not None:
+                    self._cursorChunk = chunk.link
+                    self._cursorIndex = 0
+                else:
+                    self._cursorIndex -= 1
+
+        if len(chunk.items) == 0:
+            # the _cursor has been moved off chunk above unless chunk was the last chunk
+            # with the _cursor on it, in which case the item before it is in chunk.prev
+            if self._cursorChunk is chunk:
+                self._cursorChunk = chunk.prev
+                self._cursorIndex = len(chunk.prev.items) - 1
+            self._unlinkChunk(chunk)
+        elif (chunk.link is not None and len(chunk.items) < self._chunkSize // 2
+              and len(chunk.items) + len(chunk.link.items) <= self._chunkSize):
+            # merge the next chunk into this one
+            nextChunk = chunk.link
+            if self._cursorChunk is nextChunk:
+                self._cursorChunk = chunk
+                self._cursorIndex += len(chunk.items)
+            chunk.items.extend(nextChunk.items)
+            self._unlinkChunk(nextChunk)
+        elif (chunk.prev is not None and len(chunk.items) < self._chunkSize // 2
+              and len(chunk.items) + len(chunk.prev.items) <= self._chunkSize):
+            # no room to merge forward so merge this chunk into the previous one
+            prevChunk = chunk.prev
+            if self._cursorChunk is chunk:
+                self._cursorChunk = prevChunk
+                self._cursorIndex += len(prevChunk.items)
+            prevChunk.items.extend(chunk.items)
+            self._unlinkChunk(chunk)
+        return item
+
+    # ------------------------------------------------------------------
+
+    def insertAtHead(self, item: Any) -> None:
+        """
+        inserts item at the beginning of the list
+        :param item: value to insert
+        :return: None
+        """
+        if self._length == 0:
+            self._insertIntoEmpty(item)
+        elif len(self._first.items) >= self._chunkSize:
+            # start a new chunk rather than splitting a full one
+            self._newChunkAfter(None, self._newItems([item]))
+            self._length += 1
+        else:
+            self._insertAt(self._first, 0, item)
+
+    def insertAfterCursor(self, item: Any) -> None:
+        """
+        insert item after the _cursor position
+        :param item: value to insert
+        :return: None
+        """
+        if self._length == 0 or self._cursor == self._tail:
+            self.insertAtTail(item)
+        else:
+            self._insertAt(self._cursorChunk, self._cursorIndex + 1, item)
+
+    def insertAtTail(self, item: Any) -> None:
+        """
+        insert item at the end of the list
+        :param item: value to insert
+        :return: None
+        """
+        if self._length == 0:
+            self._insertIntoEmpty(item)
+        elif len(self._last.items) >= self._chunkSize:
+            # start a new chunk rather than splitting a full one
+            self._newChunkAfter(self._last, self._newItems([item]))
+            self._length += 1
+        else:
+            self._last.items.append(item)
+            self._length += 1
+
+    def removeItemAtHead(self) -> Any:
+        """
+        removes first item in the list; IndexError is raised if list is empty
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtHead called on empty LListCursor')
+        return self._removeAt(self._first, 0)
+
+    def removeItemAtCursor(self) -> Any:
+        """
+        removes item in the list that is at the _cursor; IndexError is raised if list is empty;
+        the _cursor now points to the item after the original _cursor unless the _cursor was the
+        last item in which case the _cursor is now the new last item
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtCursor called on empty LListCursor')
+        return self._removeAt(self._cursorChunk, self._cursorIndex)
+
+    def removeItemAtTail(self) -> Any:
+        """
+        removes last item in the list; IndexError is raised if list is empty
+        :return: the item that was removed
+        """
+        if self._length == 0:
+            raise IndexError('removeItemAtTail called on empty LListCursor')
+        return self._removeAt(self._last, len(self._last.items) - 1)
+
+    def itemAtHead(self) -> Any:
+        """
+        returns first item; IndexError is raised if list is empty
+        :return: first item in list
+        """
+        if self._length == 0:
+            raise IndexError('itemAtHead called on empty LListCursor')
+        return self._first.items[0]
+
+    def itemAtCursor(self) -> Any:
+        """
+        returns item at _cursor; IndexError is raised if list is empty
+        :return: item at _cursor
+        """
+        if self._length == 0:
+            raise IndexError('itemAtCursor called on empty LListCursor')
+        return self._cursorChunk.items[self._cursorIndex]
+
+    def itemAtTail(self) -> Any:
+        """
+        returns last item; IndexError is raised if list is empty
+        :return: last item in list
+        """
+        if self._length == 0:
+            raise IndexError('itemAtTail called on empty LListCursor')
+        return self._last.items[-1]
+
+    def cursorToStart(self) -> None:
+        """
+        move _cursor to start/_head of list
+        :return:
+        """
+        self._cursorChunk = self._first
+        self._cursorIndex = 0
+
+    def cursorForward(self) -> bool:
+        """
+        move _cursor forward one item
+        :return: True if _cursor was moved forward or False if list empty or _cursor already at end of list
+        """
+        if self._length == 0:
+            return False
+        if self._cursorIndex + 1 < len(self._cursorChunk.items):
+            self._cursorIndex += 1
+            return True
+        if self._cursorChunk.link is not None:
+            self._cursorChunk = self._cursorChunk.link
+            self._cursorIndex = 0
+            return True
+        return False
+
+    def cursorBackward(self) -> bool:
+        """
+        move _cursor back one item
+        :return: True if _cursor was moved back or False if list empty or _cursor already at start of list
+        """
+        if self._length == 0:
+            return False
+        if self._cursorIndex > 0:
+            self._cursorIndex -= 1
+            return True
+        if self._cursorChunk.prev is not None:
+            self._cursorChunk = self._cursorChunk.prev
+            self._cursorIndex = len(self._cursorChunk.items) - 1
+            return True
+        return False
+
+
+    # ------------------------------------------------------------------
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the end of the list in order, filling the last chunk and then
+        adding full chunks
+        :param items: values to insert
+        :return: None
+        """
+        items = iter(items)
+        if self._length == 0:
+            for x in items:
+                self._insertIntoEmpty(x)
+                break
+        while self._length > 0:
+            room = self._chunkSize - len(self._last.items)
+            if room == 0:
+                self._newChunkAfter(self._last, self._newItems([]))
+                room = self._chunkSize
+            before = len(self._last.items)
+            self._last.items.extend(islice(items, room))
+            added = len(self._last.items) - before
+            self._length += added
+            if added < room:
+                break
+        if self._last is not None and len(self._last.items) == 0:
+            # items ran out just after a new chunk was started
+            self._unlinkChunk(self._last)
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        """
+        inserts items at the beginning of the list, keeping their order, so the first of
+        items becomes the new head
+        :param items: values to insert
+        :return: None
+        """
+        items = list(items)
+        if self._length == 0:
+            # the _cursor should end up on the first item, as with LListCursor
+            self.extend(items)
+            return
+        for x in reversed(items):
+            self.insertAtHead(x)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        """
+        inserts items in order after the _cursor position
+        :param items: values to insert
+        :return: None
+        """
+        items = list(items)
+        if self._length == 0:
+            self.extend(items)
+            return
+        for x in reversed(items):
+            self.insertAfterCursor(x)
+
+    def _checkCount(self, count: int, available: int, method: str) -> None:
+        """
+        raises ValueError if count is negative or IndexError if it is more than available
+        """
+        if count < 0:
+            raise ValueError(f'{method} called with negative count {count}')
+        if count > available:
+            raise IndexError(f'{method} called with {count} items but only {available} available')
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        """
+        removes the first count items; IndexError is raised if the list has fewer items and
+        ValueError if count is negative; a _cursor on a removed item moves to the new _head
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        self._checkCount(count, self._length, 'removeManyAtHead')
+        return [self.removeItemAtHead() for i in range(count)]
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        """
+        removes count items starting with the item at the _cursor; IndexError is raised if
+        there are fewer than count items from the _cursor to the _tail and ValueError if count
+        is negative; the _cursor now points to the item after the removed items unless they
+        ran to the end of the list in which case it points to the item before them
+        :param count: number of items to remove
+        :return: the removed items in order
+        """
+        if count == 0:
+            return []
+        # count the items from the cursor to the tail, stopping once there are enough
+        available = 0
+        chunk = self._cursorChunk
+        if chunk is not None:
+            available = len(chunk.items) - self._cursorIndex
+            chunk = chunk.link
+        while chunk is not None and available < count:
+            available += len(chunk.items)
+            chunk = chunk.link
+        self._checkCount(count, available, 'removeRangeFromCursor')
+        # each removal moves the cursor onto the next item of the range, and off the
+        # end of the list onto the item before the range when the range reaches the tail
+        return [self.removeItemAtCursor() for i in range(count)]
+
+
+    # ------------------------------------------------------------------
+
+    def _checkPosition(self, position: int, method: str) -> int:
+        """
+        turns a negative position into one counted from the start, as Python lists do
+        :return: the position counted from the start; IndexError is raised if it is out of range
+        """
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError(f'{method} position out of range for LListCursor of length {self._length}')
+        return position
+
+    def _locate(self, position: int) -> UnrolledPosition:
+        """
+        :param position: position counted from the start, already checked
+        :return: chunk and index of the item at position, skipping whole chunks
+        """
+        chunk = self._first
+        while position >= len(chunk.items):
+            position -= len(chunk.items)
+            chunk = chunk.link
+        return UnrolledPosition(chunk, position)
+
+    def __getitem__(self, position: int) -> Any:
+        """
+        returns the item at position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position of the item
+        :return: the item
+        """
+        where = self._locate(self._checkPosition(position, '__getitem__'))
+        return where.chunk.items[where.index]
+
+    def __setitem__(self, position: int, item: Any) -> None:
+        """
+        replaces the item at position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position of the item
+        :param item: new value
+        :return: None
+        """
+        where = self._locate(self._checkPosition(position, '__setitem__'))
+        where.chunk.items[where.index] = item
+
+    def cursorTo(self, position: int) -> None:
+        """
+        moves the _cursor to position; negative positions count back from the end;
+        IndexError is raised if out of range
+        :param position: position to move the _cursor to
+        :return: None
+        """
+        where = self._locate(self._checkPosition(position, 'cursorTo'))
+        self._cursorChunk = where.chunk
+        self._cursorIndex = where.index
+
+    def cursorIndex(self) -> int:
+        """
+        returns the position of the _cursor, counting from 0; IndexError is raised if
+        the list is empty
+        :return: position of the _cursor
+        """
+        if self._length == 0:
+            raise IndexError('cursorIndex called on empty LListCursor')
+        position = self._cursorIndex
+        chunk = self._first
+        while chunk is not self._cursorChunk:
+            position += len(chunk.items)
+            chunk = chunk.link
+        return position
+
+# ----------------------------------------------------------------------
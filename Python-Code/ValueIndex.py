@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# ValueIndex.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Optional, Any, Dict, List
+
+from ListNode import ListNode
+
+
+# ----------------------------------------------------------------------
+
+
+class ValueIndex:
+    """ValueIndex maps each item of an LListCursor to the nodes holding it,
+    so finding, counting and removing an item take O(1) expected time
+    instead of a walk of the list
+
+    nodes with equal items share a bucket, a dict used as an ordered set,
+    so duplicates are kept in the order they were inserted; items that
+    cannot be hashed are kept in a separate bucket that is searched with
+    ==, so they work but cost O(u) for u unhashable items
+
+    it is an LListCursor observer, so the list's inserts, removes and
+    replacements keep it up to date at O(1) per node; items must not be
+    changed in a way that changes their hash while they are in the list
+    """
+
+    def __init__(self, head: Optional[ListNode] = None):
+        """
+        builds the index for the nodes from head to the end of its chain
+        :param head: first node of the list being indexed, or None if it is empty
+        """
+        self._buckets: Dict[Any, Dict[ListNode, None]] = {}
+        self._unhashable: Dict[ListNode, None] = {}
+        node = head
+        while node is not None:
+            self._add(node, node.item)
+            node = node.link
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values()) + len(self._unhashable)
+
+    def _add(self, node: ListNode, item: Any) -> None:
+        try:
+            bucket = self._buckets.setdefault(item, {})
+        except TypeError:
+            self._unhashable[node] = None
+        else:
+            bucket[node] = None
+
+    def _discard(self, node: ListNode, item: Any) -> None:
+        try:
+            bucket = self._buckets[item]
+        except TypeError:
+            del self._unhashable[node]
+        else:
+            del bucket[node]
+            if not bucket:
+                del self._buckets[item]
+
+    def _unhashableMatches(self, item: Any) -> List[ListNode]:
+        return [node for node in self._unhashable if node.item is item or node.item == item]
+
+    # ------------------------------------------------------------------
+
+    def first(self, item: Any) -> Optional[ListNode]:
+        """
+        :param item: value to look for
+        :return: the earliest inserted node holding item, or None if there is none
+        """
+        try:
+            bucket = self._buckets.get(item)
+        except TypeError:
+            bucket = None
+        if bucket:
+            return next(iter(bucket))
+        if self._unhashable:
+            matches = self._unhashableMatches(item)
+            if matches:
+                return matches[0]
+        return None
+
+    def count(self, item: Any) -> int:
+        """
+        :param item: value to look for
+        :return: number of nodes holding item
+        """
+        try:
+            bucket = self._buckets.get(item)
+        except TypeError:
+            bucket = None
+        total = len(bucket) if bucket else 0
+        if self._unhashable:
+            total += len(self._unhashableMatches(item))
+        return total
+
+    def nodesInserted(self, first: ListNode, last: ListNode, count: int) -> None:
+        """
+        observer call: adds the chain first..last, which is already linked into the list
+        """
+        node = first
+        for i in range(count):
+            self._add(node, node.item)
+            node = node.link
+
+    def nodesRemoving(self, first: ListNode, count: int) -> None:
+        """
+        observer call: drops the count nodes starting at first, which are still linked
+        """
+        node = first
+        for i in range(count):
+            self._discard(node, node.item)
+            node = node.link
+
+    def nodeReplacing(self, node: ListNode, item: Any) -> None:
+        """
+        observer call: node.item is about to become item
+        """
+        self._discard(node, node.item)
+        self._add(node, item)
+
+# ----------------------------------------------------------------------
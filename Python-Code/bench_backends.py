@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_backends.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import Callable
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def throughput(operation: Callable[[], None], count: int) -> float:
+    """
+    runs operation once and converts the elapsed time into items per second
+    :param operation: callable that processes count items
+    :param count: number of items operation processes
+    :return: items per second
+    """
+    start = time.perf_counter()
+    operation()
+    return count / (time.perf_counter() - start)
+
+
+def benchBackend(backend: str, size: int) -> dict:
+    """
+    measures build, iterate, cursor walk, head insert and head removal for one backend
+    :param backend: LListCursor backend name
+    :param size: number of items
+    :return: dict of operation name to items per second
+    """
+    results = {}
+    items = LListCursor(backend=backend)
+
+    def build():
+        for i in range(size):
+            items.insertAtTail(i)
+    results['insertAtTail'] = throughput(build, size)
+
+    def iterate():
+        for x in items:
+            pass
+    results['__iter__'] = throughput(iterate, size)
+
+    def walk():
+        items.cursorToStart()
+        while items.cursorForward():
+            pass
+    results['cursorForward'] = throughput(walk, size)
+
+    def removeHead():
+        for i in range(size):
+            items.removeItemAtHead()
+    results['removeItemAtHead'] = throughput(removeHead, size)
+
+    def insertHead():
+        for i in range(size):
+            items.insertAtHead(i)
+    results['insertAtHead'] = throughput(insertHead, size)
+
+    results['bytesPerItem'] = items.memoryUsage()['nodeBytes'] / size
+    return results
+
+# ----------------------------------------------------------------------
+
+
+def main(size: int):
+    node = benchBackend('node', size)
+    unrolled = benchBackend('unrolled', size)
+    print(f"{size} items, items/sec (higher is better); bytesPerItem is structure bytes per item")
+    print(f"{'operation':>18} {'node':>14} {'unrolled':>14} {'ratio':>7}")
+    for name in node:
+        print(f"{name:>18} {node[name]:>14.0f} {unrolled[name]:>14.0f} {unrolled[name] / node[name]:>7.2f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_churn.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import sys
+import timeit
+
+from LListCursor import LListCursor
+from ListNode import NodePool
+
+# ----------------------------------------------------------------------
+
+
+def churn(items: LListCursor, pairs: int) -> None:
+    """
+    work-buffer pattern: push at the tail and pop at the head pairs times
+    """
+    insert = items.insertAtTail
+    remove = items.removeItemAtHead
+    for i in range(pairs):
+        insert(i)
+        remove()
+
+
+def timeChurn(pool, backlog: int, pairs: int) -> float:
+    """
+    :param pool: NodePool to use or None
+    :param backlog: items kept in the list while churning
+    :param pairs: number of insert/remove pairs timed
+    :return: best nanoseconds per insert/remove pair over 15 runs
+    """
+    items = LListCursor(range(backlog), pool=pool)
+    # warm the pool up so the timed loop measures the steady state
+    churn(items, 1000)
+    seconds = min(timeit.repeat(lambda: churn(items, pairs), number=1, repeat=15))
+    return seconds / pairs * 1e9
+
+# ----------------------------------------------------------------------
+
+
+def main(pairs: int):
+    for backlog in (0, 1000, 100000):
+        plain = timeChurn(None, backlog, pairs)
+        pool = NodePool(64)
+        pooled = timeChurn(pool, backlog, pairs)
+        print(f"backlog {backlog:>6}: plain {plain:7.1f} ns/pair, pooled {pooled:7.1f} ns/pair "
+              f"({(1 - pooled / plain) * 100:+.1f}% saved), pool hits {pool.hits} misses {pool.misses}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
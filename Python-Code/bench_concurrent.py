@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_concurrent.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import List
+import sys
+import threading
+import time
+
+from LListCursor import LListCursor
+from ConcurrentLListCursor import ConcurrentLListCursor
+
+# ----------------------------------------------------------------------
+
+# insert/remove pairs done by each producer/consumer pair of threads
+OPS_PER_THREAD = 50000
+
+
+class GlobalLockList:
+    """what we had before: an LListCursor with every call under one lock"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._list = LListCursor()
+
+    def insertAtTail(self, item):
+        with self._lock:
+            self._list.insertAtTail(item)
+
+    def removeItemAtHead(self):
+        with self._lock:
+            return self._list.removeItemAtHead()
+
+
+def opsPerSecond(items, threadPairs: int) -> float:
+    """
+    runs threadPairs producers calling insertAtTail and threadPairs consumers calling
+    removeItemAtHead until every item is consumed
+    :return: operations (inserts plus removes) per second
+    """
+    def produce():
+        for i in range(OPS_PER_THREAD):
+            items.insertAtTail(i)
+
+    def consume():
+        done = 0
+        while done < OPS_PER_THREAD:
+            try:
+                items.removeItemAtHead()
+                done += 1
+            except IndexError:
+                pass
+
+    threads = [threading.Thread(target=produce) for i in range(threadPairs)]
+    threads += [threading.Thread(target=consume) for i in range(threadPairs)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return 2 * threadPairs * OPS_PER_THREAD / (time.perf_counter() - start)
+
+# ----------------------------------------------------------------------
+
+
+def main(threadCounts: List[int]):
+    # sys._is_gil_enabled only exists on 3.13 and later
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8} {'global lock':>14} {'two-lock':>14} {'two-lock rw':>14}   (ops/sec)")
+    for threads in threadCounts:
+        pairs = max(threads // 2, 1)
+        globalLock = opsPerSecond(GlobalLockList(), pairs)
+        twoLock = opsPerSecond(ConcurrentLListCursor(), pairs)
+        readerWriter = opsPerSecond(ConcurrentLListCursor(readerWriter=True), pairs)
+        print(f"{2 * pairs:>8} {globalLock:>14.0f} {twoLock:>14.0f} {readerWriter:>14.0f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    # total thread counts, half producers and half consumers
+    main([int(x) for x in sys.argv[1:]] or [2, 4, 8, 16])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_mmap.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from LListCursor import LListCursor
+from MmapLListCursor import MmapLListCursor
+
+# ----------------------------------------------------------------------
+
+
+def residentKiB() -> int:
+    """
+    :return: resident memory of this process in KiB; ru_maxrss is not used since on Linux it
+    keeps the peak of the parent process across fork and exec
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def startup(kind: str, path: str) -> None:
+    """
+    run in a child process: makes the list ready to use and prints the seconds it took and
+    the growth in resident memory in KiB
+    :param kind: 'pickle' to load a pickled list of items and rebuild an LListCursor,
+    'mmap' to open an MmapLListCursor
+    :param path: file to load
+    """
+    before = residentKiB()
+    start = time.perf_counter()
+    if kind == 'pickle':
+        with open(path, 'rb') as f:
+            items = LListCursor(pickle.load(f))
+    else:
+        items = MmapLListCursor.open(path)
+    # touch both ends so the list is really usable
+    items.itemAtHead()
+    items.itemAtTail()
+    elapsed = time.perf_counter() - start
+    after = residentKiB()
+    print(elapsed, after - before)
+
+
+def measure(kind: str, path: str, repeats: int = 3) -> tuple:
+    """
+    :return: best startup seconds and the resident KiB of that run over fresh processes
+    """
+    runs = []
+    for i in range(repeats):
+        output = subprocess.run([sys.executable, __file__, kind, path], capture_output=True,
+                                text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        seconds, kib = output.stdout.split()
+        runs.append((float(seconds), int(kib)))
+    return min(runs)
+
+
+def main(size: int):
+    with tempfile.TemporaryDirectory() as directory:
+        picklePath = os.path.join(directory, 'items.pickle')
+        mmapPath = os.path.join(directory, 'items.llist')
+        items = [f'item {i}' for i in range(size)]
+        with open(picklePath, 'wb') as f:
+            pickle.dump(items, f, pickle.HIGHEST_PROTOCOL)
+        start = time.perf_counter()
+        MmapLListCursor(items, path=mmapPath).close()
+        del items
+        print(f"{size} string items; MmapLListCursor built in {time.perf_counter() - start:.2f} s")
+        print(f"{'':>22} {'startup (s)':>12} {'resident (KiB)':>15}")
+        for kind in ('pickle', 'mmap'):
+            seconds, kib = measure(kind, picklePath if kind == 'pickle' else mmapPath)
+            print(f"{kind:>22} {seconds:>12.4f} {kib:>15}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        startup(sys.argv[1], sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_parallel.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def work(x: int) -> int:
+    """
+    CPU-bound stand-in for a real per-item computation
+    """
+    total = 0
+    for i in range(200):
+        total = (total * 31 + x + i) % 1000003
+    return total
+
+# ----------------------------------------------------------------------
+
+
+def main(size: int):
+    items = LListCursor(range(size))
+    start = time.perf_counter()
+    expected = [work(x) for x in items]
+    serial = time.perf_counter() - start
+    print(f"{size} items on {os.cpu_count()} cores; serial loop {serial:.2f}s")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        result = items.pmap(work, workers=workers, chunkSize=max(size // (4 * workers), 1))
+        seconds = time.perf_counter() - start
+        assert list(result) == expected
+        print(f"{workers:>8} {seconds:>9.2f} {serial / seconds:>8.2f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
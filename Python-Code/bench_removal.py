@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_removal.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import List
+import sys
+import timeit
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+# number of removals timed at each size
+REPEAT = 1000
+
+
+def timeTailRemoval(size: int) -> float:
+    """
+    times removeItemAtTail on a list of the given size, with the cursor at the tail
+    :param size: number of items in the list
+    :return: average seconds per removal
+    """
+    items = LListCursor(range(size + REPEAT))
+    while items.cursorForward():
+        pass
+    seconds = timeit.timeit(items.removeItemAtTail, number=REPEAT)
+    return seconds / REPEAT
+
+
+def timeCursorRemoval(size: int) -> float:
+    """
+    times removeItemAtCursor on a list of the given size, with the cursor in the middle
+    :param size: number of items in the list
+    :return: average seconds per removal
+    """
+    items = LListCursor(range(size + REPEAT))
+    for i in range(size // 2):
+        items.cursorForward()
+    seconds = timeit.timeit(items.removeItemAtCursor, number=REPEAT)
+    return seconds / REPEAT
+
+# ----------------------------------------------------------------------
+
+
+def main(sizes: List[int]):
+    print(f"{'size':>10} {'tail (ns)':>12} {'cursor (ns)':>12}")
+    for size in sizes:
+        tail = timeTailRemoval(size) * 1e9
+        cursor = timeCursorRemoval(size) * 1e9
+        print(f"{size:>10} {tail:>12.1f} {cursor:>12.1f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    # sizes can be given on the command line, default is 10^3 to 10^7
+    main([int(x) for x in sys.argv[1:]] or [10 ** e for e in range(3, 8)])
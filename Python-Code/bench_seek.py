@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_seek.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import List
+import random
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+# number of random seeks timed at each size
+SEEKS = 200
+
+
+def walkTo(items: LListCursor, position: int) -> None:
+    """
+    the only way to seek before cursorTo: back to the start and step forward
+    """
+    items.cursorToStart()
+    for i in range(position):
+        items.cursorForward()
+
+
+def timeSeeks(seek, items: LListCursor, positions: List[int]) -> float:
+    """
+    :return: average microseconds per seek
+    """
+    start = time.perf_counter()
+    for position in positions:
+        seek(items, position)
+    return (time.perf_counter() - start) / len(positions) * 1e6
+
+# ----------------------------------------------------------------------
+
+
+def main(sizes: List[int]):
+    rng = random.Random(6030)
+    print(f"{'size':>10} {'walk (us)':>12} {'cursorTo (us)':>14} {'indexed (us)':>13}")
+    for size in sizes:
+        positions = [rng.randrange(size) for i in range(SEEKS)]
+        plain = LListCursor(range(size))
+        indexed = LListCursor(range(size), indexed=True)
+        walk = timeSeeks(walkTo, plain, positions)
+        linear = timeSeeks(LListCursor.cursorTo, plain, positions)
+        logarithmic = timeSeeks(LListCursor.cursorTo, indexed, positions)
+        print(f"{size:>10} {walk:>12.1f} {linear:>14.1f} {logarithmic:>13.1f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    # sizes can be given on the command line, default is 10^3 to 10^6
+    main([int(x) for x in sys.argv[1:]] or [10 ** e for e in range(3, 7)])
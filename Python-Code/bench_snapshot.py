@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_snapshot.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import Callable
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def best(operation: Callable[[], object], repeats: int = 5) -> float:
+    """
+    runs operation repeats times
+    :param operation: callable to time
+    :param repeats: number of runs
+    :return: shortest time in seconds
+    """
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def queueChurn(items: LListCursor, count: int) -> None:
+    """
+    the reporting workload's writer: append at the tail and remove at the head
+    """
+    for i in range(count):
+        items.insertAtTail(i)
+        items.removeItemAtHead()
+
+
+def middleChurn(items: LListCursor, count: int) -> None:
+    """
+    a writer that inserts and removes next to the _cursor, which saves a node per change
+    """
+    items.cursorTo(len(items) // 2)
+    for i in range(count):
+        items.insertAfterCursor(i)
+        items.removeItemAtCursor()
+
+
+def writerOverhead(name: str, churn: Callable[[LListCursor, int], None], size: int, count: int) -> None:
+    items = LListCursor(range(size))
+    plain = best(lambda: churn(items, count))
+    # a new snapshot for each run, so every run starts with nothing saved
+    snapshots = []
+
+    def withSnapshot():
+        snapshots.append(items.snapshot())
+        churn(items, count)
+
+    shared = best(withSnapshot)
+    saved = snapshots[-1].savedNodes()
+    print(f"{name:>18} {plain / count * 1e9:>12.0f} {shared / count * 1e9:>14.0f} "
+          f"{shared / plain:>7.2f} {saved:>8}")
+
+
+def main(size: int):
+    count = 100000
+    items = LListCursor(range(size))
+    print(f"list of {size} items")
+    print(f"{'':>18} {'ms':>12}")
+    print(f"{'snapshot()':>18} {best(items.snapshot) * 1000:>12.4f}")
+    print(f"{'list(items)':>18} {best(lambda: list(items)) * 1000:>12.4f}")
+    print(f"{'LListCursor copy':>18} {best(lambda: LListCursor(items)) * 1000:>12.4f}")
+    snapshot = items.snapshot()
+    print(f"{'iterate snapshot':>18} {best(lambda: sum(snapshot)) * 1000:>12.4f}")
+    print(f"{'iterate list':>18} {best(lambda: sum(items)) * 1000:>12.4f}")
+    snapshot.close()
+    print(f"writer, {count} changes with and without one live snapshot")
+    print(f"{'':>18} {'ns/change':>12} {'with snapshot':>14} {'ratio':>7} {'saved':>8}")
+    writerOverhead('queue', queueChurn, size, count)
+    writerOverhead('next to cursor', middleChurn, size, count)
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
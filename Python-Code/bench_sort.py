@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_sort.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import Callable, Tuple
+import random
+import sys
+import time
+import tracemalloc
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def measure(setup: Callable[[], LListCursor],
+            operation: Callable[[LListCursor], object]) -> Tuple[float, int]:
+    """
+    runs operation twice on a fresh list from setup, once timed and once under
+    tracemalloc, which slows it down
+    :param setup: makes the list to run on; not measured
+    :param operation: callable to measure
+    :return: seconds taken and peak bytes allocated while it ran
+    """
+    items = setup()
+    start = time.perf_counter()
+    operation(items)
+    seconds = time.perf_counter() - start
+    items = setup()
+    tracemalloc.start()
+    operation(items)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def rebuildSort(items: LListCursor) -> LListCursor:
+    """
+    the old way: copy the items out, sort the copy and build a new list from it
+    """
+    return LListCursor(sorted(items))
+
+
+def linearInsert(items: LListCursor, item: int) -> None:
+    """
+    the old way to insert in order: walk from the head to the place
+    """
+    items.cursorToStart()
+    if items and items.itemAtHead() > item:
+        items.insertAtHead(item)
+        return
+    while items and items._cursor.link is not None and items._cursor.link.item <= item:
+        items.cursorForward()
+    items.insertAfterCursor(item)
+
+
+def main(size: int):
+    rng = random.Random(6030)
+    values = [rng.random() for i in range(size)]
+    print(f"{size} random floats")
+    print(f"{'':>24} {'seconds':>10} {'peak MB':>10}")
+    for name, operation in (('copy, sort, rebuild', rebuildSort),
+                            ('in-place sort', lambda items: items.sort())):
+        seconds, peak = measure(lambda: LListCursor(values), operation)
+        print(f"{name:>24} {seconds:>10.3f} {peak / 2 ** 20:>10.2f}")
+
+    inserts = min(size, 200)
+    base = sorted(values)
+    extra = [rng.random() for i in range(inserts)]
+    print(f"{inserts} inserts into a sorted list of {size}")
+    items = LListCursor(base)
+    start = time.perf_counter()
+    for x in extra:
+        linearInsert(items, x)
+    seconds = time.perf_counter() - start
+    print(f"{'linear walk':>24} {seconds:>10.3f}")
+    items = LListCursor(base, keepSorted=True)
+    start = time.perf_counter()
+    for x in extra:
+        items.insertAtTail(x)
+    seconds = time.perf_counter() - start
+    print(f"{'keepSorted':>24} {seconds:>10.3f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5)
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_suite.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+"""times every public LListCursor method at a range of sizes, next to the
+same operations on a list and a collections.deque, and writes the results
+as JSON; with --compare it also checks a run against a stored baseline and
+exits with status 1 if any operation got slower than --threshold times
+
+    python bench_suite.py --output baseline.json
+    python bench_suite.py --compare baseline.json --threshold 1.3
+
+the default sizes go up to 10**7, which needs about 1.5 GB; use --sizes to
+run a smaller set
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from collections import deque
+import argparse
+import datetime
+import json
+import operator
+import platform
+import random
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class ListAdapter:
+    """gives a Python list the LListCursor API, with the _cursor as an index, so
+    the same benchmark code runs on both; only operations with a direct list
+    equivalent are provided, the rest are skipped for this baseline"""
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self.items = self.makeItems(items)
+        self.cursor = 0
+
+    @staticmethod
+    def makeItems(items: Iterable[Any]):
+        return list(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __add__(self, other) -> ListAdapter:
+        return type(self)(self.items + other.items)
+
+    def __iadd__(self, other) -> ListAdapter:
+        self.items += other.items
+        return self
+
+    def splice(self, other) -> None:
+        self.items.extend(other.items)
+        other.items.clear()
+
+    def insertAtHead(self, item: Any) -> None:
+        self.items.insert(0, item)
+        if len(self.items) > 1:
+            self.cursor += 1
+
+    def insertAfterCursor(self, item: Any) -> None:
+        self.items.insert(self.cursor + 1, item)
+
+    def insertAtTail(self, item: Any) -> None:
+        self.items.append(item)
+
+    def removeItemAtHead(self) -> Any:
+        item = self.items.pop(0)
+        if self.cursor > 0:
+            self.cursor -= 1
+        return item
+
+    def removeItemAtCursor(self) -> Any:
+        item = self.items[self.cursor]
+        del self.items[self.cursor]
+        if self.cursor == len(self.items) and self.cursor > 0:
+            self.cursor -= 1
+        return item
+
+    def removeItemAtTail(self) -> Any:
+        item = self.items.pop()
+        if self.cursor == len(self.items) and self.cursor > 0:
+            self.cursor -= 1
+        return item
+
+    def itemAtHead(self) -> Any:
+        return self.items[0]
+
+    def itemAtCursor(self) -> Any:
+        return self.items[self.cursor]
+
+    def itemAtTail(self) -> Any:
+        return self.items[-1]
+
+    def cursorToStart(self) -> None:
+        self.cursor = 0
+
+    def cursorForward(self) -> bool:
+        if self.cursor + 1 < len(self.items):
+            self.cursor += 1
+            return True
+        return False
+
+    def cursorBackward(self) -> bool:
+        if self.cursor > 0:
+            self.cursor -= 1
+            return True
+        return False
+
+    def extend(self, items: Iterable[Any]) -> None:
+        self.items.extend(items)
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        self.items[:0] = items
+        self.cursor += len(items)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        self.items[self.cursor + 1:self.cursor + 1] = items
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        removed = self.items[:count]
+        del self.items[:count]
+        self.cursor = max(self.cursor - count, 0)
+        return removed
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        removed = self.items[self.cursor:self.cursor + count]
+        del self.items[self.cursor:self.cursor + count]
+        self.cursor = min(self.cursor, max(len(self.items) - 1, 0))
+        return removed
+
+    def __getitem__(self, position: int) -> Any:
+        return self.items[position]
+
+    def __setitem__(self, position: int, item: Any) -> None:
+        self.items[position] = item
+
+    def cursorTo(self, position: int) -> None:
+        self.cursor = position % len(self.items)
+
+    def cursorIndex(self) -> int:
+        return self.cursor
+
+
+class DequeAdapter(ListAdapter):
+    """the ListAdapter over a collections.deque, using its O(1) operations at
+    the ends"""
+
+    @staticmethod
+    def makeItems(items: Iterable[Any]):
+        return deque(items)
+
+    def insertAtHead(self, item: Any) -> None:
+        self.items.appendleft(item)
+        if len(self.items) > 1:
+            self.cursor += 1
+
+    def removeItemAtHead(self) -> Any:
+        item = self.items.popleft()
+        if self.cursor > 0:
+            self.cursor -= 1
+        return item
+
+    def extendLeft(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        self.items.extendleft(reversed(items))
+        self.cursor += len(items)
+
+    def insertManyAfterCursor(self, items: Iterable[Any]) -> None:
+        # deque has no slice assignment, so rotate the gap to the left end and back
+        self.items.rotate(-(self.cursor + 1))
+        self.items.extendleft(reversed(list(items)))
+        self.items.rotate(self.cursor + 1)
+
+    def removeManyAtHead(self, count: int) -> List[Any]:
+        self.cursor = max(self.cursor - count, 0)
+        return [self.items.popleft() for i in range(count)]
+
+    def removeRangeFromCursor(self, count: int) -> List[Any]:
+        self.items.rotate(-self.cursor)
+        removed = [self.items.popleft() for i in range(count)]
+        self.items.rotate(self.cursor)
+        self.cursor = min(self.cursor, max(len(self.items) - 1, 0))
+        return removed
+
+
+# the structures measured; each is made from an iterable of items
+IMPLEMENTATIONS: Dict[str, Callable[[Iterable[Any]], Any]] = {
+    'LListCursor': LListCursor,
+    'list': ListAdapter,
+    'deque': DequeAdapter,
+}
+
+# ----------------------------------------------------------------------
+
+
+class Case:
+    """one timed operation: prepare and restore run untimed before and after run,
+    which performs the operation count times on the container"""
+
+    def __init__(self, name: str, run: Callable, count: str = 'batch',
+                 prepare: Optional[Callable] = None, restore: Optional[Callable] = None,
+                 needs: Optional[str] = None):
+        """
+        :param name: operation name, normally the method measured
+        :param run: run(container, count, rng, state) performs count operations
+        :param count: 'batch' for cheap operations, 'positional' for O(n) walks, 'call' for one call
+        :param prepare: prepare(container, count, rng, state) runs untimed before run
+        :param restore: restore(container, count, rng, state) puts the size back afterwards
+        :param needs: method the container must have; name if None
+        """
+        self.name = name
+        self.run = run
+        self.count = count
+        self.prepare = prepare
+        self.restore = restore
+        self.needs = needs if needs is not None else name
+
+
+def _middle(container, count, rng, state) -> None:
+    container.cursorTo(len(container) // 2)
+
+
+def _repeat(method: str) -> Callable:
+    """
+    :return: a run function calling method with no arguments count times
+    """
+    def run(container, count, rng, state):
+        call = getattr(container, method)
+        for i in range(count):
+            call()
+    return run
+
+
+def _insert(method: str) -> Callable:
+    def run(container, count, rng, state):
+        call = getattr(container, method)
+        for i in range(count):
+            call(i)
+    return run
+
+
+def _positions(container, count, rng, state) -> None:
+    state['positions'] = [rng.randrange(len(container)) for i in range(count)]
+
+
+def _getItems(container, count, rng, state) -> None:
+    for position in state['positions']:
+        container[position]
+
+
+def _setItems(container, count, rng, state) -> None:
+    for position in state['positions']:
+        container[position] = position
+
+
+def _cursorTos(container, count, rng, state) -> None:
+    for position in state['positions']:
+        container.cursorTo(position)
+
+
+def _other(container, count, rng, state) -> None:
+    state['other'] = type(container)(range(count))
+
+
+def _dropTail(container, count, rng, state) -> None:
+    for i in range(count):
+        container.removeItemAtTail()
+
+
+def _observers(container, count, rng, state) -> None:
+    observer = _NullObserver()
+    for i in range(count):
+        container.addObserver(observer)
+        container.removeObserver(observer)
+
+
+def _cursors(container, count, rng, state) -> None:
+    state['handles'] = [container.newCursor() for i in range(count)]
+
+
+def _closeCursors(container, count, rng, state) -> None:
+    for handle in state.pop('handles'):
+        handle.close()
+
+
+class _NullObserver:
+    def nodesInserted(self, first, last, count):
+        pass
+
+    def nodesRemoving(self, first, count):
+        pass
+
+
+def _double(x):
+    return 2 * x
+
+
+def _isEven(x):
+    return x % 2 == 0
+
+
+# in an order that leaves each container at its starting size
+CASES: List[Case] = [
+    Case('insertAtTail', _insert('insertAtTail')),
+    Case('removeItemAtTail', _repeat('removeItemAtTail')),
+    Case('insertAtHead', _insert('insertAtHead')),
+    Case('removeItemAtHead', _repeat('removeItemAtHead')),
+    Case('insertAfterCursor', _insert('insertAfterCursor'), prepare=_middle),
+    Case('removeItemAtCursor', _repeat('removeItemAtCursor'), prepare=_middle),
+    Case('itemAtHead', _repeat('itemAtHead')),
+    Case('itemAtCursor', _repeat('itemAtCursor')),
+    Case('itemAtTail', _repeat('itemAtTail')),
+    Case('cursorToStart', _repeat('cursorToStart')),
+    Case('cursorForward', _repeat('cursorForward'), prepare=lambda c, n, r, s: c.cursorToStart()),
+    Case('cursorBackward', _repeat('cursorBackward')),
+    Case('__len__', lambda c, n, r, s: [len(c) for i in range(n)]),
+    Case('__iter__', lambda c, n, r, s: [x for x in c], count='call'),
+    Case('__getitem__', _getItems, count='positional', prepare=_positions),
+    Case('__setitem__', _setItems, count='positional', prepare=_positions),
+    Case('cursorTo', _cursorTos, count='positional', prepare=_positions),
+    Case('cursorIndex', lambda c, n, r, s: [c.cursorIndex() for i in range(n)], count='positional',
+         prepare=_middle),
+    Case('extend', lambda c, n, r, s: c.extend(range(n))),
+    Case('removeManyAtHead', lambda c, n, r, s: c.removeManyAtHead(n)),
+    Case('extendLeft', lambda c, n, r, s: c.extendLeft(range(n)),
+         restore=lambda c, n, r, s: c.removeManyAtHead(n)),
+    Case('insertManyAfterCursor', lambda c, n, r, s: c.insertManyAfterCursor(range(n)), prepare=_middle),
+    Case('removeRangeFromCursor', lambda c, n, r, s: c.removeRangeFromCursor(n), prepare=_middle),
+    Case('__add__', lambda c, n, r, s: c + s['other'], count='call', prepare=_other),
+    Case('splice', lambda c, n, r, s: c.splice(s['other']), count='call', prepare=_other,
+         restore=_dropTail),
+    Case('__iadd__', lambda c, n, r, s: c.__iadd__(s['other']), count='call', prepare=_other,
+         restore=_dropTail),
+    Case('memoryUsage', lambda c, n, r, s: c.memoryUsage(), count='call'),
+    Case('newCursor', _cursors, restore=_closeCursors),
+    Case('addObserver+removeObserver', _observers, needs='addObserver'),
+    Case('pmap', lambda c, n, r, s: c.pmap(_double, executor='thread'), count='call'),
+    Case('pfilter', lambda c, n, r, s: c.pfilter(_isEven, executor='thread'), count='call'),
+    Case('preduce', lambda c, n, r, s: c.preduce(operator.add, 0, executor='thread'), count='call'),
+]
+
+# ----------------------------------------------------------------------
+
+
+def runSuite(sizes: List[int], implementations: List[str], batch: int, positional: int,
+             repeat: int, seed: int, operations: Optional[List[str]] = None,
+             log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """
+    times every case on every implementation and size; each container is built once per
+    size and the cases run in order repeat times, keeping the fastest time of each
+    :param sizes: list sizes
+    :param implementations: names from IMPLEMENTATIONS
+    :param batch: operations timed together for the cheap cases, at most the size
+    :param positional: operations timed together for the O(n) positional cases
+    :param repeat: times each case is run
+    :param seed: seed for the random positions, the same for every implementation
+    :param operations: case names to run; all if None
+    :param log: called with a progress line per implementation and size
+    :return: one dict per case, implementation and size with the seconds per operation
+    """
+    results = []
+    for size in sizes:
+        counts = {'batch': min(batch, size), 'positional': min(positional, size), 'call': 1}
+        for implName in implementations:
+            start = time.perf_counter()
+            container = IMPLEMENTATIONS[implName](range(size))
+            best: Dict[int, float] = {}
+            for repetition in range(repeat):
+                for caseNumber, case in enumerate(CASES):
+                    if operations is not None and case.name not in operations:
+                        continue
+                    if not hasattr(container, case.needs):
+                        continue
+                    count = counts[case.count]
+                    # the same positions for every implementation and round
+                    rng = random.Random(f'{seed}-{case.name}-{size}')
+                    state: Dict[str, Any] = {}
+                    if case.prepare is not None:
+                        case.prepare(container, count, rng, state)
+                    began = time.perf_counter()
+                    case.run(container, count, rng, state)
+                    elapsed = time.perf_counter() - began
+                    if case.restore is not None:
+                        case.restore(container, count, rng, state)
+                    best[caseNumber] = min(best.get(caseNumber, elapsed), elapsed)
+            for caseNumber, elapsed in best.items():
+                case = CASES[caseNumber]
+                count = counts[case.count]
+                results.append({
+                    'operation': case.name,
+                    'implementation': implName,
+                    'size': size,
+                    'count': count,
+                    'secondsPerOp': elapsed / count,
+                })
+            del container
+            log(f'{implName} at {size}: {time.perf_counter() - start:.1f} s')
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            minSeconds: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    matches the results of two runs by operation, implementation and size
+    :param baseline: stored run, as written by main
+    :param current: new run
+    :param threshold: a ratio of current to baseline time above this is a regression
+    :param minSeconds: results faster than this in both runs are too noisy to judge
+    :return: one dict per matched result with the ratio and whether it regressed
+    """
+    def key(result):
+        return result['operation'], result['implementation'], result['size']
+
+    old = {key(result): result for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        if key(result) not in old:
+            continue
+        before = old[key(result)]['secondsPerOp']
+        after = result['secondsPerOp']
+        ratio = after / before if before > 0 else float('inf')
+        rows.append({
+            'operation': result['operation'],
+            'implementation': result['implementation'],
+            'size': result['size'],
+            'baseline': before,
+            'current': after,
+            'ratio': ratio,
+            'regressed': ratio > threshold and max(before, after) >= minSeconds,
+        })
+    return rows
+
+
+def printResults(results: List[Dict[str, Any]]) -> None:
+    print(f"{'operation':>28} {'implementation':>14} {'size':>10} {'ns/op':>14}")
+    for result in results:
+        print(f"{result['operation']:>28} {result['implementation']:>14} {result['size']:>10} "
+              f"{result['secondsPerOp'] * 1e9:>14.1f}")
+
+
+def printComparison(rows: List[Dict[str, Any]], threshold: float) -> None:
+    print(f"{'operation':>28} {'implementation':>14} {'size':>10} {'baseline ns':>12} "
+          f"{'current ns':>12} {'ratio':>7}")
+    for row in rows:
+        flag = '  REGRESSED' if row['regressed'] else ''
+        print(f"{row['operation']:>28} {row['implementation']:>14} {row['size']:>10} "
+              f"{row['baseline'] * 1e9:>12.1f} {row['current'] * 1e9:>12.1f} {row['ratio']:>7.2f}{flag}")
+    regressed = sum(row['regressed'] for row in rows)
+    print(f'{regressed} of {len(rows)} results slower than {threshold:.2f}x the baseline')
+
+# ----------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** k for k in range(2, 8)])
+    parser.add_argument('--implementations', nargs='+', default=list(IMPLEMENTATIONS),
+                        choices=list(IMPLEMENTATIONS))
+    parser.add_argument('--operations', nargs='+', help='case names to run; all by default')
+    parser.add_argument('--batch', type=int, default=1000, help='operations per timing for cheap cases')
+    parser.add_argument('--positional', type=int, default=20,
+                        help='operations per timing for O(n) positional cases')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of each case; the fastest is kept')
+    parser.add_argument('--seed', type=int, default=6030)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--load', help='read results from this JSON file instead of running')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON results to check this run against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio that counts as a regression')
+    parser.add_argument('--min-ns', type=float, default=0.0,
+                        help='ignore regressions of results faster than this in both runs')
+    args = parser.parse_args(argv)
+
+    if args.load:
+        with open(args.load) as f:
+            current = json.load(f)
+    else:
+        results = runSuite(args.sizes, args.implementations, args.batch, args.positional,
+                           args.repeat, args.seed, args.operations,
+                           log=lambda line: print(line, file=sys.stderr))
+        current = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                'sizes': args.sizes,
+                'batch': args.batch,
+                'positional': args.positional,
+                'repeat': args.repeat,
+                'seed': args.seed,
+            },
+            'results': results,
+        }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=1)
+
+    if not args.compare:
+        printResults(current['results'])
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    rows = compare(baseline, current, args.threshold, args.min_ns / 1e9)
+    printComparison(rows, args.threshold)
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    sys.exit(main())
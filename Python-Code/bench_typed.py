@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_typed.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import Callable
+import sys
+import time
+
+from LListCursor import LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def best(operation: Callable[[], object], repeats: int = 5) -> float:
+    """
+    runs operation repeats times
+    :param operation: callable to time
+    :param repeats: number of runs
+    :return: shortest time in seconds
+    """
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(size: int):
+    node = LListCursor(float(i) for i in range(size))
+    typed = LListCursor((float(i) for i in range(size)), dtype='float64')
+    print(f"{size} float64 items")
+    print(f"{'':>22} {'node':>12} {'typed':>12} {'ratio':>7}")
+    nodeBytes = node.memoryUsage()['totalBytes'] / size
+    typedBytes = typed.memoryUsage()['totalBytes'] / size
+    print(f"{'bytes per item':>22} {nodeBytes:>12.1f} {typedBytes:>12.1f} {nodeBytes / typedBytes:>7.2f}")
+    nodeTime = best(lambda: sum(node))
+    typedTime = best(typed.sum)
+    print(f"{'sum (ms)':>22} {nodeTime * 1000:>12.2f} {typedTime * 1000:>12.2f} {nodeTime / typedTime:>7.2f}")
+    nodeTime = best(lambda: LListCursor(x * 2.0 for x in node))
+    typedTime = best(lambda: typed.map(lambda a: a * 2.0))
+    print(f"{'map x * 2 (ms)':>22} {nodeTime * 1000:>12.2f} {typedTime * 1000:>12.2f} {nodeTime / typedTime:>7.2f}")
+    nodeTime = best(lambda: list(node))
+    typedTime = best(lambda: list(typed))
+    print(f"{'iterate (ms)':>22} {nodeTime * 1000:>12.2f} {typedTime * 1000:>12.2f} {nodeTime / typedTime:>7.2f}")
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
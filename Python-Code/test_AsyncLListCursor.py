@@ -0,0 +1,94 @@
+# ----------------------------------------------------------------------
+
+# test_AsyncLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+from LListCursor import LListCursor
+from AsyncLListCursor import AsyncLListCursor
+
+# ----------------------------------------------------------------------
+
+
+class AsyncLListTest(unittest.IsolatedAsyncioTestCase):
+
+    async def testRemoveWaitsForInsert(self):
+        items = AsyncLListCursor()
+        head = asyncio.create_task(items.removeItemAtHead())
+        tail = asyncio.create_task(items.removeItemAtTail())
+        await asyncio.sleep(0)
+        self.assertFalse(head.done())
+        await items.insertAtTail(1)
+        await items.insertAtTail(2)
+        self.assertEqual(sorted(await asyncio.gather(head, tail)), [1, 2])
+        self.assertTrue(items.empty())
+
+    async def testDirectListChangesWake(self):
+        items = AsyncLListCursor(LListCursor())
+        waiting = asyncio.create_task(items.removeItemAtHead())
+        await asyncio.sleep(0)
+        items.list.extend([1, 2, 3])
+        self.assertEqual(await waiting, 1)
+        self.assertEqual(len(items), 2)
+
+    async def testMaxlenBackpressure(self):
+        items = AsyncLListCursor(maxlen=2)
+        await items.insertAtTail(1)
+        await items.insertAtHead(0)
+        self.assertTrue(items.full())
+        blocked = asyncio.create_task(items.insertAtTail(2))
+        await asyncio.sleep(0)
+        self.assertFalse(blocked.done())
+        self.assertEqual(await items.removeItemAtHead(), 0)
+        await blocked
+        self.assertEqual(list(items.list), [1, 2])
+
+    async def testDrain(self):
+        items = AsyncLListCursor()
+        first = asyncio.create_task(items.drain(3))
+        second = asyncio.create_task(items.drain(3))
+        await asyncio.sleep(0)
+        items.list.extend(range(5))
+        self.assertEqual(await first, [0, 1, 2])
+        self.assertEqual(await second, [3, 4])
+        with self.assertRaises(ValueError):
+            await items.drain(0)
+
+    async def testCancelledWaiterPassesWakeup(self):
+        items = AsyncLListCursor()
+        cancelled = asyncio.create_task(items.removeItemAtHead())
+        other = asyncio.create_task(items.removeItemAtHead())
+        await asyncio.sleep(0)
+        await items.insertAtTail(1)
+        cancelled.cancel()
+        self.assertEqual(await other, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+
+    async def testRemoveAtCursorAndClose(self):
+        items = AsyncLListCursor(LListCursor(1, 2))
+        await items.insertAfterCursor(3)
+        self.assertEqual(await items.removeItemAtCursor(), 1)
+        self.assertEqual(list(items.list), [3, 2])
+        items.close()
+        self.assertEqual(items.list._observers, [])
+
+    def testBadMaxlen(self):
+        with self.assertRaises(ValueError):
+            AsyncLListCursor(maxlen=0)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
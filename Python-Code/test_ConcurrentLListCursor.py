@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------
+
+# test_ConcurrentLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import List, Any
+import random
+import threading
+import unittest
+
+from LListCursor import LListCursor
+from ConcurrentLListCursor import ConcurrentLListCursor
+
+# ----------------------------------------------------------------------
+
+
+class ConcurrentLListTest(unittest.TestCase):
+
+    def checkList(self, linked: ConcurrentLListCursor, lst: List, cursorValue: Any):
+        self.assertEqual(len(linked), len(lst))
+        self.assertEqual(list(linked), lst)
+        if len(lst) > 0:
+            self.assertEqual(linked.itemAtHead(), lst[0])
+            self.assertEqual(linked.itemAtTail(), lst[-1])
+            self.assertEqual(linked.itemAtCursor(), cursorValue)
+        else:
+            for method in (linked.itemAtHead, linked.itemAtCursor, linked.itemAtTail,
+                           linked.removeItemAtHead, linked.removeItemAtCursor, linked.removeItemAtTail):
+                with self.assertRaises(IndexError):
+                    method()
+
+    def testBackend(self):
+        self.assertIsInstance(LListCursor(1, 2, backend='concurrent'), ConcurrentLListCursor)
+
+    def testBasics(self):
+        items = ConcurrentLListCursor(1, 2, 3)
+        self.checkList(items, [1, 2, 3], 1)
+        items.insertAtHead(0)
+        self.checkList(items, [0, 1, 2, 3], 1)
+        self.assertEqual(items.removeItemAtHead(), 0)
+        self.assertEqual(items.removeItemAtHead(), 1)
+        self.checkList(items, [2, 3], 2)
+        self.assertTrue(items.cursorForward())
+        self.assertEqual(items.removeItemAtTail(), 3)
+        self.checkList(items, [2], 2)
+        self.assertEqual(items.removeItemAtCursor(), 2)
+        self.checkList(items, [], None)
+        items.insertAtTail(5)
+        self.checkList(items, [5], 5)
+        self.checkList(items + ConcurrentLListCursor(6), [5, 6], 5)
+
+    def testMatchesLListCursor(self):
+        # the same random single-threaded operations must give the same results
+        for readerWriter in (False, True):
+            rng = random.Random(9)
+            items = ConcurrentLListCursor(readerWriter=readerWriter)
+            expected = LListCursor()
+            methods = ['insertAtHead', 'insertAfterCursor', 'insertAtTail', 'removeItemAtHead',
+                       'removeItemAtCursor', 'removeItemAtTail', 'cursorForward', 'cursorBackward',
+                       'cursorToStart']
+            for step in range(1500):
+                name = rng.choice(methods)
+                args = (step,) if name.startswith('insert') else ()
+                try:
+                    result = getattr(expected, name)(*args)
+                except IndexError:
+                    with self.assertRaises(IndexError):
+                        getattr(items, name)(*args)
+                    continue
+                self.assertEqual(getattr(items, name)(*args), result)
+                self.checkList(items, list(expected), expected.itemAtCursor() if len(expected) else None)
+
+    def testProducersAndConsumers(self):
+        for readerWriter in (False, True):
+            items = ConcurrentLListCursor(readerWriter=readerWriter)
+            perProducer = 2000
+            producers = 4
+            consumed = []
+            consumedLock = threading.Lock()
+
+            def produce(base):
+                for i in range(perProducer):
+                    items.insertAtTail(base + i)
+
+            def consume():
+                mine = []
+                while len(mine) < perProducer:
+                    try:
+                        mine.append(items.removeItemAtHead())
+                    except IndexError:
+                        pass
+                with consumedLock:
+                    consumed.extend(mine)
+
+            def iterate():
+                for i in range(20):
+                    self.assertLessEqual(len(list(items)), producers * perProducer)
+
+            threads = [threading.Thread(target=produce, args=(p * perProducer,)) for p in range(producers)]
+            threads += [threading.Thread(target=consume) for p in range(producers)]
+            threads.append(threading.Thread(target=iterate))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(sorted(consumed), list(range(producers * perProducer)))
+            self.checkList(items, [], None)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
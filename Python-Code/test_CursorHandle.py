@@ -0,0 +1,123 @@
+# ----------------------------------------------------------------------
+
+# test_CursorHandle.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import unittest
+
+from LListCursor import LListCursor
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class CursorHandleTest(unittest.TestCase):
+
+    checkList = test_LListCursor.LListTest.checkList
+
+    def testIndependentPositions(self):
+        items = LListCursor(1, 2, 3, 4)
+        reader = items.newCursor()
+        writer = items.newCursor()
+        reader.cursorForward()
+        reader.cursorForward()
+        self.assertEqual(reader.itemAtCursor(), 3)
+        self.assertEqual(writer.itemAtCursor(), 1)
+        self.assertEqual(items.itemAtCursor(), 1)
+        self.assertTrue(reader.cursorBackward())
+        self.assertEqual(reader.itemAtCursor(), 2)
+
+    def testForwardBackwardEnds(self):
+        items = LListCursor(1, 2)
+        handle = items.newCursor()
+        self.assertFalse(handle.cursorBackward())
+        self.assertTrue(handle.cursorForward())
+        self.assertFalse(handle.cursorForward())
+        handle.cursorToStart()
+        self.assertEqual(handle.itemAtCursor(), 1)
+
+    def testInsertAfter(self):
+        items = LListCursor(1, 2, 3)
+        handle = items.newCursor()
+        handle.cursorForward()
+        handle.insertAfterCursor(9)
+        self.assertEqual(handle.itemAtCursor(), 2)
+        self.checkList(items, [1, 2, 9, 3], 1)
+
+    def testRemoveMovesOtherHandles(self):
+        items = LListCursor(1, 2, 3)
+        first = items.newCursor()
+        second = items.newCursor()
+        for handle in (first, second):
+            handle.cursorForward()
+        self.assertEqual(first.removeItemAtCursor(), 2)
+        self.assertEqual(first.itemAtCursor(), 3)
+        self.assertEqual(second.itemAtCursor(), 3)
+        self.assertEqual(second.removeItemAtCursor(), 3)
+        self.assertEqual(first.itemAtCursor(), 1)
+        self.checkList(items, [1], 1)
+
+    def testListRemovalsMoveHandles(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        head = items.newCursor()
+        tail = items.newCursor()
+        while tail.cursorForward():
+            pass
+        items.removeItemAtHead()
+        items.removeItemAtTail()
+        self.assertEqual(head.itemAtCursor(), 2)
+        self.assertEqual(tail.itemAtCursor(), 4)
+        items.cursorForward()
+        items.removeRangeFromCursor(2)
+        self.assertEqual(tail.itemAtCursor(), 2)
+        self.checkList(items, [2], 2)
+
+    def testHandleOnEmptyList(self):
+        items = LListCursor()
+        handle = items.newCursor()
+        with self.assertRaises(IndexError):
+            handle.itemAtCursor()
+        with self.assertRaises(IndexError):
+            handle.removeItemAtCursor()
+        self.assertFalse(handle.cursorForward())
+        handle.insertAfterCursor(1)
+        self.assertEqual(handle.itemAtCursor(), 1)
+        self.assertEqual(handle.removeItemAtCursor(), 1)
+        self.checkList(items, [], None)
+        items.insertAtTail(2)
+        self.assertEqual(handle.itemAtCursor(), 2)
+
+    def testSpliceEmptiesHandles(self):
+        items1 = LListCursor(1)
+        items2 = LListCursor(2, 3)
+        handle = items2.newCursor()
+        items1.splice(items2)
+        with self.assertRaises(IndexError):
+            handle.itemAtCursor()
+
+    def testClose(self):
+        items = LListCursor(1, 2)
+        handle = items.newCursor()
+        handle.close()
+        handle.close()
+        self.assertEqual(len(items._handles), 0)
+        with self.assertRaises(ValueError):
+            handle.itemAtCursor()
+        with self.assertRaises(ValueError):
+            handle.cursorForward()
+        items.removeItemAtHead()
+        self.checkList(items, [2], 2)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
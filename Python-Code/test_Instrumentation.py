@@ -0,0 +1,129 @@
+# ----------------------------------------------------------------------
+
+# test_Instrumentation.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import unittest
+
+from LListCursor import LListCursor
+from ListNode import NodePool
+from Instrumentation import Instrumentation
+
+# ----------------------------------------------------------------------
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def testCallsAndTime(self):
+        items = LListCursor(1, 2, 3)
+        stats = items.instrument()
+        items.insertAtTail(4)
+        items.insertAtTail(5)
+        items.removeItemAtHead()
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['insertAtTail']['calls'], 2)
+        self.assertEqual(snapshot['removeItemAtHead']['calls'], 1)
+        self.assertGreater(snapshot['insertAtTail']['seconds'], 0)
+        self.assertLessEqual(snapshot['insertAtTail']['maxSeconds'], snapshot['insertAtTail']['seconds'])
+        self.assertNotIn('itemAtHead', snapshot)
+        self.assertEqual(list(items), [2, 3, 4, 5])
+
+    def testNestedCallsCountedOnce(self):
+        # insertAfterCursor at the tail calls insertAtTail, which should not be counted
+        items = LListCursor(1)
+        stats = items.instrument()
+        items.insertAfterCursor(2)
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['insertAfterCursor']['calls'], 1)
+        self.assertNotIn('insertAtTail', snapshot)
+
+    def testHops(self):
+        items = LListCursor(range(100))
+        stats = items.instrument()
+        items.cursorTo(10)
+        items.cursorTo(-5)
+        items.cursorForward()
+        items.cursorIndex()
+        items.removeRangeFromCursor(3)
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['cursorTo']['hops'], 10 + 4)
+        self.assertEqual(snapshot['cursorForward']['hops'], 1)
+        self.assertEqual(snapshot['cursorIndex']['hops'], 96)
+        self.assertEqual(snapshot['removeRangeFromCursor']['hops'], 6)
+        self.assertEqual(snapshot.get('removeItemAtTail', {'hops': 0})['hops'], 0)
+
+    def testAllocations(self):
+        pool = NodePool()
+        items = LListCursor(1, 2, 3, pool=pool)
+        stats = items.instrument()
+        items.extend([4, 5])
+        items.removeItemAtTail()
+        items.insertAtTail(6)
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['extend']['allocations'], 2)
+        # the pool hands back the node removeItemAtTail released
+        self.assertEqual(snapshot['insertAtTail']['allocations'], 0)
+        self.assertEqual(snapshot['removeItemAtTail']['allocations'], 0)
+
+    def testSink(self):
+        events = []
+        items = LListCursor()
+        items.instrument(sink=events.append)
+        items.insertAtHead('a')
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['method'], 'insertAtHead')
+        self.assertEqual(events[0]['length'], 1)
+        self.assertEqual(events[0]['allocations'], 1)
+
+    def testResetAndShared(self):
+        shared = Instrumentation()
+        items1 = LListCursor(1)
+        items2 = LListCursor(2)
+        self.assertIs(items1.instrument(instrumentation=shared), shared)
+        items2.instrument(instrumentation=shared)
+        items1.itemAtHead()
+        items2.itemAtHead()
+        self.assertEqual(shared.reset()['itemAtHead']['calls'], 2)
+        self.assertEqual(shared.snapshot(), {})
+
+    def testUninstrument(self):
+        items = LListCursor(1, 2)
+        stats = items.instrument()
+        self.assertIs(items.instrument(), stats)
+        items.uninstrument()
+        # nothing is left on the instance, so the methods are the plain class ones
+        self.assertNotIn('insertAtTail', vars(items))
+        items.insertAtTail(3)
+        self.assertEqual(stats.snapshot(), {})
+        self.assertEqual(list(items), [1, 2, 3])
+
+    def testErrorsPassThrough(self):
+        items = LListCursor()
+        stats = items.instrument()
+        with self.assertRaises(IndexError):
+            items.removeItemAtHead()
+        items.insertAtHead(1)
+        self.assertEqual(stats.snapshot()['insertAtHead']['calls'], 1)
+
+    def testOtherBackend(self):
+        items = LListCursor(1, 2, 3, backend='unrolled', chunkSize=2)
+        stats = Instrumentation()
+        stats.attach(items)
+        items.removeManyAtHead(2)
+        self.assertEqual(stats.snapshot()['removeManyAtHead']['hops'], 2)
+        stats.detach(items)
+        self.assertEqual(vars(items).get('removeManyAtHead'), None)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
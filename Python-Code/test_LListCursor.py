@@ -5,9 +5,11 @@
 # ----------------------------------------------------------------------
 
 from typing import List, Any
+import random
 import unittest
 
 from LListCursor import LListCursor
+from ListNode import NodePool
 
 # ----------------------------------------------------------------------
 
@@ -20,6 +22,13 @@ class LListTest(unittest.TestCase):
         for x in linked:
             items.append(x)
         self.assertEqual(items, lst)
+        # walk the back-links from the tail to check they mirror the forward links
+        backItems = []
+        node = linked._tail
+        while node is not None:
+            backItems.append(node.item)
+            node = node.prev
+        self.assertEqual(backItems, lst[::-1])
         if len(lst) > 0:
             headItem = linked.itemAtHead()
             tailItem = linked.itemAtTail()
@@ -271,6 +280,215 @@ class LListTest(unittest.TestCase):
         self.assertEqual(items._cursor.item, 4)
         self.checkList(items, [1, 2, 3, 4, ], 4)
 
+    def testRemoveAtCursorTwoItems(self):
+        items = LListCursor(1, 2)
+        items.cursorForward()
+        items.removeItemAtCursor()
+        self.checkList(items, [1], 1)
+
+    def testInsertAfterCursor1(self):
+        items = LListCursor(1, 2, 3)
+        items.insertAfterCursor(9)
+        self.checkList(items, [1, 9, 2, 3], 1)
+
+    def testInsertAfterCursor2(self):
+        items = LListCursor(1, 2, 3)
+        items.cursorForward()
+        items.cursorForward()
+        items.insertAfterCursor(9)
+        self.checkList(items, [1, 2, 3, 9], 3)
+
+    def testCursorBackward1(self):
+        items = LListCursor(1, 2, 3)
+        self.assertEqual(items.cursorBackward(), False)
+        self.assertEqual(items._cursor.item, 1)
+
+    def testCursorBackward2(self):
+        items = LListCursor(1, 2, 3)
+        items.cursorForward()
+        items.cursorForward()
+        self.assertEqual(items.cursorBackward(), True)
+        self.assertEqual(items._cursor.item, 2)
+
+    def testCursorBackward3(self):
+        items = LListCursor()
+        self.assertEqual(items.cursorBackward(), False)
+
+    def testRemoveAtTailRepeated(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        for i in range(4):
+            items.cursorForward()
+        for i in range(5, 1, -1):
+            self.assertEqual(items.removeItemAtTail(), i)
+        self.checkList(items, [1], 1)
+
+    def testNodeHasNoDict(self):
+        items = LListCursor(1)
+        self.assertFalse(hasattr(items._head, '__dict__'))
+
+    def testInitFromGenerator(self):
+        items = LListCursor(x * x for x in range(4))
+        self.checkList(items, [0, 1, 4, 9], 0)
+
+    def testExtend1(self):
+        items = LListCursor()
+        items.extend([1, 2, 3])
+        self.checkList(items, [1, 2, 3], 1)
+
+    def testExtend2(self):
+        items = LListCursor(1, 2)
+        items.cursorForward()
+        items.extend(range(3, 6))
+        items.extend([])
+        self.checkList(items, [1, 2, 3, 4, 5], 2)
+
+    def testExtendLeft1(self):
+        items = LListCursor()
+        items.extendLeft([1, 2])
+        self.checkList(items, [1, 2], 1)
+
+    def testExtendLeft2(self):
+        items = LListCursor(3, 4)
+        items.extendLeft([1, 2])
+        self.checkList(items, [1, 2, 3, 4], 3)
+
+    def testInsertManyAfterCursor1(self):
+        items = LListCursor(1, 5)
+        items.insertManyAfterCursor([2, 3, 4])
+        self.checkList(items, [1, 2, 3, 4, 5], 1)
+
+    def testInsertManyAfterCursor2(self):
+        items = LListCursor(1)
+        items.insertManyAfterCursor([2, 3])
+        self.checkList(items, [1, 2, 3], 1)
+
+    def testInsertManyAfterCursor3(self):
+        items = LListCursor()
+        items.insertManyAfterCursor([2, 3])
+        self.checkList(items, [2, 3], 2)
+
+    def testRemoveManyAtHead1(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        for i in range(3):
+            items.cursorForward()
+        self.assertEqual(items.removeManyAtHead(2), [1, 2])
+        self.checkList(items, [3, 4, 5], 4)
+
+    def testRemoveManyAtHead2(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        items.cursorForward()
+        self.assertEqual(items.removeManyAtHead(3), [1, 2, 3])
+        self.checkList(items, [4, 5], 4)
+
+    def testRemoveManyAtHead3(self):
+        items = LListCursor(1, 2, 3)
+        self.assertEqual(items.removeManyAtHead(3), [1, 2, 3])
+        self.checkList(items, [], None)
+
+    def testRemoveManyAtHeadErrors(self):
+        items = LListCursor(1, 2, 3)
+        with self.assertRaises(IndexError):
+            items.removeManyAtHead(4)
+        with self.assertRaises(ValueError):
+            items.removeManyAtHead(-1)
+        self.checkList(items, [1, 2, 3], 1)
+
+    def testRemoveRangeFromCursor1(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        items.cursorForward()
+        self.assertEqual(items.removeRangeFromCursor(2), [2, 3])
+        self.checkList(items, [1, 4, 5], 4)
+
+    def testRemoveRangeFromCursor2(self):
+        items = LListCursor(1, 2, 3, 4, 5)
+        items.cursorForward()
+        items.cursorForward()
+        self.assertEqual(items.removeRangeFromCursor(3), [3, 4, 5])
+        self.checkList(items, [1, 2], 2)
+
+    def testRemoveRangeFromCursor3(self):
+        items = LListCursor(1, 2, 3)
+        self.assertEqual(items.removeRangeFromCursor(3), [1, 2, 3])
+        self.checkList(items, [], None)
+
+    def testRemoveRangeFromCursorErrors(self):
+        items = LListCursor(1, 2, 3)
+        items.cursorForward()
+        with self.assertRaises(IndexError):
+            items.removeRangeFromCursor(3)
+        with self.assertRaises(IndexError):
+            LListCursor().removeRangeFromCursor(1)
+        self.checkList(items, [1, 2, 3], 2)
+
+    def testSplice1(self):
+        items1 = LListCursor(1, 2)
+        items1.cursorForward()
+        items2 = LListCursor(3, 4)
+        items1.splice(items2)
+        self.checkList(items1, [1, 2, 3, 4], 2)
+        self.checkList(items2, [], None)
+
+    def testSplice2(self):
+        items1 = LListCursor()
+        items2 = LListCursor(3, 4)
+        items2.cursorForward()
+        items1.splice(items2)
+        self.checkList(items1, [3, 4], 3)
+        self.checkList(items2, [], None)
+
+    def testSplice3(self):
+        items1 = LListCursor(1)
+        items1.splice(LListCursor())
+        self.checkList(items1, [1], 1)
+        with self.assertRaises(ValueError):
+            items1.splice(items1)
+
+    def testInPlaceAdd1(self):
+        items1 = LListCursor(1, 2)
+        items2 = LListCursor(3)
+        alias = items1
+        items1 += items2
+        self.assertIs(items1, alias)
+        self.checkList(items1, [1, 2, 3], 1)
+        self.checkList(items2, [], None)
+
+    def testInPlaceAdd2(self):
+        items = LListCursor(1)
+        items += [2, 3]
+        self.checkList(items, [1, 2, 3], 1)
+
+    def testGetItem(self):
+        items = LListCursor(range(10))
+        self.assertEqual([items[i] for i in range(10)], list(range(10)))
+        self.assertEqual(items[-1], 9)
+        self.assertEqual(items[-10], 0)
+        with self.assertRaises(IndexError):
+            items[10]
+        with self.assertRaises(IndexError):
+            items[-11]
+        with self.assertRaises(IndexError):
+            LListCursor()[0]
+
+    def testSetItem(self):
+        items = LListCursor(1, 2, 3)
+        items[1] = 20
+        items[-1] = 30
+        self.checkList(items, [1, 20, 30], 1)
+        with self.assertRaises(IndexError):
+            items[3] = 0
+
+    def testCursorTo(self):
+        items = LListCursor(range(10))
+        items.cursorTo(7)
+        self.assertEqual(items.cursorIndex(), 7)
+        self.checkList(items, list(range(10)), 7)
+        items.cursorTo(-2)
+        self.checkList(items, list(range(10)), 8)
+        with self.assertRaises(IndexError):
+            items.cursorTo(10)
+        with self.assertRaises(IndexError):
+            LListCursor().cursorIndex()
+
     def testListPlusList1(self):
         items1 = LListCursor(1, 2, 3)
         items2 = LListCursor(4, 5, 6)
@@ -302,6 +520,241 @@ class LListTest(unittest.TestCase):
         self.checkList(list1, [1], 1)
 
 
+
+class LListNodeTest(unittest.TestCase):
+    """tests for features of the node backend that the other backends do not have"""
+
+    checkList = LListTest.checkList
+
+    def testMemoryUsage1(self):
+        usage = LListCursor().memoryUsage()
+        self.assertEqual(usage['nodes'], 0)
+        self.assertEqual(usage['nodeBytes'], 0)
+        self.assertEqual(usage['totalBytes'], usage['listBytes'])
+
+    def testMemoryUsage2(self):
+        usage = LListCursor(1, 2, 3).memoryUsage()
+        self.assertEqual(usage['nodes'], 3)
+        self.assertEqual(usage['nodeBytes'], 3 * usage['bytesPerNode'])
+        self.assertEqual(usage['totalBytes'], usage['nodeBytes'] + usage['listBytes'])
+
+    def checkIndexed(self, items: LListCursor):
+        # the index must agree with a walk of the list
+        lst = list(items)
+        self.assertEqual(len(items._index), len(lst))
+        for i in range(len(lst)):
+            self.assertEqual(items[i], lst[i])
+        if lst:
+            cursor = items.cursorIndex()
+            self.assertIs(items._nodeAt(cursor), items._cursor)
+
+    def testIndexedOperations(self):
+        items = LListCursor(range(20), indexed=True)
+        self.checkIndexed(items)
+        items.cursorTo(5)
+        items.insertAfterCursor('a')
+        items.insertAtHead('h')
+        items.insertAtTail('t')
+        items.insertManyAfterCursor(['b', 'c'])
+        self.assertEqual(items.cursorIndex(), 6)
+        self.checkIndexed(items)
+        items.removeItemAtCursor()
+        items.removeItemAtHead()
+        items.removeItemAtTail()
+        items.removeRangeFromCursor(3)
+        items.removeManyAtHead(2)
+        self.checkIndexed(items)
+        other = LListCursor(range(5), indexed=True)
+        items.splice(other)
+        self.checkIndexed(items)
+        self.checkIndexed(other)
+        self.checkIndexed(items + LListCursor(1, 2))
+
+    def testIndexedRandom(self):
+        rng = random.Random(7)
+        items = LListCursor(indexed=True)
+        for step in range(500):
+            op = rng.randrange(4)
+            if op == 0:
+                items.insertAfterCursor(step)
+            elif op == 1 and len(items):
+                items.removeItemAtCursor()
+            elif op == 2 and len(items):
+                items.cursorTo(rng.randrange(len(items)))
+            elif op == 3:
+                items.extendLeft([step, step])
+        self.checkIndexed(items)
+
+    def testPoolReusesNodes(self):
+        pool = NodePool(2)
+        items = LListCursor(1, 2, 3, pool=pool)
+        self.assertEqual(pool.misses, 3)
+        removed = items._head
+        items.removeItemAtHead()
+        items.removeItemAtTail()
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(removed.item, None)
+        items.insertAtTail(4)
+        items.insertAtHead(0)
+        self.assertEqual(pool.hits, 2)
+        self.checkList(items, [0, 2, 4], 2)
+
+    def testPoolCap(self):
+        pool = NodePool(1)
+        items = LListCursor(1, 2, 3, 4, pool=pool)
+        items.cursorForward()
+        items.removeItemAtCursor()
+        items.removeItemAtHead()
+        items.removeItemAtTail()
+        self.assertEqual(len(pool), 1)
+        self.checkList(items, [3], 3)
+
+    def testPoolSharedByAdd(self):
+        pool = NodePool()
+        items = LListCursor(1, 2, pool=pool) + LListCursor(3)
+        self.assertIs(items._pool, pool)
+        self.checkList(items, [1, 2, 3], 1)
+
+    def checkFind(self, valueIndexed: bool):
+        items = LListCursor(1, 'a', [2], 1, (3, 4), valueIndexed=valueIndexed)
+        self.assertIn(1, items)
+        self.assertIn([2], items)
+        self.assertIn((3, 4), items)
+        self.assertNotIn(5, items)
+        self.assertNotIn([5], items)
+        self.assertEqual(items.count(1), 2)
+        self.assertEqual(items.count([2]), 1)
+        self.assertEqual(items.count('b'), 0)
+        self.assertTrue(items.cursorToItem([2]))
+        self.assertEqual(items.cursorIndex(), 2)
+        self.assertFalse(items.cursorToItem('b'))
+        self.assertEqual(items.removeItem([2]), [2])
+        self.checkList(items, [1, 'a', 1, (3, 4)], 1)
+        self.assertEqual(items.cursorIndex(), 2)
+        self.assertEqual(items.removeItem(1), 1)
+        self.checkList(items, ['a', 1, (3, 4)], 1)
+        with self.assertRaises(ValueError):
+            items.removeItem(9)
+
+    def testFind(self):
+        self.checkFind(False)
+
+    def testFindValueIndexed(self):
+        self.checkFind(True)
+
+    def testValueIndexFollowsChanges(self):
+        items = LListCursor(range(10), valueIndexed=True)
+        items[3] = 'x'
+        self.assertNotIn(3, items)
+        self.assertEqual(items.count('x'), 1)
+        items.removeManyAtHead(2)
+        items.extendLeft([5, 5])
+        items.insertAfterCursor({'k': 1})
+        other = LListCursor(7, 20)
+        items.splice(other)
+        self.assertNotIn(0, items)
+        self.assertEqual(items.count(5), 3)
+        self.assertEqual(items.count(7), 2)
+        self.assertIn(20, items)
+        self.assertIn({'k': 1}, items)
+        self.assertEqual(len(items._values), len(items))
+        # the _cursor is on 2, so this removes 2, {'k': 1} and 'x'
+        items.removeRangeFromCursor(3)
+        self.assertNotIn({'k': 1}, items)
+        self.assertNotIn('x', items)
+        self.assertEqual(len(items._values), len(items))
+        self.assertIsNotNone((items + LListCursor(5))._values)
+
+    def testValueIndexRandom(self):
+        rng = random.Random(17)
+        items = LListCursor(valueIndexed=True)
+        mirror = []
+        for step in range(1000):
+            value = rng.randrange(20)
+            op = rng.randrange(4)
+            if op == 0:
+                items.insertAtTail(value)
+                mirror.append(value)
+            elif op == 1:
+                self.assertEqual(value in items, value in mirror)
+                self.assertEqual(items.count(value), mirror.count(value))
+            elif op == 2 and value in mirror:
+                # the index may remove a different duplicate than list.remove would
+                self.assertEqual(items.removeItem(value), value)
+                mirror.remove(value)
+                self.assertEqual(sorted(items), sorted(mirror))
+                mirror = list(items)
+            elif op == 3 and mirror:
+                position = rng.randrange(len(mirror))
+                items[position] = mirror[position] = value
+        self.assertEqual(sorted(items), sorted(mirror))
+        self.assertEqual(len(items._values), len(mirror))
+
+    def testSortRandom(self):
+        rng = random.Random(18)
+        for size in range(40):
+            lst = [rng.randrange(8) for i in range(size)]
+            for key in (None, lambda x: -x, lambda x: x % 3):
+                for reverse in (False, True):
+                    items = LListCursor(lst)
+                    items.sort(key=key, reverse=reverse)
+                    expected = sorted(lst, key=key, reverse=reverse)
+                    # the _cursor stays on the item that was first
+                    self.checkList(items, expected, lst[0] if lst else None)
+
+    def testSortStable(self):
+        pairs = [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd'), (1, 'e')]
+        for reverse in (False, True):
+            items = LListCursor(pairs)
+            items.sort(key=lambda pair: pair[0], reverse=reverse)
+            self.assertEqual(list(items), sorted(pairs, key=lambda pair: pair[0], reverse=reverse))
+
+    def testSortKeepsNodes(self):
+        items = LListCursor(5, 3, 9, 1, 7)
+        nodes = set()
+        node = items._head
+        while node is not None:
+            nodes.add(node)
+            node = node.link
+        items.cursorTo(2)
+        handle = items.newCursor()
+        handle.cursorForward()
+        items.sort()
+        self.checkList(items, [1, 3, 5, 7, 9], 9)
+        self.assertEqual(handle.itemAtCursor(), 3)
+        node = items._head
+        while node is not None:
+            self.assertIn(node, nodes)
+            node = node.link
+        handle.removeItemAtCursor()
+        self.checkList(items, [1, 5, 7, 9], 9)
+
+    def testSortIndexed(self):
+        items = LListCursor([4, 8, 1, 9, 2, 2, 7], indexed=True, valueIndexed=True)
+        items.cursorTo(3)
+        items.sort(reverse=True)
+        self.checkIndexed(items)
+        self.assertEqual(items.cursorIndex(), 0)
+        self.assertEqual(list(items), [9, 8, 7, 4, 2, 2, 1])
+        items.removeItem(2)
+        self.assertEqual(items.count(2), 1)
+        self.checkIndexed(items)
+
+    def testSortErrors(self):
+        # a key that fails leaves the list as it was
+        items = LListCursor(3, 'a', 1)
+        with self.assertRaises(TypeError):
+            items.sort(key=lambda x: x + 1)
+        self.checkList(items, [3, 'a', 1], 3)
+        # a failed comparison keeps every item, in some order
+        items = LListCursor([5, 4, 'x', 3, 2, 1, 0], indexed=True)
+        with self.assertRaises(TypeError):
+            items.sort()
+        self.assertEqual(sorted(map(str, items)), ['0', '1', '2', '3', '4', '5', 'x'])
+        self.checkList(items, list(items), 5)
+        self.checkIndexed(items)
+
+
 # ----------------------------------------------------------------------
 
 
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------------------
+
+# test_LListParallel.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+import operator
+import unittest
+
+from LListCursor import LListCursor
+import LListParallel
+
+# ----------------------------------------------------------------------
+
+
+def square(x):
+    return x * x
+
+
+def isOdd(x):
+    return x % 2 == 1
+
+
+class LListParallelTest(unittest.TestCase):
+
+    def testPmapProcesses(self):
+        items = LListCursor(range(100))
+        result = items.pmap(square, chunkSize=7, workers=2)
+        self.assertIsInstance(result, LListCursor)
+        self.assertEqual(list(result), [x * x for x in range(100)])
+        self.assertEqual(result.itemAtCursor(), 0)
+
+    def testPfilterThreads(self):
+        items = LListCursor(range(50))
+        result = items.pfilter(isOdd, chunkSize=4, executor='thread')
+        self.assertEqual(list(result), list(range(1, 50, 2)))
+
+    def testPreduce(self):
+        items = LListCursor(range(1, 101))
+        self.assertEqual(items.preduce(operator.add, 0, chunkSize=9, workers=2), 5050)
+        self.assertEqual(items.preduce(operator.add, 10, chunkSize=9, executor='thread'), 5060)
+        # order is kept for associative but not commutative functions
+        letters = LListCursor('abcdefg')
+        self.assertEqual(letters.preduce(operator.add, '>', chunkSize=2, executor='thread'), '>abcdefg')
+
+    def testEmptyList(self):
+        items = LListCursor()
+        self.assertEqual(list(items.pmap(square, executor='thread')), [])
+        self.assertEqual(items.preduce(operator.add, 3, executor='thread'), 3)
+
+    def testExistingExecutor(self):
+        with ThreadPoolExecutor(2) as pool:
+            result = LListParallel.pmap(LListCursor(1, 2, 3), square, executor=pool)
+        self.assertEqual(list(result), [1, 4, 9])
+
+    def testBadOptions(self):
+        with self.assertRaises(ValueError):
+            LListCursor(1).pmap(square, executor='gpu')
+        with self.assertRaises(ValueError):
+            LListCursor(1).pmap(square, chunkSize=0, executor='thread')
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+# ----------------------------------------------------------------------
+
+# test_LListSnapshot.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import gc
+import queue
+import random
+import threading
+import unittest
+
+from LListCursor import LListCursor
+from LListSnapshot import LListSnapshot
+from ListNode import NodePool
+
+# ----------------------------------------------------------------------
+
+
+class LListSnapshotTest(unittest.TestCase):
+
+    def testEmpty(self):
+        snapshot = LListCursor().snapshot()
+        self.assertIsInstance(snapshot, LListSnapshot)
+        self.assertEqual(len(snapshot), 0)
+        self.assertEqual(list(snapshot), [])
+
+    def testQueueChangesSaveNothing(self):
+        items = LListCursor(range(5))
+        snapshot = items.snapshot()
+        items.insertAtTail(5)
+        items.removeItemAtHead()
+        items.insertAtHead('h')
+        items.removeItemAtHead()
+        items.removeItemAtHead()
+        items.extend([6, 7])
+        self.assertEqual(list(snapshot), [0, 1, 2, 3, 4])
+        self.assertEqual(len(snapshot), 5)
+        self.assertEqual(snapshot.savedNodes(), 0)
+        self.assertEqual(list(items), [2, 3, 4, 5, 6, 7])
+
+    def testMiddleChanges(self):
+        items = LListCursor(range(10))
+        snapshot = items.snapshot()
+        items.cursorTo(3)
+        items.insertAfterCursor('a')
+        items.removeItemAtCursor()
+        items[5] = 'x'
+        items.removeItemAtTail()
+        items.insertAtTail('t')
+        items.cursorTo(1)
+        items.removeRangeFromCursor(2)
+        items.insertManyAfterCursor(['b', 'c'])
+        items.sort(key=str, reverse=True)
+        self.assertEqual(list(snapshot), list(range(10)))
+        self.assertEqual(list(items), sorted(['t', 'x', 'b', 'c', 0, 4, 6, 7, 8, 'a'], key=str, reverse=True))
+
+    def testRandomAgainstCopies(self):
+        rng = random.Random(19)
+        items = LListCursor(range(20))
+        snapshots = []
+        for step in range(400):
+            op = rng.randrange(8)
+            if op == 0:
+                items.insertAtTail(step)
+            elif op == 1 and items:
+                items.removeItemAtHead()
+            elif op == 2 and items:
+                items.removeItemAtCursor()
+            elif op == 3:
+                items.insertAfterCursor(step)
+            elif op == 4 and items:
+                items.cursorTo(rng.randrange(len(items)))
+            elif op == 5 and items:
+                items[rng.randrange(len(items))] = -step
+            elif op == 6 and items:
+                items.removeItemAtTail()
+            elif op == 7:
+                snapshots.append((items.snapshot(), list(items)))
+        for snapshot, expected in snapshots:
+            self.assertEqual(list(snapshot), expected)
+            self.assertEqual(len(snapshot), len(expected))
+
+    def testPoolWaitsForSnapshots(self):
+        pool = NodePool()
+        items = LListCursor(range(6), pool=pool)
+        snapshot = items.snapshot()
+        items.removeItemAtHead()
+        items.removeItemAtTail()
+        items.cursorTo(1)
+        items.removeItemAtCursor()
+        items.removeManyAtHead(1)
+        self.assertEqual(len(pool), 0)
+        items.insertAtTail(9)
+        self.assertEqual(list(snapshot), [0, 1, 2, 3, 4, 5])
+        snapshot.close()
+        items.removeItemAtHead()
+        self.assertEqual(len(pool), 1)
+
+    def testCloseAndCollect(self):
+        items = LListCursor(1, 2, 3)
+        with items.snapshot() as snapshot:
+            self.assertEqual(list(snapshot), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            len(snapshot)
+        with self.assertRaises(ValueError):
+            list(snapshot)
+        snapshot.close()
+        items.snapshot()
+        gc.collect()
+        self.assertEqual(len(items._snapshots), 0)
+
+    def testSpliceMovesSnapshots(self):
+        items = LListCursor(1, 2)
+        other = LListCursor(3, 4, 5)
+        snapshot = other.snapshot()
+        items.splice(other)
+        items.cursorTo(3)
+        items.removeItemAtCursor()
+        items[2] = 'x'
+        self.assertEqual(list(snapshot), [3, 4, 5])
+        self.assertEqual(list(items), [1, 2, 'x', 5])
+        snapshot.close()
+        self.assertEqual(len(items._snapshots), 0)
+
+    def testSortedSplice(self):
+        items = LListCursor(range(0, 20, 2), keepSorted=True)
+        other = LListCursor(7, 3, 1)
+        snapshot = other.snapshot()
+        items.splice(other)
+        self.assertEqual(list(snapshot), [7, 3, 1])
+
+    def testLazyReadsSource(self):
+        items = LListCursor(iter(range(4)), lazy=True)
+        snapshot = items.snapshot()
+        items.removeItemAtHead()
+        self.assertEqual(list(snapshot), [0, 1, 2, 3])
+
+    def testReaderThread(self):
+        # a queue where the writer adds and removes while readers walk snapshots;
+        # each snapshot must be a run of consecutive numbers
+        items = LListCursor(range(100))
+        snapshots = queue.Queue()
+        failures = []
+
+        def reader():
+            # None marks the end; dropping each snapshot here closes it on this thread
+            for snapshot in iter(snapshots.get, None):
+                values = list(snapshot)
+                if len(values) != len(snapshot) or values != list(range(values[0], values[0] + len(values))):
+                    failures.append(values[:5])
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for step in range(100, 5000):
+            items.insertAtTail(step)
+            items.removeItemAtHead()
+            if step % 3 == 0:
+                items.cursorTo(50)
+                items.insertAfterCursor(-1)
+                items.cursorForward()
+                items.removeItemAtCursor()
+            if step % 50 == 0:
+                snapshots.put(items.snapshot())
+        snapshots.put(None)
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(failures, [])
+        self.assertEqual(len(items._snapshotTails), 0)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# ----------------------------------------------------------------------
+
+# test_LazyConcat.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import unittest
+
+from LListCursor import LListCursor
+from LazyConcat import LazyConcat
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class LazyConcatTest(unittest.TestCase):
+
+    checkList = test_LListCursor.LListTest.checkList
+
+    def testAddIsLazy(self):
+        items1 = LListCursor(1, 2, lazyConcat=True)
+        items2 = LListCursor(3)
+        view = items1 + items2
+        self.assertIsInstance(view, LazyConcat)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(list(view), [1, 2, 3])
+        self.assertEqual(view.itemAtHead(), 1)
+        self.assertEqual(view.itemAtCursor(), 1)
+        self.assertEqual(view.itemAtTail(), 3)
+        self.assertIsNone(view._list)
+
+    def testChainedAddFlattens(self):
+        view = LListCursor(1, lazyConcat=True) + LListCursor() + LListCursor(2, 3)
+        self.assertEqual(len(view._segments), 3)
+        self.assertEqual(list(view), [1, 2, 3])
+        self.assertEqual(view.itemAtTail(), 3)
+
+    def testMutationMaterializes(self):
+        items1 = LListCursor(1, 2, lazyConcat=True)
+        items2 = LListCursor(3)
+        view = items1 + items2
+        view.cursorForward()
+        view.insertAfterCursor(9)
+        self.assertIsNotNone(view._list)
+        self.checkList(view, [1, 2, 9, 3], 2)
+        # operands are untouched
+        self.checkList(items1, [1, 2], 1)
+        self.checkList(items2, [3], 3)
+
+    def testSegmentChangedRaises(self):
+        items1 = LListCursor(1, 2, lazyConcat=True)
+        items2 = LListCursor(3)
+        view = items1 + items2
+        items2.insertAtTail(4)
+        with self.assertRaises(RuntimeError):
+            len(view)
+        with self.assertRaises(RuntimeError):
+            view.removeItemAtHead()
+
+    def testEmptyView(self):
+        view = LListCursor(lazyConcat=True) + LListCursor()
+        self.assertEqual(len(view), 0)
+        with self.assertRaises(IndexError):
+            view.itemAtHead()
+        with self.assertRaises(IndexError):
+            view.itemAtCursor()
+        with self.assertRaises(IndexError):
+            view.itemAtTail()
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+# ----------------------------------------------------------------------
+
+# test_LazyLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import itertools
+import unittest
+from unittest import mock
+
+from LListCursor import LListCursor
+from LazyLListCursor import LazyLListCursor
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+def lazyList(*args) -> LazyLListCursor:
+    """
+    builds a lazy list from the same arguments LListCursor takes, reading them through a
+    generator so nothing is known about the length up front
+    """
+    if len(args) == 1:
+        try:
+            items = iter(args[0])
+        except TypeError:
+            items = iter(args)
+    else:
+        items = iter(args)
+    return LListCursor((x for x in items), lazy=True)
+
+
+def materializedTest(name: str):
+    """
+    :return: the LListTest test called name, run on lists that have read their whole source;
+    for tests that look at _tail directly, which is only the last node read so far
+    """
+    def test(self):
+        materialized = lambda *args: lazyList(*args).materialize()
+        with mock.patch.object(test_LListCursor, 'LListCursor', materialized):
+            getattr(test_LListCursor.LListTest, name)(self)
+    return test
+
+
+class LazyLListTest(test_LListCursor.LListTest):
+    """runs every LListCursor test against lists read lazily from generators,
+    then checks how far each operation reads the source"""
+
+    def setUp(self):
+        patcher = mock.patch.object(test_LListCursor, 'LListCursor', lazyList)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    testTail2 = materializedTest('testTail2')
+    testTail3 = materializedTest('testTail3')
+    testTail4 = materializedTest('testTail4')
+    testInitInstanceVars3 = materializedTest('testInitInstanceVars3')
+    testInitInstanceVars4 = materializedTest('testInitInstanceVars4')
+    testInitInstanceVars5 = materializedTest('testInitInstanceVars5')
+
+    def counted(self, source):
+        # wraps source so self.read says how many items have been taken from it
+        self.read = 0
+        for x in source:
+            self.read += 1
+            yield x
+
+    def testBackendType(self):
+        self.assertIsInstance(LListCursor([1], lazy=True), LazyLListCursor)
+        with self.assertRaises(ValueError):
+            LListCursor([1], lazy=True, backend='unrolled')
+
+    def testCursorReadsOnDemand(self):
+        items = LListCursor(self.counted(itertools.count()), lazy=True)
+        self.assertEqual(self.read, 1)
+        self.assertTrue(items)
+        self.assertEqual(items.itemAtCursor(), 0)
+        for i in range(5):
+            self.assertTrue(items.cursorForward())
+        self.assertEqual(items.itemAtCursor(), 5)
+        self.assertEqual(self.read, 6)
+        self.assertEqual(items[9], 9)
+        self.assertEqual(self.read, 10)
+        self.assertFalse(items.isMaterialized())
+
+    def testBoundedConsumer(self):
+        # a consumer removing from the head holds one node however long the source is
+        items = LListCursor(itertools.count(), lazy=True)
+        for i in range(1000):
+            self.assertEqual(items.removeItemAtHead(), i)
+            self.assertLessEqual(items._length, 2)
+        self.assertEqual(items.removeManyAtHead(3), [1000, 1001, 1002])
+        self.assertEqual(items.itemAtHead(), 1003)
+
+    def testIterationStopsEarly(self):
+        items = LListCursor(self.counted(itertools.count()), lazy=True)
+        for x in items:
+            if x == 4:
+                break
+        self.assertEqual(self.read, 5)
+
+    def testInsertsBeforeUnread(self):
+        items = LListCursor(self.counted(range(3)), lazy=True)
+        items.insertAfterCursor('a')
+        items.insertAtHead('h')
+        items.insertManyAfterCursor(['b', 'c'])
+        self.assertEqual(self.read, 1)
+        self.checkList(items, ['h', 0, 'b', 'c', 'a', 1, 2], 0)
+
+    def testRemoveAtCursorReadsNext(self):
+        items = LListCursor(self.counted(range(5)), lazy=True)
+        self.assertEqual(items.removeItemAtCursor(), 0)
+        self.assertEqual(items.itemAtCursor(), 1)
+        self.assertEqual(items.removeRangeFromCursor(2), [1, 2])
+        self.assertEqual(items.itemAtCursor(), 3)
+        self.assertEqual(self.read, 4)
+        self.checkList(items, [3, 4], 3)
+
+    def testForcingOperations(self):
+        for force in (len, lambda x: x.itemAtTail(), lambda x: x.insertAtTail(9),
+                      lambda x: x.removeItemAtTail(), lambda x: x.extend([9]),
+                      lambda x: x[-1], lambda x: x.newCursor(), lambda x: x.sort()):
+            items = LListCursor(self.counted(range(5)), lazy=True)
+            force(items)
+            self.assertEqual(self.read, 5)
+            self.assertTrue(items.isMaterialized())
+
+    def testTailInsertAfterSource(self):
+        items = LListCursor(iter(range(3)), lazy=True)
+        items.insertAtTail(3)
+        items.extend([4])
+        self.checkList(items, [0, 1, 2, 3, 4], 0)
+
+    def testSpliceLazyIntoNode(self):
+        items = LListCursor(1)
+        items.splice(LListCursor(iter(range(2, 5)), lazy=True))
+        self.checkList(items, [1, 2, 3, 4], 1)
+
+    def testEmptySource(self):
+        items = LListCursor(iter(()), lazy=True)
+        self.assertFalse(items)
+        self.assertTrue(items.isMaterialized())
+        self.checkList(items, [], None)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
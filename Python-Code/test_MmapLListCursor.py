@@ -0,0 +1,134 @@
+# ----------------------------------------------------------------------
+
+# test_MmapLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import itertools
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from LListCursor import LListCursor
+from MmapLListCursor import MmapLListCursor
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class MmapLListTest(test_LListCursor.LListTest):
+    """runs every LListCursor test against the mmap backend, giving each list
+    its own file in a temporary directory"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.lists = []
+        self.addCleanup(self.closeLists)
+        patcher = mock.patch.object(test_LListCursor, 'LListCursor', self.makeList)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def newPath(self) -> str:
+        return os.path.join(self.directory, f'list{len(self.lists)}')
+
+    def makeList(self, *args) -> MmapLListCursor:
+        items = LListCursor(*args, backend='mmap', path=self.newPath())
+        self.lists.append(items)
+        return items
+
+    def closeLists(self):
+        for items in self.lists:
+            items.close()
+
+    def testBackendType(self):
+        self.assertIsInstance(self.makeList(1), MmapLListCursor)
+
+    def testReopen(self):
+        path = self.newPath()
+        with MmapLListCursor(range(5), path=path) as items:
+            items.cursorTo(2)
+            items.insertAtHead('h')
+            items[4] = 'x'
+        items = MmapLListCursor.open(path)
+        self.lists.append(items)
+        self.checkList(items, ['h', 0, 1, 2, 'x', 4], 2)
+        items.removeItemAtCursor()
+        items.insertAtTail({'a': 1})
+        self.checkList(items, ['h', 0, 1, 'x', 4, {'a': 1}], 'x')
+
+    def testOpenErrors(self):
+        path = self.newPath()
+        with open(path, 'wb') as f:
+            f.write(b'not a list' * 10)
+        with open(path + '.items', 'wb') as f:
+            f.write(b' ')
+        with self.assertRaises(ValueError):
+            MmapLListCursor.open(path)
+        with self.assertRaises(ValueError):
+            MmapLListCursor(1, path=path, mode='r+')
+        with self.assertRaises(ValueError):
+            MmapLListCursor(path=path, mode='a')
+
+    def testGrowAndReuse(self):
+        # more nodes than the initial capacity, and slots reused after removals
+        items = self.makeList(range(3000))
+        self.assertEqual(items.removeManyAtHead(1000), list(range(1000)))
+        used = items._used
+        items.extendLeft(range(1000))
+        self.assertEqual(items._used, used)
+        self.checkList(items, list(range(3000)), 1000)
+
+    def testCompact(self):
+        items = self.makeList('x' * 100 for i in range(200))
+        items.removeManyAtHead(150)
+        items.cursorTo(20)
+        size = items.memoryUsage()['fileBytes']
+        items.compact()
+        self.assertLess(items.memoryUsage()['fileBytes'], size)
+        self.checkList(items, ['x' * 100] * 50, 'x' * 100)
+        self.assertEqual(items.cursorIndex(), 20)
+
+    def testRandomOperations(self):
+        rng = random.Random(13)
+        items = self.makeList()
+        mirror = []
+        cursor = 0
+        for step in range(2000):
+            op = rng.randrange(6)
+            if op == 0:
+                items.insertAtHead(step)
+                mirror.insert(0, step)
+                cursor = cursor + 1 if len(mirror) > 1 else 0
+            elif op == 1:
+                items.insertAtTail(step)
+                mirror.append(step)
+            elif op == 2:
+                items.insertAfterCursor(step)
+                mirror.insert(cursor + 1 if len(mirror) else 0, step)
+            elif op == 3 and mirror:
+                self.assertEqual(items.removeItemAtCursor(), mirror.pop(cursor))
+                cursor = min(cursor, len(mirror) - 1) if mirror else 0
+            elif op == 4 and mirror:
+                items.cursorTo(rng.randrange(len(mirror)))
+                cursor = items.cursorIndex()
+            elif op == 5 and mirror:
+                self.assertEqual(items.removeItemAtHead(), mirror.pop(0))
+                cursor = max(cursor - 1, 0)
+        self.checkList(items, mirror, mirror[cursor] if mirror else None)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
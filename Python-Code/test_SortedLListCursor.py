@@ -0,0 +1,139 @@
+# ----------------------------------------------------------------------
+
+# test_SortedLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import bisect
+import random
+import unittest
+
+from LListCursor import LListCursor
+from SortedLListCursor import SortedLListCursor
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class SortedLListTest(unittest.TestCase):
+
+    checkList = test_LListCursor.LListTest.checkList
+    checkIndexed = test_LListCursor.LListNodeTest.checkIndexed
+
+    def testBackendType(self):
+        items = LListCursor(3, 1, 2, keepSorted=True)
+        self.assertIsInstance(items, SortedLListCursor)
+        self.assertIsNotNone(items._index)
+        self.checkList(items, [1, 2, 3], 1)
+        self.assertNotIsInstance(LListCursor(3, 1, keepSorted=False), SortedLListCursor)
+        with self.assertRaises(ValueError):
+            LListCursor(keepSorted=True, backend='unrolled')
+        with self.assertRaises(ValueError):
+            LListCursor([1], keepSorted=True, lazy=True)
+
+    def testInsertsGoInOrder(self):
+        items = LListCursor(keepSorted=True)
+        items.insertAtTail(5)
+        items.insertAtHead(9)
+        items.insertAfterCursor(1)
+        items.insertAtTail(5)
+        self.checkList(items, [1, 5, 5, 9], 5)
+        items.extend([0, 7])
+        items.extendLeft([10])
+        items.insertManyAfterCursor([6])
+        self.checkList(items, [0, 1, 5, 5, 6, 7, 9, 10], 5)
+        self.checkIndexed(items)
+
+    def testEqualItemsKeepInsertOrder(self):
+        items = LListCursor(key=lambda pair: pair[0], keepSorted=True)
+        for pair in [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')]:
+            items.insertAtHead(pair)
+        self.assertEqual(list(items), [(0, 'b'), (0, 'd'), (1, 'a'), (1, 'c')])
+
+    def testReverse(self):
+        items = LListCursor([3, 1, 2], keepSorted=True, reverse=True)
+        items.insertAtTail(0)
+        items.insertAtTail(4)
+        items.insertAtTail(2)
+        self.checkList(items, [4, 3, 2, 2, 1, 0], 3)
+
+    def testRandomAgainstBisect(self):
+        rng = random.Random(18)
+        items = LListCursor(keepSorted=True, key=lambda x: -x)
+        mirror = []
+        for step in range(600):
+            value = rng.randrange(50)
+            op = rng.randrange(4)
+            if op < 2:
+                items.insertAfterCursor(value)
+                bisect.insort(mirror, -value)
+            elif op == 2 and mirror:
+                self.assertEqual(value in items, -value in mirror)
+                if -value in mirror:
+                    items.removeItem(value)
+                    mirror.remove(-value)
+            elif op == 3 and mirror:
+                items.cursorTo(rng.randrange(len(mirror)))
+        self.assertEqual(list(items), [-x for x in mirror])
+        self.checkIndexed(items)
+
+    def testSplice(self):
+        # few items are linked in one at a time, reusing their nodes
+        items = LListCursor(range(0, 20, 2), keepSorted=True)
+        other = LListCursor(7, 3)
+        node = other._head
+        items.splice(other)
+        self.checkList(items, [0, 2, 3, 4, 6, 7, 8, 10, 12, 14, 16, 18], 0)
+        self.checkList(other, [], None)
+        self.assertIs(items._nodeAt(5), node)
+        self.checkIndexed(items)
+        # many items are added at the end and the whole list sorted
+        items += LListCursor(range(1, 40, 3))
+        self.assertEqual(list(items), sorted(list(range(0, 20, 2)) + [3, 7] + list(range(1, 40, 3))))
+        self.checkIndexed(items)
+
+    def testSpliceUnorderable(self):
+        items = LListCursor(range(10), keepSorted=True)
+        other = LListCursor(4, 'a', 5)
+        with self.assertRaises(TypeError):
+            items.splice(other)
+        self.assertEqual(list(items), [0, 1, 2, 3, 4, 4, 5, 6, 7, 8, 9])
+        self.checkList(other, ['a', 5], 'a')
+
+    def testSetItem(self):
+        items = LListCursor(1, 3, 5, keepSorted=True)
+        items[1] = 4
+        items[0] = 1
+        self.checkList(items, [1, 4, 5], 1)
+        with self.assertRaises(ValueError):
+            items[1] = 6
+        with self.assertRaises(ValueError):
+            items[-1] = 0
+        self.checkList(items, [1, 4, 5], 1)
+
+    def testSortChangesOrder(self):
+        items = LListCursor(1, 2, 3, keepSorted=True)
+        items.sort(reverse=True)
+        items.insertAtTail(2)
+        self.checkList(items, [3, 2, 2, 1], 1)
+
+    def testFindUsesOrder(self):
+        items = LListCursor([(2, 'b'), (1, 'a'), (2, 'c')], key=lambda pair: pair[0], keepSorted=True)
+        self.assertIn((2, 'c'), items)
+        self.assertNotIn((2, 'd'), items)
+        self.assertNotIn('x', items)
+        self.assertTrue(items.cursorToItem((2, 'c')))
+        self.assertEqual(items.cursorIndex(), 2)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# ----------------------------------------------------------------------
+
+# test_TypedLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+import functools
+import unittest
+from unittest import mock
+
+from LListCursor import LListCursor
+import TypedLListCursor as typed
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+@unittest.skipIf(typed.np is None, 'numpy is not installed')
+class TypedLListTest(test_LListCursor.LListTest):
+    """runs every LListCursor test against the typed backend with int64 items and
+    a small chunk size, then the typed-only operations"""
+
+    def setUp(self):
+        intList = functools.partial(LListCursor, dtype='int64', chunkSize=2)
+        patcher = mock.patch.object(test_LListCursor, 'LListCursor', intList)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testBackendType(self):
+        items = LListCursor(1.5, 2.5, dtype='float64')
+        self.assertIsInstance(items, typed.TypedLListCursor)
+        self.assertEqual(items.dtype, typed.np.dtype('float64'))
+        self.assertIsInstance(items.itemAtHead(), float)
+
+    def testAggregates(self):
+        items = LListCursor(range(1000), dtype='int64', chunkSize=64)
+        self.assertEqual(items.sum(), sum(range(1000)))
+        self.assertEqual(items.min(), 0)
+        self.assertEqual(items.max(), 999)
+        self.assertEqual(items.toArray().tolist(), list(range(1000)))
+        empty = LListCursor(dtype='float64')
+        self.assertEqual(empty.sum(), 0)
+        self.assertEqual(len(empty.toArray()), 0)
+        with self.assertRaises(ValueError):
+            empty.min()
+        with self.assertRaises(ValueError):
+            empty.max()
+
+    def testMap(self):
+        items = LListCursor(range(10), dtype='int64', chunkSize=4)
+        doubled = items.map(lambda a: a * 2)
+        self.checkList(doubled, [x * 2 for x in range(10)], 0)
+        halves = items.map(lambda a: a / 2)
+        self.assertEqual(halves.dtype, typed.np.dtype('float64'))
+        self.assertEqual(list(halves), [x / 2 for x in range(10)])
+
+    def testExtendFromArray(self):
+        items = LListCursor(dtype='float64', chunkSize=4)
+        items.extend(typed.np.arange(10, dtype='float64'))
+        self.checkList(items, [float(x) for x in range(10)], 0.0)
+
+    def testBadItem(self):
+        items = LListCursor(dtype='float64')
+        with self.assertRaises(ValueError):
+            items.insertAtTail('not a number')
+
+    def testSpliceOtherDtype(self):
+        items1 = LListCursor(1.5, dtype='float64', chunkSize=2)
+        items2 = LListCursor(2, 3, dtype='int64', chunkSize=2)
+        items1.splice(items2)
+        self.checkList(items1, [1.5, 2.0, 3.0], 1.5)
+        self.assertEqual(len(items2), 0)
+
+    def testMemoryUsage(self):
+        usage = LListCursor(range(10000), dtype='int64').memoryUsage()
+        self.assertLess(usage['bytesPerNode'], 16)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
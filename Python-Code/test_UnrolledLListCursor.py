@@ -0,0 +1,113 @@
+# ----------------------------------------------------------------------
+
+# test_UnrolledLListCursor.py
+# Ben Herdman
+# ----------------------------------------------------------------------
+
+from typing import List
+import functools
+import random
+import unittest
+from unittest import mock
+
+from LListCursor import LListCursor
+from UnrolledLListCursor import UnrolledLListCursor
+import test_LListCursor
+
+# ----------------------------------------------------------------------
+
+
+class UnrolledLListTest(test_LListCursor.LListTest):
+    """runs every LListCursor test against the unrolled backend, with a small
+    chunk size so that splits and merges happen in the short test lists"""
+
+    def setUp(self):
+        unrolled = functools.partial(LListCursor, backend='unrolled', chunkSize=2)
+        patcher = mock.patch.object(test_LListCursor, 'LListCursor', unrolled)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testBackendType(self):
+        items = test_LListCursor.LListCursor(1, 2, 3)
+        self.assertIsInstance(items, UnrolledLListCursor)
+
+    def testUnknownBackend(self):
+        with self.assertRaises(ValueError):
+            LListCursor(backend='nope')
+
+    def testMemoryUsageCountsChunks(self):
+        # nodes counts chunks here, so three items in chunks of two take two nodes
+        usage = UnrolledLListCursor(1, 2, 3, chunkSize=2).memoryUsage()
+        self.assertEqual(usage['nodes'], 2)
+        self.assertEqual(usage['totalBytes'], usage['nodeBytes'] + usage['listBytes'])
+
+    def testChunksSplit(self):
+        items = UnrolledLListCursor(1, 2, 3, 4, chunkSize=4)
+        items.cursorForward()
+        items.insertAfterCursor(9)
+        self.checkList(items, [1, 2, 9, 3, 4], 2)
+        self.assertEqual(items.memoryUsage()['nodes'], 2)
+
+    def testChunksMerge(self):
+        items = UnrolledLListCursor(range(8), chunkSize=4)
+        for i in range(5):
+            items.removeItemAtHead()
+        self.checkList(items, [5, 6, 7], 5)
+        self.assertEqual(items.memoryUsage()['nodes'], 1)
+
+    def checkChunks(self, items: UnrolledLListCursor):
+        chunk = items._first
+        while chunk is not None:
+            self.assertGreater(len(chunk.items), 0)
+            self.assertLessEqual(len(chunk.items), items._chunkSize)
+            chunk = chunk.link
+
+    def testRandomOperations(self):
+        # compare against a Python list with the cursor kept as an index
+        rng = random.Random(6030)
+        for chunkSize in (2, 3, 8):
+            items = UnrolledLListCursor(chunkSize=chunkSize)
+            lst: List[int] = []
+            cursor = 0
+            for step in range(2000):
+                op = rng.randrange(8)
+                if op == 0:
+                    items.insertAtHead(step)
+                    lst.insert(0, step)
+                    cursor = cursor + 1 if len(lst) > 1 else 0
+                elif op == 1:
+                    items.insertAtTail(step)
+                    lst.append(step)
+                elif op == 2:
+                    items.insertAfterCursor(step)
+                    lst.insert(cursor + 1 if len(lst) else 0, step)
+                elif op == 3 and lst:
+                    self.assertEqual(items.removeItemAtHead(), lst.pop(0))
+                    cursor = max(cursor - 1, 0)
+                elif op == 4 and lst:
+                    self.assertEqual(items.removeItemAtTail(), lst.pop())
+                    cursor = min(cursor, len(lst) - 1) if lst else 0
+                elif op == 5 and lst:
+                    self.assertEqual(items.removeItemAtCursor(), lst.pop(cursor))
+                    cursor = min(cursor, len(lst) - 1) if lst else 0
+                elif op == 6:
+                    if items.cursorForward():
+                        cursor += 1
+                elif op == 7:
+                    if items.cursorBackward():
+                        cursor -= 1
+                self.checkList(items, lst, lst[cursor] if lst else None)
+                self.checkChunks(items)
+
+
+# ----------------------------------------------------------------------
+
+
+def main():
+    unittest.main()
+
+# ----------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()